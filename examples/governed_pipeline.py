@@ -2,23 +2,15 @@
 
 from pathlib import Path
 from sys import path as sys_path
-from typing import cast, Sequence
+from typing import Sequence
 
 import yaml
 
 if __package__ in {None, ""}:
     sys_path.append(str(Path(__file__).resolve().parents[1]))
 
-from naestro import (
-    DebateOrchestrator,
-    Decision,
-    Governor,
-    Message,
-    Policy,
-    PolicyInput,
-    Role,
-    Roles,
-)
+from naestro import DebateOrchestrator, Governor, Message, Role, Roles
+from naestro.governance import load_policies
 from packs.trading import (
     DebateGate,
     ExecutionAgent,
@@ -36,14 +28,6 @@ def _load_trading_config() -> dict[str, object]:
     return yaml.safe_load(TRADING_CONFIG.read_text()) or {}
 
 
-def _load_policy_thresholds() -> tuple[float, float]:
-    data = yaml.safe_load(POLICY_CONFIG.read_text()) or {}
-    policies = data.get("policies", {})
-    max_drawdown = float(policies.get("max_drawdown", 0.0))
-    min_return = float(policies.get("min_return", 0.0))
-    return max_drawdown, min_return
-
-
 def build_gate() -> DebateGate:
     """Configure a deterministic gate with analyst and risk roles."""
 
@@ -68,35 +52,9 @@ def build_gate() -> DebateGate:
 
 
 def build_governor() -> Governor:
-    """Create a governor enforcing drawdown and return policies."""
-
-    max_drawdown_limit, min_return_threshold = _load_policy_thresholds()
-    governor = Governor()
-
-    def max_drawdown(payload: PolicyInput) -> Decision:
-        raw_drawdown = payload.metadata.get("max_drawdown", 0.0)
-        drawdown = float(cast(float, raw_drawdown))
-        passed = drawdown <= max_drawdown_limit
-        reason = (
-            "Within drawdown limit"
-            if passed
-            else f"Drawdown {drawdown:.2f} exceeds limit {max_drawdown_limit:.2f}"
-        )
-        return Decision(name="max_drawdown", passed=passed, reason=reason)
-
-    def min_return(payload: PolicyInput) -> Decision:
-        score = payload.score or 0.0
-        passed = score >= min_return_threshold
-        reason = (
-            "Return target met"
-            if passed
-            else f"Return {score:.2f} below target {min_return_threshold:.2f}"
-        )
-        return Decision(name="min_return", passed=passed, reason=reason)
+    """Create a governor enforcing the drawdown and return rules."""
 
-    governor.register(Policy("max_drawdown", "Limit drawdowns", max_drawdown))
-    governor.register(Policy("min_return", "Ensure positive returns", min_return))
-    return governor
+    return Governor(load_policies(POLICY_CONFIG))
 
 
 def main() -> None:
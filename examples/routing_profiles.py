@@ -5,43 +5,19 @@ from __future__ import annotations
 from pathlib import Path  # isort: skip
 import sys
 
-import yaml
-
 if __package__ in {None, ""}:
     sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from naestro import (
-    BaseTaskSpec,
-    ModelInfo,
-    ModelRouter,
-)
+from naestro import BaseTaskSpec, ModelRouter
+from naestro.routing import load_models
 
 CONFIG_PATH = Path(__file__).resolve().parents[1] / "configs" / "router_profiles.yaml"
 
 
-def _load_model_profiles() -> list[ModelInfo]:
-    """Load model definitions from the router profiles configuration."""
-
-    data = yaml.safe_load(CONFIG_PATH.read_text()) or {}
-    models = []
-    for entry in data.get("models", []):
-        models.append(
-            ModelInfo(
-                name=entry["name"],
-                provider=entry["provider"],
-                capabilities=frozenset(entry.get("capabilities", [])),
-                quality=float(entry["quality"]),
-                latency=float(entry["latency"]),
-                cost=float(entry["cost"]),
-            )
-        )
-    return models
-
-
 def build_router() -> ModelRouter:
     """Seed the router with a few sample models."""
 
-    return ModelRouter(_load_model_profiles())
+    return ModelRouter(load_models(CONFIG_PATH))
 
 
 def main() -> None:
@@ -0,0 +1,176 @@
+"""Periodic, atomically written checkpoints for router PPO training."""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, Mapping, Sequence
+
+import numpy as np
+
+from integrations.policy.rllm_ppo_adapter import RouterPPOAdapter
+
+logger = logging.getLogger(__name__)
+
+_CHECKPOINT_NAME = re.compile(r"^checkpoint-(\d+)\.npz$")
+
+
+def save_checkpoint(
+    directory: str | Path,
+    state: Mapping[str, np.ndarray],
+    *,
+    update: int,
+    keep_last_n: int | None = None,
+) -> Path:
+    """Write ``checkpoint-<update>.npz`` atomically and prune old checkpoints.
+
+    The archive is written to a temporary file in ``directory``, flushed to
+    disk and moved into place with :func:`os.replace`; the directory is then
+    fsynced so the rename itself survives a crash. A crash mid-write never
+    leaves a truncated checkpoint behind. Only the newest
+    ``keep_last_n`` checkpoints are kept when it is set.
+    """
+
+    target_dir = Path(directory)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    target = target_dir / f"checkpoint-{update:06d}.npz"
+    descriptor, temp_name = tempfile.mkstemp(prefix=".checkpoint-", suffix=".tmp", dir=target_dir)
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            np.savez(handle, **state)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_name, target)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    _fsync_directory(target_dir)
+
+    if keep_last_n is not None and keep_last_n > 0:
+        for stale in list_checkpoints(target_dir)[:-keep_last_n]:
+            stale.unlink(missing_ok=True)
+    return target
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush the rename of a checkpoint into ``directory`` to disk."""
+
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:  # pragma: no cover - platforms without directory handles
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:  # pragma: no cover - e.g. Windows cannot fsync directories
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def list_checkpoints(directory: str | Path) -> list[Path]:
+    """Return checkpoints in ``directory`` ordered from oldest to newest."""
+
+    source = Path(directory)
+    if not source.is_dir():
+        return []
+    found = []
+    for path in source.iterdir():
+        match = _CHECKPOINT_NAME.match(path.name)
+        if match:
+            found.append((int(match.group(1)), path))
+    return [path for _, path in sorted(found)]
+
+
+def latest_checkpoint(directory: str | Path) -> Path | None:
+    checkpoints = list_checkpoints(directory)
+    return checkpoints[-1] if checkpoints else None
+
+
+def load_checkpoint(path: str | Path) -> Dict[str, np.ndarray]:
+    with np.load(Path(path), allow_pickle=False) as archive:
+        return {key: archive[key] for key in archive.files}
+
+
+class PeriodicCheckpointer:
+    """``should_stop`` hook for :meth:`RouterPPOAdapter.train` that checkpoints.
+
+    A checkpoint is written every ``every_updates`` updates (counted from the
+    start of training, not of this process). ``history`` is the history
+    restored from an earlier checkpoint, so saved checkpoints always carry the
+    full run.
+    """
+
+    def __init__(
+        self,
+        adapter: RouterPPOAdapter,
+        directory: str | Path,
+        *,
+        every_updates: int = 1,
+        keep_last_n: int | None = 5,
+        history: Sequence[Mapping[str, float]] = (),
+    ) -> None:
+        if every_updates <= 0:
+            raise ValueError("every_updates must be positive")
+        self.adapter = adapter
+        self.directory = Path(directory)
+        self.every_updates = every_updates
+        self.keep_last_n = keep_last_n
+        self._restored = len(history)
+        self._history = [dict(entry) for entry in history]
+        self.last_saved: int | None = None
+
+    @classmethod
+    def from_steps(
+        cls,
+        adapter: RouterPPOAdapter,
+        directory: str | Path,
+        *,
+        frequency_steps: int,
+        keep_last_n: int | None = 5,
+        history: Sequence[Mapping[str, float]] = (),
+    ) -> "PeriodicCheckpointer":
+        """Checkpoint roughly every ``frequency_steps`` environment transitions."""
+
+        every = max(1, math.ceil(frequency_steps / adapter.steps_per_update))
+        return cls(adapter, directory, every_updates=every, keep_last_n=keep_last_n, history=history)
+
+    def __call__(self, history: Sequence[Mapping[str, float]]) -> bool:
+        # Only the entries added since the last call are copied, so a run of
+        # n updates costs O(n) here rather than O(n^2).
+        seen = len(self._history) - self._restored
+        if len(history) < seen:  # a new training call started a fresh history
+            del self._history[self._restored :]
+            seen = 0
+        self._history.extend(dict(entry) for entry in history[seen:])
+        if len(self._history) % self.every_updates == 0:
+            self.save(self._history)
+        return False
+
+    def save(self, history: Sequence[Mapping[str, float]]) -> Path | None:
+        """Write a checkpoint for ``history`` unless it was already saved."""
+
+        update = len(history)
+        if update == self.last_saved:
+            return None
+        path = save_checkpoint(
+            self.directory,
+            self.adapter.checkpoint_state(history),
+            update=update,
+            keep_last_n=self.keep_last_n,
+        )
+        self.last_saved = update
+        logger.info("Checkpoint for update %s written to %s", update, path)
+        return path
+
+
+__all__ = [
+    "PeriodicCheckpointer",
+    "latest_checkpoint",
+    "list_checkpoints",
+    "load_checkpoint",
+    "save_checkpoint",
+]
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import json
 import logging
 from collections import defaultdict
 from dataclasses import dataclass, fields
-from typing import Any, Dict, Iterable, Mapping, Sequence
+from typing import Any, Callable, Dict, Iterable, Mapping, Sequence
 
 import numpy as np
 
@@ -16,6 +17,16 @@ logger = logging.getLogger(__name__)
 _EPS = 1e-8
 
 
+def _rng_state(rng: np.random.Generator) -> np.ndarray:
+    """Encode a generator's bit-generator state as a JSON string array."""
+
+    return np.array(json.dumps(rng.bit_generator.state))
+
+
+def _set_rng_state(rng: np.random.Generator, state: np.ndarray | str) -> None:
+    rng.bit_generator.state = json.loads(str(state))
+
+
 @dataclass(slots=True)
 class PPOParams:
     """Hyper-parameters controlling the PPO update."""
@@ -36,7 +47,7 @@ class PPOParams:
         data = data or {}
         kwargs: Dict[str, Any] = {}
         for field in fields(cls):
-            kwargs[field.name] = data.get(field.name, getattr(cls, field.name))
+            kwargs[field.name] = data.get(field.name, field.default)
         params = cls(**kwargs)
         params.validate()
         return params
@@ -77,7 +88,7 @@ class RewardWeights:
         data = data or {}
         kwargs: Dict[str, Any] = {}
         for field in fields(cls):
-            kwargs[field.name] = float(data.get(field.name, getattr(cls, field.name)))
+            kwargs[field.name] = float(data.get(field.name, field.default))
         return cls(**kwargs)
 
 
@@ -185,6 +196,170 @@ class RouterEnv:
             self._steps = 0
         return self._state.copy(), float(reward), bool(done), info
 
+    def observe(self) -> np.ndarray:
+        """Return the current observation without advancing the environment."""
+
+        return self._state.copy()
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+        return {
+            "state": self._state.copy(),
+            "steps": np.array(self._steps),
+            "rng": _rng_state(self._rng),
+        }
+
+    def load_state_dict(self, state: Mapping[str, np.ndarray]) -> None:
+        self._state = np.array(state["state"], dtype=np.float32).reshape(self.observation_dim)
+        self._steps = int(state["steps"])
+        _set_rng_state(self._rng, state["rng"])
+
+
+class VectorRouterEnv:
+    """Batch of ``num_envs`` :class:`RouterEnv` instances stepped with NumPy.
+
+    Dynamics and rewards match :class:`RouterEnv` element-wise, but every
+    quantity is an array over environments and the noise for all environments
+    is drawn in one call per term. Environments that finish an episode are
+    reset automatically; ``step`` returns the first observation of the new
+    episode for them and the terminal one under ``info["final_observation"]``.
+    """
+
+    _RESET_LOW = np.array([0.3, 0.2, 0.1, 0.1])
+    _RESET_HIGH = np.array([0.9, 0.6, 0.9, 0.7])
+
+    def __init__(
+        self,
+        num_envs: int,
+        reward_weights: RewardWeights | None = None,
+        *,
+        episode_length: int = 64,
+        seed: int | None = None,
+    ) -> None:
+        self.num_envs = int(num_envs)
+        if self.num_envs <= 0:
+            raise ValueError("num_envs must be positive")
+        self.reward_weights = reward_weights or RewardWeights()
+        self.episode_length = int(episode_length)
+        if self.episode_length <= 0:
+            raise ValueError("episode_length must be positive")
+        self._rng = np.random.default_rng(seed)
+        self._modes: Sequence[CollaborationMode] = list(CollaborationMode)
+        self.action_dim = len(self._modes)
+        self.observation_dim = 4
+        self._state = np.zeros((self.num_envs, self.observation_dim), dtype=np.float32)
+        self._steps = np.zeros(self.num_envs, dtype=np.int64)
+
+    def _initial_states(self, count: int) -> np.ndarray:
+        return self._rng.uniform(
+            low=self._RESET_LOW, high=self._RESET_HIGH, size=(count, self.observation_dim)
+        ).astype(np.float32)
+
+    def reset(self) -> np.ndarray:
+        """Reset every environment and return the ``(num_envs, 4)`` observations."""
+
+        self._steps[:] = 0
+        self._state = self._initial_states(self.num_envs)
+        return self._state.copy()
+
+    def step(
+        self, actions: np.ndarray | Sequence[int]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+        """Advance all environments by one step with one action each."""
+
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.shape != (self.num_envs,):
+            raise ValueError(f"actions must have shape ({self.num_envs},)")
+        if np.any((actions < 0) | (actions >= self.action_dim)):
+            raise ValueError(f"actions must be in [0, {self.action_dim})")
+
+        n = self.num_envs
+        rng = self._rng
+        traffic_load, latency, collaboration_pressure, backlog = self._state.astype(float).T
+        if self.action_dim <= 1:
+            collaboration_level = np.zeros(n)
+        else:
+            collaboration_level = actions / (self.action_dim - 1)
+
+        throughput = (1.15 - 0.25 * collaboration_level) * (1.0 - 0.4 * backlog)
+        throughput *= 1.0 - 0.35 * latency
+        throughput = np.maximum(0.0, throughput + rng.normal(0.0, 0.02, n))
+
+        reliability = 0.55 + 0.3 * collaboration_level - 0.45 * latency
+        reliability += rng.normal(0.0, 0.05, n)
+        reliability = np.clip(reliability, 0.0, 1.0)
+
+        latency_penalty = latency + 0.25 * collaboration_level + 0.05 * backlog
+        latency_penalty += np.abs(rng.normal(0.0, 0.03, n))
+
+        collaboration_cost = collaboration_level * (0.35 + 0.4 * collaboration_pressure)
+
+        violation_penalty = np.maximum(0.0, 0.3 - reliability)
+
+        metrics = {
+            "throughput": throughput,
+            "reliability": reliability,
+            "latency": latency_penalty,
+            "collaboration_cost": collaboration_cost,
+            "violation_penalty": violation_penalty,
+        }
+        rewards = compute_rewards(metrics, self.reward_weights)
+
+        traffic_load = np.clip(
+            0.55 * traffic_load + 0.35 * collaboration_pressure + 0.1 * rng.random(n), 0.0, 1.0
+        )
+        latency = np.clip(
+            0.6 * latency + 0.25 * backlog + 0.2 * collaboration_level + rng.normal(0.0, 0.02, n),
+            0.0,
+            1.2,
+        )
+        collaboration_pressure = np.clip(
+            0.4 * collaboration_pressure + 0.4 * rng.random(n) + 0.2 * collaboration_level,
+            0.0,
+            1.0,
+        )
+        backlog = np.clip(
+            0.5 * backlog + 0.3 * traffic_load + 0.2 * (1.0 - throughput) + 0.1 * rng.random(n),
+            0.0,
+            1.0,
+        )
+
+        self._state = np.stack(
+            [traffic_load, latency, collaboration_pressure, backlog], axis=1
+        ).astype(np.float32)
+        self._steps += 1
+        dones = self._steps >= self.episode_length
+
+        info: Dict[str, Any] = {
+            "metrics": metrics,
+            "actions": actions,
+            "step": self._steps.copy(),
+        }
+        if dones.any():
+            info["final_observation"] = self._state.copy()
+            self._state[dones] = self._initial_states(int(dones.sum()))
+            self._steps[dones] = 0
+        return self._state.copy(), rewards, dones, info
+
+    def observe(self) -> np.ndarray:
+        """Return the current ``(num_envs, 4)`` observations without stepping."""
+
+        return self._state.copy()
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+        return {
+            "state": self._state.copy(),
+            "steps": self._steps.copy(),
+            "rng": _rng_state(self._rng),
+        }
+
+    def load_state_dict(self, state: Mapping[str, np.ndarray]) -> None:
+        observations = np.array(state["state"], dtype=np.float32)
+        if observations.shape != (self.num_envs, self.observation_dim):
+            raise ValueError(f"state must have shape ({self.num_envs}, {self.observation_dim})")
+        self._state = observations
+        self._steps = np.array(state["steps"], dtype=np.int64).reshape(self.num_envs)
+        _set_rng_state(self._rng, state["rng"])
+
 
 def compute_reward(metrics: Mapping[str, float], weights: RewardWeights) -> float:
     """Combine environment metrics into a scalar reward."""
@@ -204,6 +379,21 @@ def compute_reward(metrics: Mapping[str, float], weights: RewardWeights) -> floa
     return float(reward)
 
 
+def compute_rewards(metrics: Mapping[str, np.ndarray], weights: RewardWeights) -> np.ndarray:
+    """Vectorised :func:`compute_reward` over arrays of per-environment metrics."""
+
+    violation = metrics.get("violation_penalty", metrics.get("violation", 0.0))
+    reward = (
+        weights.throughput * np.asarray(metrics.get("throughput", 0.0), dtype=np.float64)
+        + weights.reliability * np.asarray(metrics.get("reliability", 0.0), dtype=np.float64)
+        - weights.latency * np.asarray(metrics.get("latency", 0.0), dtype=np.float64)
+        - weights.collaboration_cost
+        * np.asarray(metrics.get("collaboration_cost", 0.0), dtype=np.float64)
+        - weights.violation * np.asarray(violation, dtype=np.float64)
+    )
+    return reward
+
+
 class SimpleCategoricalPolicy:
     """Linear policy/value heads with categorical action sampling."""
 
@@ -242,6 +432,20 @@ class SimpleCategoricalPolicy:
         value = self.value(obs)
         return action, log_prob, value
 
+    def values(self, obs: np.ndarray) -> np.ndarray:
+        return obs @ self.value_w + self.value_b
+
+    def act_batch(self, obs: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Sample one action per row of ``obs`` with a single inverse-CDF draw."""
+
+        probs = self._softmax(self.policy_logits(obs))
+        cdf = np.cumsum(probs, axis=1)
+        draws = self._rng.random((obs.shape[0], 1))
+        actions = np.minimum((cdf < draws).sum(axis=1), self.action_dim - 1)
+        selected = probs[np.arange(obs.shape[0]), actions]
+        log_probs = np.log(np.clip(selected, _EPS, None))
+        return actions, log_probs, self.values(obs)
+
     def evaluate(self, obs: np.ndarray, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         logits = self.policy_logits(obs)
         probs = self._softmax(logits)
@@ -256,14 +460,15 @@ class SimpleCategoricalPolicy:
             "policy_w": self.policy_w.copy(),
             "policy_b": self.policy_b.copy(),
             "value_w": self.value_w.copy(),
-            "value_b": np.array([self.value_b], dtype=np.float32),
+            # value_b is a Python float; keep all of it so resumed runs match.
+            "value_b": np.array([self.value_b], dtype=np.float64),
         }
 
     def load_state_dict(self, state: Mapping[str, np.ndarray]) -> None:
         self.policy_w = np.array(state["policy_w"], dtype=np.float32)
         self.policy_b = np.array(state["policy_b"], dtype=np.float32)
         self.value_w = np.array(state["value_w"], dtype=np.float32)
-        self.value_b = float(np.array(state["value_b"], dtype=np.float32).item())
+        self.value_b = float(np.asarray(state["value_b"]).item())
 
     def update(
         self,
@@ -303,7 +508,18 @@ class SimpleCategoricalPolicy:
                 agg[key] = float(np.mean([m[key] for m in metrics]))
         return agg
 
-    def _update_minibatch(
+    @staticmethod
+    def _entropy_grad_logits(probs: np.ndarray, log_probs: np.ndarray) -> np.ndarray:
+        """Per-sample gradient of the softmax entropy with respect to the logits.
+
+        Closed form of ``-(diag(p) - p p^T) @ (log p + 1)`` evaluated for every
+        row at once: ``-p * (log p + 1) + p * sum(p * (log p + 1))``.
+        """
+
+        weighted = probs * (log_probs + 1.0)
+        return probs * np.einsum("ij->i", weighted)[:, None] - weighted
+
+    def _loss_and_gradients(
         self,
         obs: np.ndarray,
         actions: np.ndarray,
@@ -311,7 +527,14 @@ class SimpleCategoricalPolicy:
         returns: np.ndarray,
         advantages: np.ndarray,
         params: PPOParams,
-    ) -> Dict[str, float]:
+    ) -> tuple[Dict[str, float], tuple[np.ndarray, np.ndarray, np.ndarray, float]]:
+        """Return minibatch metrics and gradients of the combined PPO loss.
+
+        The loss is ``policy_loss + value_loss_coef * value_loss -
+        entropy_coef * entropy``; gradients are ordered ``(policy_w, policy_b,
+        value_w, value_b)``.
+        """
+
         logits = self.policy_logits(obs)
         probs = self._softmax(logits)
         log_probs = np.log(np.clip(probs, _EPS, None))
@@ -345,12 +568,7 @@ class SimpleCategoricalPolicy:
         grad_policy_logits = -grad_objective / obs.shape[0]
 
         # Entropy gradient contribution
-        grad_entropy = np.zeros_like(probs)
-        for i in range(obs.shape[0]):
-            p = probs[i]
-            log_p = log_probs[i]
-            jacobian = np.diag(p) - np.outer(p, p)
-            grad_entropy[i] = -jacobian @ (log_p + 1.0)
+        grad_entropy = self._entropy_grad_logits(probs, log_probs)
         grad_entropy = -params.entropy_coef * grad_entropy / obs.shape[0]
 
         grad_logits_total = grad_policy_logits + grad_entropy
@@ -359,7 +577,30 @@ class SimpleCategoricalPolicy:
 
         grad_values = params.value_loss_coef * (values - returns) / obs.shape[0]
         grad_value_w = obs.T @ grad_values[:, None]
-        grad_value_b = grad_values.sum()
+        grad_value_b = float(grad_values.sum())
+
+        metrics = {
+            "policy_loss": float(policy_loss),
+            "value_loss": float(value_loss),
+            "entropy": float(entropy),
+            "approx_kl": approx_kl,
+            "clip_frac": clip_frac,
+        }
+        return metrics, (grad_policy_w, grad_policy_b, grad_value_w, grad_value_b)
+
+    def _update_minibatch(
+        self,
+        obs: np.ndarray,
+        actions: np.ndarray,
+        old_log_probs: np.ndarray,
+        returns: np.ndarray,
+        advantages: np.ndarray,
+        params: PPOParams,
+    ) -> Dict[str, float]:
+        metrics, gradients = self._loss_and_gradients(
+            obs, actions, old_log_probs, returns, advantages, params
+        )
+        grad_policy_w, grad_policy_b, grad_value_w, grad_value_b = gradients
 
         total_norm = float(
             np.sqrt(
@@ -381,35 +622,48 @@ class SimpleCategoricalPolicy:
         self.value_w -= params.learning_rate * grad_value_w.flatten()
         self.value_b -= params.learning_rate * grad_value_b
 
-        return {
-            "policy_loss": float(policy_loss),
-            "value_loss": float(value_loss),
-            "entropy": float(entropy),
-            "approx_kl": approx_kl,
-            "clip_frac": clip_frac,
-        }
+        return metrics
 
 
 def _compute_gae(
     rewards: np.ndarray,
     values: np.ndarray,
     dones: np.ndarray,
-    last_value: float,
+    last_value: float | np.ndarray,
     gamma: float,
     gae_lambda: float,
 ) -> tuple[np.ndarray, np.ndarray]:
+    """Generalised advantage estimates for ``(T,)`` or ``(T, N)`` rollouts.
+
+    Solves the reverse recurrence ``A[t] = delta[t] + c[t] * A[t + 1]`` with
+    ``c[t] = gamma * gae_lambda * (1 - done)`` as a log-step scan: after the
+    pass with offset ``s`` each entry holds the discounted sum of the next
+    ``2 * s`` deltas and the product of their decay factors, so ``ceil(log2
+    T)`` array operations replace the per-step Python loop. ``dones[t]`` marks
+    that transition ``t`` ended its episode, so step ``t`` bootstraps through
+    ``1 - dones[t]``.
+    """
+
+    steps = rewards.shape[0]
     advantages = np.zeros_like(rewards)
-    lastgaelam = 0.0
-    for t in reversed(range(rewards.shape[0])):
-        if t == rewards.shape[0] - 1:
-            next_values = last_value
-            next_non_terminal = 1.0 - dones[t]
-        else:
-            next_values = values[t + 1]
-            next_non_terminal = 1.0 - dones[t + 1]
-        delta = rewards[t] + gamma * next_values * next_non_terminal - values[t]
-        lastgaelam = delta + gamma * gae_lambda * next_non_terminal * lastgaelam
-        advantages[t] = lastgaelam
+    if steps == 0:
+        return advantages, advantages + values
+
+    value = np.asarray(values, dtype=np.float64)
+    next_non_terminal = 1.0 - np.asarray(dones, dtype=np.float64)
+    next_value = np.empty_like(value)
+    next_value[:-1] = value[1:]
+    next_value[-1] = last_value
+
+    scan = rewards + gamma * next_value * next_non_terminal - value
+    decay = gamma * gae_lambda * next_non_terminal
+    offset = 1
+    while offset < steps:
+        scan[:-offset] += decay[:-offset] * scan[offset:]
+        decay[:-offset] = decay[:-offset] * decay[offset:]
+        offset *= 2
+
+    advantages[...] = scan
     returns = advantages + values
     return advantages, returns
 
@@ -428,86 +682,193 @@ def _aggregate_metrics(metrics: Iterable[Mapping[str, float]]) -> Dict[str, floa
     return {f"avg_{key}": totals[key] / count for key in totals}
 
 
+@dataclass(slots=True)
+class _Rollout:
+    """Arrays collected for one PPO update; ``(T,)`` or ``(T, N)`` shaped."""
+
+    observations: np.ndarray
+    actions: np.ndarray
+    log_probs: np.ndarray
+    rewards: np.ndarray
+    dones: np.ndarray
+    values: np.ndarray
+    last_value: float | np.ndarray
+    step_metrics: list[Mapping[str, float]]
+    episode_returns: list[float]
+    episode_lengths: list[int]
+
+
+def _collect_rollout(
+    env: RouterEnv, policy: SimpleCategoricalPolicy, obs: np.ndarray, length: int
+) -> tuple[_Rollout, np.ndarray]:
+    observations: list[np.ndarray] = []
+    actions: list[int] = []
+    log_probs: list[float] = []
+    rewards: list[float] = []
+    dones: list[float] = []
+    values: list[float] = []
+    step_metrics: list[Mapping[str, float]] = []
+    episode_returns: list[float] = []
+    episode_lengths: list[int] = []
+    running_return = 0.0
+    running_length = 0
+
+    for _ in range(length):
+        action, log_prob, value = policy.act(obs)
+        next_obs, reward, done, info = env.step(action)
+
+        observations.append(obs)
+        actions.append(action)
+        log_probs.append(log_prob)
+        rewards.append(reward)
+        dones.append(1.0 if done else 0.0)
+        values.append(value)
+        if isinstance(info, Mapping):
+            step_metrics.append(info.get("metrics", {}))
+
+        running_return += reward
+        running_length += 1
+        obs = next_obs
+
+        if done:
+            episode_returns.append(running_return)
+            episode_lengths.append(running_length)
+            obs = env.reset()
+            running_return = 0.0
+            running_length = 0
+
+    rollout = _Rollout(
+        observations=np.array(observations, dtype=np.float32),
+        actions=np.array(actions, dtype=np.int32),
+        log_probs=np.array(log_probs, dtype=np.float32),
+        rewards=np.array(rewards, dtype=np.float64),
+        dones=np.array(dones, dtype=np.float32),
+        values=np.array(values, dtype=np.float32),
+        last_value=policy.value(obs),
+        step_metrics=step_metrics,
+        episode_returns=episode_returns,
+        episode_lengths=episode_lengths,
+    )
+    return rollout, obs
+
+
+def _collect_vector_rollout(
+    env: VectorRouterEnv, policy: SimpleCategoricalPolicy, obs: np.ndarray, length: int
+) -> tuple[_Rollout, np.ndarray]:
+    steps = max(1, -(-length // env.num_envs))
+    shape = (steps, env.num_envs)
+    observations = np.empty(shape + (env.observation_dim,), dtype=np.float32)
+    actions = np.empty(shape, dtype=np.int32)
+    log_probs = np.empty(shape, dtype=np.float32)
+    rewards = np.empty(shape, dtype=np.float64)
+    dones = np.empty(shape, dtype=np.float32)
+    values = np.empty(shape, dtype=np.float32)
+    step_metrics: list[Mapping[str, float]] = []
+    episode_returns: list[float] = []
+    episode_lengths: list[int] = []
+    running_return = np.zeros(env.num_envs)
+    running_length = np.zeros(env.num_envs, dtype=np.int64)
+
+    for t in range(steps):
+        action, log_prob, value = policy.act_batch(obs)
+        next_obs, reward, done, info = env.step(action)
+
+        observations[t] = obs
+        actions[t] = action
+        log_probs[t] = log_prob
+        rewards[t] = reward
+        dones[t] = done
+        values[t] = value
+        step_metrics.append(
+            {key: float(np.mean(metric)) for key, metric in info["metrics"].items()}
+        )
+
+        running_return += reward
+        running_length += 1
+        if done.any():
+            episode_returns.extend(running_return[done].tolist())
+            episode_lengths.extend(running_length[done].tolist())
+            running_return[done] = 0.0
+            running_length[done] = 0
+        obs = next_obs
+
+    rollout = _Rollout(
+        observations=observations,
+        actions=actions,
+        log_probs=log_probs,
+        rewards=rewards,
+        dones=dones,
+        values=values,
+        last_value=policy.values(obs),
+        step_metrics=step_metrics,
+        episode_returns=episode_returns,
+        episode_lengths=episode_lengths,
+    )
+    return rollout, obs
+
+
 def ppo_train(
-    env: RouterEnv,
+    env: RouterEnv | VectorRouterEnv,
     policy: SimpleCategoricalPolicy,
     params: PPOParams,
     *,
     num_updates: int,
     rng: np.random.Generator | None = None,
+    should_stop: Callable[[list[Dict[str, float]]], bool] | None = None,
+    reset: bool = True,
+    start_update: int = 0,
 ) -> list[Dict[str, float]]:
-    """Execute PPO training and return per-update metrics."""
+    """Execute PPO training and return per-update metrics.
+
+    With a :class:`VectorRouterEnv` each update steps every environment
+    ``ceil(rollout_length / num_envs)`` times using batched action sampling,
+    so an update still trains on at least ``rollout_length`` transitions.
+    ``should_stop`` receives the history after every update; training ends
+    early once it returns ``True``. Pass ``reset=False`` to continue from the
+    environment's current observation, e.g. after restoring a checkpoint, and
+    ``start_update`` to keep update numbers continuous across calls.
+    """
 
     rng = rng or np.random.default_rng()
     history: list[Dict[str, float]] = []
-    obs = env.reset()
-
-    for update in range(num_updates):
-        observations: list[np.ndarray] = []
-        actions: list[int] = []
-        log_probs: list[float] = []
-        rewards: list[float] = []
-        dones: list[float] = []
-        values: list[float] = []
-        step_metrics: list[Mapping[str, float]] = []
-        episode_returns: list[float] = []
-        episode_lengths: list[int] = []
-        running_return = 0.0
-        running_length = 0
-
-        for _ in range(params.rollout_length):
-            action, log_prob, value = policy.act(obs)
-            next_obs, reward, done, info = env.step(action)
-
-            observations.append(obs)
-            actions.append(action)
-            log_probs.append(log_prob)
-            rewards.append(reward)
-            dones.append(1.0 if done else 0.0)
-            values.append(value)
-            if isinstance(info, Mapping):
-                step_metrics.append(info.get("metrics", {}))
-
-            running_return += reward
-            running_length += 1
-            obs = next_obs
-
-            if done:
-                episode_returns.append(running_return)
-                episode_lengths.append(running_length)
-                obs = env.reset()
-                running_return = 0.0
-                running_length = 0
-
-        last_value = policy.value(obs)
+    obs = env.reset() if reset else env.observe()
+
+    for update in range(start_update, start_update + num_updates):
+        if isinstance(env, VectorRouterEnv):
+            rollout, obs = _collect_vector_rollout(env, policy, obs, params.rollout_length)
+        else:
+            rollout, obs = _collect_rollout(env, policy, obs, params.rollout_length)
+
         advantages, returns = _compute_gae(
-            np.array(rewards, dtype=np.float32),
-            np.array(values, dtype=np.float32),
-            np.array(dones, dtype=np.float32),
-            last_value,
+            rollout.rewards.astype(np.float32),
+            rollout.values,
+            rollout.dones,
+            rollout.last_value,
             params.gamma,
             params.gae_lambda,
         )
         advantages = (advantages - advantages.mean()) / (advantages.std() + _EPS)
 
         update_metrics = policy.update(
-            np.array(observations, dtype=np.float32),
-            np.array(actions, dtype=np.int32),
-            np.array(log_probs, dtype=np.float32),
-            np.array(returns, dtype=np.float32),
-            advantages.astype(np.float32),
+            rollout.observations.reshape(-1, rollout.observations.shape[-1]),
+            rollout.actions.reshape(-1),
+            rollout.log_probs.reshape(-1),
+            np.asarray(returns, dtype=np.float32).reshape(-1),
+            advantages.astype(np.float32).reshape(-1),
             params,
             rng=rng,
         )
 
-        aggregated_metrics = _aggregate_metrics(step_metrics)
-        mean_reward = float(np.mean(rewards)) if rewards else 0.0
-        if episode_returns:
-            avg_episode_return = float(np.mean(episode_returns))
-            avg_episode_length = float(np.mean(episode_lengths))
+        rewards = rollout.rewards
+        aggregated_metrics = _aggregate_metrics(rollout.step_metrics)
+        mean_reward = float(np.mean(rewards)) if rewards.size else 0.0
+        if rollout.episode_returns:
+            avg_episode_return = float(np.mean(rollout.episode_returns))
+            avg_episode_length = float(np.mean(rollout.episode_lengths))
         else:
-            avg_episode_return = float(sum(rewards))
-            avg_episode_length = float(len(rewards))
+            per_env = rewards.reshape(rewards.shape[0], -1).T.tolist()
+            avg_episode_return = float(np.mean([sum(column) for column in per_env]))
+            avg_episode_length = float(rewards.shape[0])
 
         history_entry: Dict[str, float] = {
             "update": float(update + 1),
@@ -527,6 +888,9 @@ def ppo_train(
             update_metrics.get("value_loss", float("nan")),
             update_metrics.get("entropy", float("nan")),
         )
+        if should_stop is not None and should_stop(history):
+            logger.info("Stopping early after update %s", update + 1)
+            break
 
     return history
 
@@ -541,13 +905,24 @@ class RouterPPOAdapter:
         *,
         seed: int | None = None,
         episode_length: int = 64,
+        num_envs: int = 1,
     ) -> None:
         base_rng = np.random.default_rng(seed)
-        self.env = RouterEnv(
-            reward_weights=reward_weights,
-            episode_length=episode_length,
-            seed=int(base_rng.integers(0, 1_000_000)),
-        )
+        env_seed = int(base_rng.integers(0, 1_000_000))
+        self.env: RouterEnv | VectorRouterEnv
+        if num_envs > 1:
+            self.env = VectorRouterEnv(
+                num_envs,
+                reward_weights,
+                episode_length=episode_length,
+                seed=env_seed,
+            )
+        else:
+            self.env = RouterEnv(
+                reward_weights=reward_weights,
+                episode_length=episode_length,
+                seed=env_seed,
+            )
         self.policy = SimpleCategoricalPolicy(
             self.env.observation_dim,
             self.env.action_dim,
@@ -555,20 +930,78 @@ class RouterPPOAdapter:
         )
         self.params = params
         self._rng = np.random.default_rng(int(base_rng.integers(0, 1_000_000)))
+        self.updates_done = 0
+        self._started = False
+
+    @property
+    def steps_per_update(self) -> int:
+        """Environment transitions collected by one PPO update."""
+
+        if isinstance(self.env, VectorRouterEnv):
+            num_envs = self.env.num_envs
+            return -(-self.params.rollout_length // num_envs) * num_envs
+        return self.params.rollout_length
+
+    def train(
+        self,
+        num_updates: int,
+        *,
+        should_stop: Callable[[list[Dict[str, float]]], bool] | None = None,
+    ) -> Dict[str, Any]:
+        """Run ``num_updates`` PPO updates, continuing any earlier episodes."""
 
-    def train(self, num_updates: int) -> Dict[str, Any]:
         history = ppo_train(
             self.env,
             self.policy,
             self.params,
             num_updates=num_updates,
             rng=self._rng,
+            should_stop=should_stop,
+            reset=not self._started,
+            start_update=self.updates_done,
         )
+        self._started = True
+        self.updates_done += len(history)
         return {
             "history": history,
             "policy_state": self.policy.state_dict(),
         }
 
+    def checkpoint_state(self, history: Sequence[Mapping[str, float]]) -> Dict[str, np.ndarray]:
+        """Flatten everything needed to resume training into ``.npz`` arrays.
+
+        ``history`` is the full training history so far; its length is the
+        number of completed updates. Policy weights keep their
+        ``policy_state.npz`` names, so a checkpoint can also be served
+        directly by ``router.LearnedModePolicy``.
+        """
+
+        state: Dict[str, np.ndarray] = dict(self.policy.state_dict())
+        state["policy_rng"] = _rng_state(self.policy._rng)
+        state["trainer_rng"] = _rng_state(self._rng)
+        state.update({f"env_{key}": value for key, value in self.env.state_dict().items()})
+        state["num_envs"] = np.array(getattr(self.env, "num_envs", 1))
+        state["started"] = np.array(self._started or bool(history))
+        state["history"] = np.array(json.dumps(list(history)))
+        return state
+
+    def restore(self, state: Mapping[str, np.ndarray]) -> list[Dict[str, float]]:
+        """Load :meth:`checkpoint_state` output and return the saved history."""
+
+        num_envs = int(state["num_envs"])
+        if num_envs != getattr(self.env, "num_envs", 1):
+            raise ValueError(f"Checkpoint was trained with num_envs={num_envs}")
+        self.policy.load_state_dict(state)
+        _set_rng_state(self.policy._rng, state["policy_rng"])
+        _set_rng_state(self._rng, state["trainer_rng"])
+        self.env.load_state_dict(
+            {key[len("env_") :]: value for key, value in state.items() if key.startswith("env_")}
+        )
+        history: list[Dict[str, float]] = json.loads(str(state["history"]))
+        self.updates_done = len(history)
+        self._started = bool(state["started"])
+        return history
+
 
 __all__ = [
     "PPOParams",
@@ -576,6 +1009,8 @@ __all__ = [
     "RouterEnv",
     "SimpleCategoricalPolicy",
     "RouterPPOAdapter",
+    "VectorRouterEnv",
     "compute_reward",
+    "compute_rewards",
     "ppo_train",
 ]
@@ -0,0 +1,405 @@
+"""Parallel hyper-parameter sweeps over the router PPO adapter."""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+import logging
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from multiprocessing import Manager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, MutableMapping, Sequence
+
+import numpy as np
+
+from integrations.policy.rllm_ppo_adapter import (
+    PPOParams,
+    RewardWeights,
+    RouterPPOAdapter,
+    compute_reward,
+)
+
+logger = logging.getLogger(__name__)
+
+_SECTIONS: Dict[str, type] = {"ppo": PPOParams, "reward_weights": RewardWeights}
+
+
+@dataclass(slots=True)
+class SweepConfig:
+    """Search space and scheduling options from the ``rllm.sweep`` block.
+
+    ``space`` maps ``ppo.<field>`` or ``reward_weights.<field>`` to either a
+    list of candidate values or, for random search only, a range
+    ``{"low": ..., "high": ..., "log": bool}``.
+    """
+
+    strategy: str = "grid"
+    num_trials: int = 8
+    max_workers: int = 1
+    seed: int = 0
+    space: Dict[str, Any] = field(default_factory=dict)
+    early_stopping: bool = True
+    grace_updates: int = 2
+    min_trials: int = 3
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any] | None) -> "SweepConfig":
+        data = data or {}
+        defaults = {item.name: item.default for item in fields(cls)}
+        stopping = data.get("early_stopping", {})
+        if not isinstance(stopping, Mapping):
+            stopping = {"enabled": bool(stopping)}
+        config = cls(
+            strategy=str(data.get("strategy", defaults["strategy"])).lower(),
+            num_trials=int(data.get("num_trials", defaults["num_trials"])),
+            max_workers=int(data.get("max_workers", defaults["max_workers"])),
+            seed=int(data.get("seed", defaults["seed"])),
+            space=dict(data.get("space") or {}),
+            early_stopping=bool(stopping.get("enabled", defaults["early_stopping"])),
+            grace_updates=int(stopping.get("grace_updates", defaults["grace_updates"])),
+            min_trials=int(stopping.get("min_trials", defaults["min_trials"])),
+        )
+        config.validate()
+        return config
+
+    def validate(self) -> None:
+        if self.strategy not in {"grid", "random"}:
+            raise ValueError("strategy must be 'grid' or 'random'")
+        if self.num_trials <= 0:
+            raise ValueError("num_trials must be positive")
+        if self.max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        if self.grace_updates < 0:
+            raise ValueError("grace_updates cannot be negative")
+        if self.min_trials <= 0:
+            raise ValueError("min_trials must be positive")
+        for key, values in self.space.items():
+            section, _, name = key.partition(".")
+            target = _SECTIONS.get(section)
+            if target is None or name not in {item.name for item in fields(target)}:
+                raise ValueError(
+                    f"Unknown sweep parameter '{key}'; expected ppo.<field> or reward_weights.<field>"
+                )
+            if isinstance(values, Mapping):
+                if self.strategy == "grid":
+                    raise ValueError(f"Grid search needs a list of values for '{key}'")
+                if "low" not in values or "high" not in values:
+                    raise ValueError(f"Range for '{key}' needs 'low' and 'high'")
+                if values.get("log") and float(values["low"]) <= 0:
+                    raise ValueError(f"Log range for '{key}' must be positive")
+            elif not isinstance(values, Sequence) or isinstance(values, str) or not values:
+                raise ValueError(f"Sweep parameter '{key}' needs a non-empty list or range")
+
+
+@dataclass(slots=True)
+class Trial:
+    """One point of the search space with its own seed."""
+
+    index: int
+    seed: int
+    overrides: Dict[str, Any]
+
+    def section(self, name: str) -> Dict[str, Any]:
+        prefix = f"{name}."
+        return {
+            key[len(prefix) :]: value
+            for key, value in self.overrides.items()
+            if key.startswith(prefix)
+        }
+
+
+@dataclass(slots=True)
+class TrialResult:
+    """Outcome of a single trial; ``status`` is completed, stopped or failed."""
+
+    trial: Trial
+    status: str
+    updates: int
+    objective: float = float("nan")
+    best_objective: float = float("nan")
+    mean_reward: float = float("nan")
+    artifacts: str = ""
+    error: str = ""
+
+    def row(self) -> Dict[str, Any]:
+        return {
+            "trial": self.trial.index,
+            "seed": self.trial.seed,
+            **self.trial.overrides,
+            "status": self.status,
+            "updates": self.updates,
+            "objective": self.objective,
+            "best_objective": self.best_objective,
+            "mean_reward": self.mean_reward,
+            "artifacts": self.artifacts,
+            "error": self.error,
+        }
+
+
+class MedianStoppingRule:
+    """Stop trials whose running-average objective trails their peers' median.
+
+    Every trial reports the running average of its objective after each update
+    to ``store``, which may be a ``multiprocessing.Manager`` dict shared by the
+    worker processes. From ``grace_updates`` on, a trial stops once at least
+    ``min_trials`` other trials have reported the same update and its running
+    average is below their median.
+    """
+
+    def __init__(
+        self,
+        store: MutableMapping[tuple[int, int], float],
+        *,
+        grace_updates: int = 2,
+        min_trials: int = 3,
+    ) -> None:
+        self.store = store
+        self.grace_updates = grace_updates
+        self.min_trials = min_trials
+
+    def report(self, trial: int, update: int, value: float) -> bool:
+        """Record ``value`` and return ``True`` if the trial should stop."""
+
+        self.store[(trial, update)] = value
+        if update < self.grace_updates:
+            return False
+        peers = [
+            score
+            for (other, step), score in self.store.items()
+            if step == update and other != trial
+        ]
+        if len(peers) < self.min_trials:
+            return False
+        return value < float(np.median(peers))
+
+
+def sample_trials(config: SweepConfig) -> list[Trial]:
+    """Expand the grid or draw random points, each with a spawned seed."""
+
+    keys = list(config.space)
+    if config.strategy == "grid":
+        points = [
+            dict(zip(keys, combination))
+            for combination in itertools.product(*(config.space[key] for key in keys))
+        ]
+    else:
+        rng = np.random.default_rng(config.seed)
+        points = [
+            {key: _sample_value(config.space[key], rng) for key in keys}
+            for _ in range(config.num_trials)
+        ]
+    seeds = np.random.SeedSequence(config.seed).spawn(len(points))
+    return [
+        Trial(index=index, seed=int(sequence.generate_state(1)[0]), overrides=point)
+        for index, (point, sequence) in enumerate(zip(points, seeds))
+    ]
+
+
+def _sample_value(values: Any, rng: np.random.Generator) -> Any:
+    if not isinstance(values, Mapping):
+        return values[int(rng.integers(len(values)))]
+    low, high = values["low"], values["high"]
+    if values.get("log"):
+        return float(math.exp(rng.uniform(math.log(low), math.log(high))))
+    if isinstance(low, int) and isinstance(high, int):
+        return int(rng.integers(low, high + 1))
+    return float(rng.uniform(low, high))
+
+
+def objective(entry: Mapping[str, float], weights: RewardWeights) -> float:
+    """Score an update's averaged metrics with fixed reward weights.
+
+    Trials that sweep ``reward_weights`` optimise different rewards, so they
+    are compared on the base weights instead of their own ``mean_reward``.
+    """
+
+    metrics = {key[len("avg_") :]: value for key, value in entry.items() if key.startswith("avg_")}
+    return compute_reward(metrics, weights)
+
+
+def run_trial(
+    trial: Trial,
+    *,
+    ppo: Mapping[str, Any],
+    reward_weights: Mapping[str, Any],
+    num_updates: int,
+    episode_length: int = 64,
+    num_envs: int = 1,
+    rule: MedianStoppingRule | None = None,
+    output_dir: str | Path | None = None,
+) -> TrialResult:
+    """Train one trial, reporting to ``rule`` after every update."""
+
+    try:
+        params = PPOParams.from_dict({**ppo, **trial.section("ppo")})
+        weights = RewardWeights.from_dict({**reward_weights, **trial.section("reward_weights")})
+        adapter = RouterPPOAdapter(
+            params,
+            weights,
+            seed=trial.seed,
+            episode_length=episode_length,
+            num_envs=num_envs,
+        )
+    except ValueError as exc:
+        logger.warning("Trial %s rejected: %s", trial.index, exc)
+        return TrialResult(trial=trial, status="failed", updates=0, error=str(exc))
+
+    base_weights = RewardWeights.from_dict(reward_weights)
+    scores: list[float] = []
+
+    def should_stop(history: list[Dict[str, float]]) -> bool:
+        scores.append(objective(history[-1], base_weights))
+        if rule is None:
+            return False
+        return rule.report(trial.index, len(history), float(np.mean(scores)))
+
+    results = adapter.train(num_updates, should_stop=should_stop)
+    history = results["history"]
+
+    artifacts = ""
+    if output_dir is not None:
+        trial_dir = Path(output_dir) / f"trial-{trial.index:03d}"
+        trial_dir.mkdir(parents=True, exist_ok=True)
+        with (trial_dir / "training_history.json").open("w", encoding="utf-8") as handle:
+            json.dump(history, handle, indent=2)
+        np.savez(trial_dir / "policy_state.npz", **results["policy_state"])
+        artifacts = str(trial_dir)
+
+    return TrialResult(
+        trial=trial,
+        status="stopped" if len(history) < num_updates else "completed",
+        updates=len(history),
+        objective=float(np.mean(scores)) if scores else float("nan"),
+        best_objective=max(scores) if scores else float("nan"),
+        mean_reward=float(history[-1]["mean_reward"]) if history else float("nan"),
+        artifacts=artifacts,
+    )
+
+
+def run_sweep(
+    config: SweepConfig,
+    *,
+    ppo: Mapping[str, Any],
+    reward_weights: Mapping[str, Any] | None = None,
+    num_updates: int,
+    episode_length: int = 64,
+    num_envs: int = 1,
+    output_dir: str | Path | None = None,
+) -> list[TrialResult]:
+    """Run every trial of ``config`` and return results, best objective first.
+
+    With ``max_workers > 1`` trials run in a process pool and share their
+    progress for median early stopping through a manager dict; otherwise they
+    run in-process one after another, each compared with those that finished.
+    A trial that raises is recorded as failed with its error instead of
+    aborting the sweep.
+    """
+
+    trials = sample_trials(config)
+    options: Dict[str, Any] = {
+        "ppo": dict(ppo),
+        "reward_weights": dict(reward_weights or {}),
+        "num_updates": num_updates,
+        "episode_length": episode_length,
+        "num_envs": num_envs,
+        "output_dir": None if output_dir is None else str(output_dir),
+    }
+    logger.info("Running %s %s-search trials", len(trials), config.strategy)
+
+    if config.max_workers == 1 or len(trials) == 1:
+        rule = _stopping_rule(config, {})
+        results = []
+        for trial in trials:
+            try:
+                results.append(run_trial(trial, rule=rule, **options))
+            except Exception as exc:
+                results.append(_failed(trial, exc))
+    else:
+        with Manager() as manager:
+            rule = _stopping_rule(config, manager.dict())
+            with ProcessPoolExecutor(max_workers=config.max_workers) as pool:
+                futures = [pool.submit(run_trial, trial, rule=rule, **options) for trial in trials]
+                results = []
+                for trial, future in zip(trials, futures):
+                    try:
+                        results.append(future.result())
+                    except Exception as exc:
+                        results.append(_failed(trial, exc))
+
+    results.sort(key=lambda result: (math.isnan(result.objective), -result.objective))
+    return results
+
+
+def _failed(trial: Trial, exc: Exception) -> TrialResult:
+    logger.warning("Trial %s failed: %s", trial.index, exc)
+    return TrialResult(trial=trial, status="failed", updates=0, error=str(exc) or repr(exc))
+
+
+def _stopping_rule(
+    config: SweepConfig, store: MutableMapping[tuple[int, int], float]
+) -> MedianStoppingRule | None:
+    if not config.early_stopping:
+        return None
+    return MedianStoppingRule(
+        store, grace_updates=config.grace_updates, min_trials=config.min_trials
+    )
+
+
+def format_results(results: Iterable[TrialResult]) -> str:
+    """Render results as a fixed-width table."""
+
+    results = list(results)
+    keys = sorted({key for result in results for key in result.trial.overrides})
+    header = f"{'trial':>5} {'status':<9}{'updates':>8}{'objective':>11}{'best':>9}"
+    header += "".join(f" {key:>24}" for key in keys)
+    rows = [header]
+    for result in results:
+        line = (
+            f"{result.trial.index:>5} {result.status:<9}{result.updates:>8}"
+            f"{result.objective:>11.4f}{result.best_objective:>9.4f}"
+        )
+        line += "".join(f" {_format_value(result.trial.overrides.get(key)):>24}" for key in keys)
+        rows.append(line)
+    return "\n".join(rows)
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.4g}"
+    return "" if value is None else str(value)
+
+
+def write_results(results: Sequence[TrialResult], output_dir: str | Path) -> Path:
+    """Write ``results.csv`` and ``results.json`` and return the CSV path."""
+
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    rows = [result.row() for result in results]
+    columns: list[str] = []
+    for row in rows:
+        columns.extend(key for key in row if key not in columns)
+    csv_path = directory / "results.csv"
+    with csv_path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+    with (directory / "results.json").open("w", encoding="utf-8") as handle:
+        json.dump([asdict(result) for result in results], handle, indent=2)
+    return csv_path
+
+
+__all__ = [
+    "MedianStoppingRule",
+    "SweepConfig",
+    "Trial",
+    "TrialResult",
+    "format_results",
+    "objective",
+    "run_sweep",
+    "run_trial",
+    "sample_trials",
+    "write_results",
+]
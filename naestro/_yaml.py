@@ -0,0 +1,29 @@
+"""Optional PyYAML support shared by the configuration loaders."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+
+def load_yaml(text: str, purpose: str) -> Any:
+    """Parse ``text`` with ``yaml.safe_load``.
+
+    ``purpose`` completes the sentence "Loading ... from YAML requires
+    PyYAML" in the error raised when the package is missing.
+
+    Raises:
+        RuntimeError: If PyYAML is not installed.
+    """
+
+    try:
+        import yaml
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            f"Loading {purpose} from YAML requires PyYAML. "
+            'Install it with `pip install "pyyaml>=6"`.'
+        ) from exc
+    loader: Callable[[str], Any] = yaml.safe_load
+    return loader(text)
+
+
+__all__ = ["load_yaml"]
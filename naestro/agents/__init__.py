@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from .debate import DebateOrchestrator, DebateOutcome, DebateSettings
+from .loader import ROLE_ENTRY_POINT_GROUP, RoleSpec
 from .roles import Responder, Role, Roles
 from .schemas import DebateTranscript, Message, new_message
 
@@ -12,8 +13,10 @@ __all__ = [
     "DebateSettings",
     "DebateTranscript",
     "Message",
+    "ROLE_ENTRY_POINT_GROUP",
     "Responder",
     "Role",
+    "RoleSpec",
     "Roles",
     "new_message",
 ]
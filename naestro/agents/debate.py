@@ -49,8 +49,10 @@ class DebateOrchestrator:
         tracer: Tracer | None = None,
     ) -> None:
         if roles is None:
-            catalog = Roles()
-            self._roles: dict[str, Role] = {role.name: role for role in catalog.list()}
+            self._roles: Mapping[str, Role] = Roles()
+        elif isinstance(roles, Roles):
+            # Keep deferred roles unresolved until a debate first needs them.
+            self._roles = roles.copy()
         elif isinstance(roles, Mapping):
             self._roles = dict(roles)
         else:
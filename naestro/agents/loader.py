@@ -0,0 +1,117 @@
+"""Deferred role discovery from entry points and configuration files."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from importlib import import_module
+from importlib.metadata import entry_points
+import json
+from pathlib import Path
+from typing import Any, List, Mapping
+
+from .._yaml import load_yaml
+from .roles import Role
+
+ROLE_ENTRY_POINT_GROUP = "naestro.roles"
+"""Entry point group scanned by :meth:`Roles.load_entry_points`."""
+
+
+@dataclass(frozen=True, slots=True)
+class RoleSpec:
+    """Reference to a role whose implementation is imported on first use.
+
+    ``target`` uses the entry point syntax ``"package.module:attribute"``. The
+    attribute may either be a :class:`Role` instance or a zero-argument factory
+    returning one.
+    """
+
+    name: str
+    target: str
+    description: str = ""
+    metadata: Mapping[str, object] = field(default_factory=dict)
+
+    def load(self) -> Role:
+        """Import the target and materialise the :class:`Role`."""
+
+        module_name, _, attribute = self.target.partition(":")
+        if not module_name or not attribute:
+            raise ValueError(
+                f"Role target {self.target!r} must use the 'module:attribute' form"
+            )
+        obj: Any = import_module(module_name)
+        for part in attribute.split("."):
+            obj = getattr(obj, part)
+        role = obj if isinstance(obj, Role) else _call_factory(obj, self.target)
+        if role.name == self.name and not self.metadata:
+            return role
+        combined = dict(role.metadata)
+        combined.update(self.metadata)
+        return Role(
+            name=self.name,
+            description=role.description or self.description,
+            strategy=role.strategy,
+            fallback_response=role.fallback_response,
+            metadata=combined,
+        )
+
+
+def _call_factory(factory: object, target: str) -> Role:
+    if not callable(factory):
+        raise TypeError(f"Role target {target!r} is neither a Role nor a factory")
+    role = factory()
+    if not isinstance(role, Role):
+        raise TypeError(f"Role factory {target!r} returned {type(role).__name__}")
+    return role
+
+
+def discover_role_specs(group: str = ROLE_ENTRY_POINT_GROUP) -> List[RoleSpec]:
+    """Return :class:`RoleSpec` entries advertised by installed distributions.
+
+    Only package metadata is read; none of the advertised modules are imported.
+    """
+
+    return [
+        RoleSpec(name=entry.name, target=entry.value)
+        for entry in entry_points(group=group)
+    ]
+
+
+def load_role_specs(path: str | Path) -> List[RoleSpec]:
+    """Read role references from a JSON or YAML configuration file.
+
+    The file must contain a ``roles`` list whose entries provide ``name`` and
+    ``target`` keys plus optional ``description`` and ``metadata``.
+    """
+
+    source = Path(path)
+    text = source.read_text(encoding="utf-8")
+    if source.suffix in {".yaml", ".yml"}:
+        data = load_yaml(text, "roles")
+    else:
+        data = json.loads(text)
+    entries = data.get("roles", []) if isinstance(data, Mapping) else None
+    if not isinstance(entries, list):
+        raise ValueError(f"{source} must define a 'roles' list")
+    specs: List[RoleSpec] = []
+    for entry in entries:
+        if not isinstance(entry, Mapping) or "name" not in entry:
+            raise ValueError(f"Invalid role entry in {source}: {entry!r}")
+        if "target" not in entry:
+            raise ValueError(f"Role '{entry['name']}' in {source} is missing 'target'")
+        specs.append(
+            RoleSpec(
+                name=str(entry["name"]),
+                target=str(entry["target"]),
+                description=str(entry.get("description", "")),
+                metadata=dict(entry.get("metadata") or {}),
+            )
+        )
+    return specs
+
+
+__all__ = [
+    "ROLE_ENTRY_POINT_GROUP",
+    "RoleSpec",
+    "discover_role_specs",
+    "load_role_specs",
+]
@@ -3,10 +3,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, Dict, Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    TYPE_CHECKING,
+)
 
 from .schemas import Message
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .loader import RoleSpec
+
 Responder = Callable[[Sequence[Message]], str]
 
 
@@ -112,32 +124,105 @@ _BUILTIN_ROLES = _build_builtin_roles()
 
 
 class Roles(Mapping[str, Role]):
-    """Mapping of available roles seeded with the TradingAgents defaults."""
+    """Mapping of available roles seeded with the TradingAgents defaults.
+
+    Roles registered through :meth:`register_lazy`, :meth:`load_entry_points` or
+    :meth:`load_config` are only imported the first time they are looked up,
+    keeping start-up cheap when many role packs are installed.
+    """
 
     def __init__(self, roles: Iterable[Role] | None = None) -> None:
         self._roles: Dict[str, Role] = dict(_BUILTIN_ROLES)
+        self._pending: Dict[str, RoleSpec] = {}
+        # Registration order of every name, resolved or not; resolving a
+        # deferred role must not move it.
+        self._order: Dict[str, None] = dict.fromkeys(_BUILTIN_ROLES)
         if roles is not None:
             for role in roles:
                 self.register(role)
 
     def __getitem__(self, key: str) -> Role:
-        return self._roles[key]
+        role = self._roles.get(key)
+        if role is not None:
+            return role
+        spec = self._pending[key]
+        role = spec.load()
+        # Another thread may have resolved or replaced the entry meanwhile.
+        if self._pending.get(key) is spec:
+            self._roles[key] = role
+            del self._pending[key]
+        return role
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self._roles)
+        return iter(self.names)
 
     def __len__(self) -> int:
-        return len(self._roles)
+        return len(self._roles) + len(self._pending)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._roles or key in self._pending
 
     def register(self, role: Role) -> None:
         """Register or replace a role."""
 
+        self._pending.pop(role.name, None)
         self._roles[role.name] = role
+        self._order[role.name] = None
+
+    def register_lazy(self, spec: RoleSpec) -> None:
+        """Register a role whose implementation is imported on first lookup."""
+
+        self._roles.pop(spec.name, None)
+        self._pending[spec.name] = spec
+        self._order[spec.name] = None
+
+    def load_entry_points(self, group: str | None = None) -> Sequence[str]:
+        """Register roles advertised under the ``naestro.roles`` entry point group.
+
+        Returns:
+            The names of the discovered roles.
+        """
+
+        from .loader import discover_role_specs, ROLE_ENTRY_POINT_GROUP
+
+        specs = discover_role_specs(group or ROLE_ENTRY_POINT_GROUP)
+        for spec in specs:
+            self.register_lazy(spec)
+        return [spec.name for spec in specs]
+
+    def load_config(self, path: str | Path) -> Sequence[str]:
+        """Register roles listed in a JSON or YAML configuration file.
+
+        Returns:
+            The names of the configured roles.
+        """
+
+        from .loader import load_role_specs
+
+        specs = load_role_specs(path)
+        for spec in specs:
+            self.register_lazy(spec)
+        return [spec.name for spec in specs]
+
+    def is_loaded(self, name: str) -> bool:
+        """Return ``True`` when ``name`` is registered and already imported."""
+
+        return name in self._roles
+
+    def describe(self, name: str) -> str:
+        """Return a role description without importing deferred roles."""
+
+        spec = self._pending.get(name)
+        if spec is not None:
+            return spec.description
+        return self.get(name).description
 
     def unregister(self, name: str) -> None:
         """Remove a role by name if present."""
 
         self._roles.pop(name, None)
+        self._pending.pop(name, None)
+        self._order.pop(name, None)
 
     def update_metadata(self, name: str, metadata: Mapping[str, object]) -> None:
         """Merge metadata into an existing role definition."""
@@ -157,19 +242,30 @@ class Roles(Mapping[str, Role]):
         """Lookup a role by name raising a helpful error when missing."""
 
         try:
-            return self._roles[name]
+            return self[name]
         except KeyError as exc:  # pragma: no cover - helpful error message
             raise KeyError(f"Unknown role '{name}'") from exc
 
     def list(self) -> Sequence[Role]:
-        """Return the available roles preserving registration order."""
+        """Return the available roles, importing any deferred entries."""
+
+        return [self[name] for name in self.names]
+
+    def copy(self) -> "Roles":
+        """Return a shallow copy that keeps deferred roles unresolved."""
 
-        return list(self._roles.values())
+        clone = Roles()
+        clone._roles = dict(self._roles)
+        clone._pending = dict(self._pending)
+        clone._order = dict(self._order)
+        return clone
 
     def clear(self) -> None:
         """Reset the role mapping to the builtin defaults."""
 
         self._roles = dict(_BUILTIN_ROLES)
+        self._pending = {}
+        self._order = dict.fromkeys(_BUILTIN_ROLES)
 
     @property
     def builtin(self) -> Sequence[Role]:
@@ -179,9 +275,9 @@ class Roles(Mapping[str, Role]):
 
     @property
     def names(self) -> Sequence[str]:
-        """Return the names of registered roles."""
+        """Return the names of registered roles, including deferred ones."""
 
-        return list(self._roles.keys())
+        return list(self._order)
 
 
 __all__ = ["Responder", "Role", "Roles"]
@@ -1,4 +1,5 @@
 import argparse
+from pathlib import Path
 from typing import cast, Sequence
 
 from naestro.agents import DebateOrchestrator, DebateSettings, Message, Role, Roles
@@ -7,7 +8,7 @@ from naestro.governance import Decision, Governor, Policy, PolicyInput
 from packs.trading import DebateGate, PipelineResult, trading_demo
 
 
-def build_roles() -> Roles:
+def build_roles(config: Path | None = None) -> Roles:
     def analyst(history: Sequence[Message]) -> str:
         return "Approve trade" if len(history) % 2 == 0 else "Highlight momentum"
 
@@ -18,6 +19,10 @@ def build_roles() -> Roles:
     roles = Roles()
     roles.register(Role("analyst", "Analyst reviewing opportunities", analyst))
     roles.register(Role("risk", "Risk reviewer", risk))
+    # Role packs are registered by reference and only imported when used.
+    roles.load_entry_points()
+    if config is not None:
+        roles.load_config(config)
     return roles
 
 
@@ -49,15 +54,15 @@ def build_debate_gate(roles: Roles) -> DebateGate:
 
 def list_roles(roles: Roles) -> None:
     print("Registered roles:")
-    for role in roles.list():
-        print(f"- {role.name}: {role.description}")
+    for name in roles.names:
+        print(f"- {name}: {roles.describe(name)}")
 
 
 def run_debate(roles: Roles, prompt: str, rounds: int) -> None:
     with Tracer(run_name="cli-debate") as tracer:
         orchestrator = DebateOrchestrator(roles, tracer=tracer)
         outcome = orchestrator.run(
-            [role.name for role in roles.list()],
+            list(roles.names),
             prompt,
             settings=DebateSettings(rounds=rounds),
         )
@@ -105,6 +110,12 @@ def run_governed(roles: Roles) -> None:
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Naestro CLI utilities")
+    parser.add_argument(
+        "--roles-config",
+        type=Path,
+        default=None,
+        help="JSON or YAML file listing additional roles to load on demand",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     subparsers.add_parser("list-roles", help="List registered roles")
@@ -124,7 +135,7 @@ def build_parser() -> argparse.ArgumentParser:
 def main(argv: Sequence[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
-    roles = build_roles()
+    roles = build_roles(args.roles_config)
     if args.command == "list-roles":
         list_roles(roles)
     elif args.command == "run-debate":
@@ -22,10 +22,16 @@ Payload = dict[str, object]
 
 
 def _deep_copy(value: object) -> object:
-    if isinstance(value, Mapping):
+    # Concrete type checks first: ABC isinstance checks dominate large payloads.
+    kind = type(value)
+    if kind is str or kind is int or kind is float or kind is bool or value is None:
+        return value
+    if isinstance(value, dict):
         return {str(key): _deep_copy(item) for key, item in value.items()}
     if isinstance(value, list):
         return [_deep_copy(item) for item in value]
+    if isinstance(value, Mapping):
+        return {str(key): _deep_copy(item) for key, item in value.items()}
     if isinstance(value, tuple):
         return tuple(_deep_copy(item) for item in value)
     return value
@@ -203,6 +209,11 @@ class MessageBus:
     def subscribe(self, event: str, handler: Handler) -> None:
         self._handlers.setdefault(event, []).append(handler)
 
+    def has_subscribers(self, event: str) -> bool:
+        """Return whether publishing ``event`` reaches a handler or middleware."""
+
+        return bool(self._handlers.get(event)) or bool(self._middleware)
+
     def use(self, middleware: Middleware) -> None:
         self._middleware.append(middleware)
 
@@ -252,8 +263,7 @@ class MessageBus:
         self, index: int, event: str, payload: Payload
     ) -> tuple[str, Payload, Envelope | None]:
         if index >= len(self._middleware):
-            envelope = self._deliver(event, payload)
-            return event, payload, envelope
+            return event, payload, self._deliver(event, payload)
 
         final_event = event
         final_payload = payload
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+from .cache import CacheStats, DecisionCache
+from .dsl import compile_policies, load_policies
 from .governor import apply_patches, Governor
+from .patching import find_conflicts, patch_plan, PatchConflictError, PlanPatcher
+from .planning import EvaluationPlan
 from .policies import (
     BudgetPolicy,
     LatencySLOPolicy,
@@ -13,20 +17,49 @@ from .policies import (
     RiskPolicy,
     SafetyPolicy,
 )
+from .ratelimit import (
+    DomainDeniedError,
+    DomainLimit,
+    load_rate_policy,
+    RateLimiter,
+    RatePolicy,
+)
 from .schemas import Decision, PolicyInput, PolicyPatch
+from .streaming import (
+    RollingQuantile,
+    StreamingBudgetPolicy,
+    StreamingLatencySLOPolicy,
+)
 
 __all__ = [
     "BudgetPolicy",
+    "CacheStats",
     "Decision",
+    "DecisionCache",
+    "DomainDeniedError",
+    "DomainLimit",
+    "EvaluationPlan",
     "Governor",
     "LatencySLOPolicy",
+    "PatchConflictError",
+    "PlanPatcher",
     "Policy",
     "PolicyChecker",
     "PolicyInput",
     "PolicyLike",
     "PolicyPatch",
     "PolicyResult",
+    "RateLimiter",
+    "RatePolicy",
     "RiskPolicy",
+    "RollingQuantile",
     "SafetyPolicy",
+    "StreamingBudgetPolicy",
+    "StreamingLatencySLOPolicy",
     "apply_patches",
+    "compile_policies",
+    "find_conflicts",
+    "load_policies",
+    "load_rate_policy",
+    "patch_plan",
 ]
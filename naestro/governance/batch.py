@@ -0,0 +1,76 @@
+"""Column-oriented views of many policy inputs for batch evaluation."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, cast
+
+try:  # pragma: no cover - exercised implicitly when numpy is installed
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - optional acceleration
+    raise RuntimeError(
+        "naestro.governance.batch requires numpy>=1.26. "
+        'Install it with `pip install "numpy>=1.26"`.'
+    ) from exc
+
+from .schemas import PolicyInput
+
+
+def _resolve(policy_input: PolicyInput, path: Sequence[str]) -> Any:
+    value: Any = policy_input
+    for part in path:
+        if value is None:
+            return None
+        value = getattr(value, part, None)
+    return value
+
+
+class PolicyColumns:
+    """Structure-of-arrays view handed to a policy's ``evaluate_many``.
+
+    Columns are addressed by dotted attribute paths such as ``"budget.usage"``
+    and built on first access. A missing link anywhere along the path, such as
+    an input without a ``budget``, reads as ``None`` in :meth:`values` and as
+    ``NaN`` in :meth:`numeric`.
+    """
+
+    __slots__ = ("inputs", "_values", "_numeric")
+
+    def __init__(self, inputs: Sequence[PolicyInput]) -> None:
+        self.inputs: tuple[PolicyInput, ...] = tuple(inputs)
+        self._values: dict[str, list[Any]] = {}
+        self._numeric: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.inputs)
+
+    def values(self, path: str) -> list[Any]:
+        """Return the raw values at ``path``, one per input."""
+
+        column = self._values.get(path)
+        if column is None:
+            parts = path.split(".")
+            column = [_resolve(policy_input, parts) for policy_input in self.inputs]
+            self._values[path] = column
+        return column
+
+    def numeric(self, path: str) -> np.ndarray:
+        """Return the values at ``path`` as ``float64`` with ``NaN`` for gaps."""
+
+        column = self._numeric.get(path)
+        if column is None:
+            column = np.fromiter(
+                (np.nan if value is None else value for value in self.values(path)),
+                dtype=np.float64,
+                count=len(self.inputs),
+            )
+            self._numeric[path] = column
+        return column
+
+    def missing(self, path: str) -> np.ndarray:
+        """Return a mask of the inputs without a numeric value at ``path``."""
+
+        return cast(np.ndarray, np.isnan(self.numeric(path)))
+
+
+__all__ = ["PolicyColumns"]
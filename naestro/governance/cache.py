@@ -0,0 +1,147 @@
+"""Bounded memoisation of policy decisions."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, cast
+
+from pydantic import BaseModel
+
+from .policies import PolicyLike
+from .schemas import Decision, PolicyInput
+
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _freeze(value: Any) -> Hashable:
+    if type(value) in _ATOMIC_TYPES:
+        return cast(Hashable, value)
+    if isinstance(value, BaseModel):
+        extra = value.__pydantic_extra__
+        return (
+            type(value),
+            tuple(_freeze(item) for item in value.__dict__.values()),
+            _freeze(extra) if extra else None,
+        )
+    if isinstance(value, (dict, Mapping)):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return cast(Hashable, value)
+
+
+def fingerprint(policy_input: PolicyInput, fields: Iterable[str]) -> Hashable:
+    """Return a hashable snapshot of the named ``policy_input`` fields.
+
+    Mappings and sets are compared regardless of order, so equal inputs share
+    a fingerprint however they were built.
+    """
+
+    return tuple(
+        (field, _freeze(getattr(policy_input, field, None))) for field in fields
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class CacheStats:
+    """Point-in-time counters of a :class:`DecisionCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DecisionCache:
+    """LRU cache of decisions for policies that declare the fields they read.
+
+    A policy opts in through a ``reads`` attribute naming the
+    :class:`PolicyInput` fields its decision depends on. Its decisions are
+    cached per policy object under a :func:`fingerprint` of those fields, so
+    the policy must be a pure function of them and of its own configuration.
+    Decisions are copied on the way in and out, so callers may mutate the
+    decisions they receive without affecting later hits.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[PolicyLike, Decision]] = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def key_for(self, policy: PolicyLike, policy_input: PolicyInput) -> Hashable | None:
+        """Return the cache key for ``policy``, or ``None`` if it is uncacheable.
+
+        Inputs whose read fields hold unhashable values, such as a
+        ``bytearray``, cannot be keyed; they count as a miss.
+        """
+
+        reads = getattr(policy, "reads", None)
+        if reads is None:
+            return None
+        try:
+            key = id(policy), fingerprint(policy_input, reads)
+            hash(key)
+        except TypeError:
+            with self._lock:
+                self._misses += 1
+            return None
+        return key
+
+    def get(self, key: Hashable, policy: PolicyLike) -> Decision | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            # Keys embed ``id(policy)``; the stored policy guards against reuse.
+            if entry is None or entry[0] is not policy:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1].model_copy(deep=True)
+
+    def put(self, key: Hashable, policy: PolicyLike, decision: Decision) -> None:
+        decision = decision.model_copy(deep=True)
+        with self._lock:
+            self._entries[key] = (policy, decision)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ["CacheStats", "DecisionCache", "fingerprint"]
@@ -0,0 +1,440 @@
+"""Compile declarative policy rules into precompiled predicates.
+
+A policy document holds named ``policies`` parameters and a list of
+``rules``::
+
+    policies:
+      max_drawdown: 2.0
+    rules:
+      - name: max_drawdown
+        description: Limit drawdowns
+        check: {field: metadata.max_drawdown, le: $max_drawdown, default: 0.0}
+        pass: Within drawdown limit
+        fail: "Drawdown {value:.2f} exceeds limit {limit:.2f}"
+
+A ``check`` is a comparison, a set-membership test or a boolean combination
+of checks (``all``, ``any``, ``not``). Operands starting with ``$`` refer to
+``policies`` parameters. Everything is resolved when the document is
+compiled, so evaluating a rule only walks a fixed chain of closures.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+import operator
+from pathlib import Path
+from string import Formatter
+from typing import Any
+
+from .policies import Policy
+from .schemas import Decision, PolicyInput
+
+Condition = Callable[[PolicyInput, dict[str, Any]], bool]
+
+_ORDERING = ("lt", "le", "gt", "ge")
+_REFLECTED = {"lt": "__gt__", "le": "__ge__", "gt": "__lt__", "ge": "__le__"}
+_EQUALITY: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+}
+_MEMBERSHIP = ("in", "not_in", "intersects", "disjoint")
+_OPERATORS = (*_ORDERING, *_EQUALITY, *_MEMBERSHIP)
+_SEVERITIES = ("info", "warning", "critical")
+
+
+class _Missing:
+    """Placeholder for values bound in a branch that was short-circuited."""
+
+    def __format__(self, spec: str) -> str:
+        return "n/a"
+
+
+_MISSING = _Missing()
+
+
+class _Bindings(dict[str, Any]):
+    """Per-evaluation names, falling back to the rule's compiled constants.
+
+    Each rule gets a subclass carrying its ``constants``, so creating the
+    per-evaluation mapping runs no Python-level ``__init__``.
+    """
+
+    __slots__ = ()
+    constants: Mapping[str, Any] = {}
+
+    def __missing__(self, key: str) -> Any:
+        return self.constants.get(key, _MISSING)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self[key]
+        return default if value is _MISSING else value
+
+
+def _getter(path: str) -> tuple[str, Callable[[PolicyInput], Any]]:
+    parts = path.split(".")
+    if not all(parts):
+        raise ValueError(f"Invalid field path {path!r}")
+    head, rest = parts[0], tuple(parts[1:])
+
+    if not rest:
+        return head, lambda policy_input: getattr(policy_input, head, None)
+    if len(rest) == 1:
+        (part,) = rest
+
+        def get_one(policy_input: PolicyInput) -> Any:
+            value = getattr(policy_input, head, None)
+            if value is None:
+                return None
+            if type(value) is dict:
+                return value.get(part)
+            if isinstance(value, Mapping):
+                return value.get(part)
+            return getattr(value, part, None)
+
+        return head, get_one
+
+    def get(policy_input: PolicyInput) -> Any:
+        value = getattr(policy_input, head, None)
+        for part in rest:
+            if value is None:
+                return None
+            if isinstance(value, Mapping):
+                value = value.get(part)
+            else:
+                value = getattr(value, part, None)
+        return value
+
+    return head, get
+
+
+def _elements(value: Any) -> Iterable[Any]:
+    """Items of a collection; a string or other scalar is a single item."""
+
+    if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+        return (value,)
+    return value
+
+
+class _Compiler:
+    def __init__(self, params: Mapping[str, Any], wanted: set[str]) -> None:
+        self.params = params
+        self.wanted = wanted
+        self.reads: set[str] = set()
+        self.aliases: set[str] = set()
+
+    def operand(self, value: Any) -> Any:
+        if isinstance(value, str) and value.startswith("$"):
+            name = value[1:]
+            if name not in self.params:
+                raise ValueError(f"Unknown policy parameter {value!r}")
+            return self.params[name]
+        return value
+
+    def condition(self, spec: Any, alias: str | None = None) -> Condition:
+        if not isinstance(spec, Mapping):
+            raise ValueError(f"Checks must be mappings, got {spec!r}")
+        if "all" in spec or "any" in spec:
+            combine = all if "all" in spec else any
+            items = spec["all"] if "all" in spec else spec["any"]
+            if not isinstance(items, Sequence) or isinstance(items, str) or not items:
+                raise ValueError("'all'/'any' need a non-empty list of checks")
+            parts = tuple(self.condition(item) for item in items)
+            return lambda policy_input, env: combine(
+                part(policy_input, env) for part in parts
+            )
+        if "not" in spec:
+            inner = self.condition(spec["not"])
+            return lambda policy_input, env: not inner(policy_input, env)
+        return self.comparison(spec, alias)
+
+    def comparison(self, spec: Mapping[str, Any], alias: str | None) -> Condition:
+        if "field" not in spec:
+            raise ValueError(f"Check {dict(spec)!r} needs a 'field'")
+        ops = [key for key in spec if key in _OPERATORS]
+        if len(ops) != 1:
+            raise ValueError(
+                f"Check on {spec['field']!r} needs exactly one of "
+                + ", ".join(_OPERATORS)
+            )
+        op = ops[0]
+        head, get = _getter(str(spec["field"]))
+        self.reads.add(head)
+        default = spec.get("default")
+        alias = spec.get("as", alias)
+        if alias is not None:
+            self.aliases.add(alias)
+            if alias not in self.wanted:
+                alias = None
+        operand = self.operand(spec[op])
+
+        coerce = op in _ORDERING
+        test: Callable[[Any], bool]
+        if coerce:
+            # ``value <= limit`` is ``limit >= value``: a bound float method.
+            test = getattr(float(operand), _REFLECTED[op])
+        elif op in _EQUALITY:
+            expected, compare = operand, _EQUALITY[op]
+
+            def test(value: Any) -> bool:
+                return compare(value, expected)
+
+        else:
+            if isinstance(operand, str) or not isinstance(operand, Sequence):
+                raise ValueError(f"'{op}' on {spec['field']!r} needs a list")
+            members = frozenset(operand)
+            # Unhashable values cannot be looked up, so their checks fail.
+            if op == "in":
+
+                def test(value: Any) -> bool:
+                    try:
+                        return value in members
+                    except TypeError:
+                        return False
+
+            elif op == "not_in":
+
+                def test(value: Any) -> bool:
+                    try:
+                        return value not in members
+                    except TypeError:
+                        return False
+
+            elif op == "intersects":
+
+                def test(value: Any) -> bool:
+                    try:
+                        return not members.isdisjoint(_elements(value))
+                    except TypeError:
+                        return False
+
+            else:
+
+                def test(value: Any) -> bool:
+                    try:
+                        return members.isdisjoint(_elements(value))
+                    except TypeError:
+                        return False
+
+        if alias is None:
+
+            def check(policy_input: PolicyInput, env: dict[str, Any]) -> bool:
+                value = get(policy_input)
+                if value is None:
+                    if default is None:
+                        return False
+                    value = default
+                return test(float(value) if coerce else value)
+
+        else:
+
+            def check(policy_input: PolicyInput, env: dict[str, Any]) -> bool:
+                value = get(policy_input)
+                if value is None:
+                    value = default
+                if value is None:
+                    env[alias] = None
+                    return False
+                if coerce:
+                    value = float(value)
+                env[alias] = value
+                return test(value)
+
+        return check
+
+
+def _template_fields(template: str) -> set[str]:
+    fields = set()
+    for _, field, _, _ in Formatter().parse(template):
+        if field is not None:
+            fields.add(field.split(".")[0].split("[")[0])
+    return fields
+
+
+def _compile_template(
+    template: str, constants: Mapping[str, Any], bound: set[str]
+) -> Callable[[dict[str, Any]], str]:
+    """Render constant fields of ``template`` now and the rest per evaluation."""
+
+    Part = str | Callable[[dict[str, Any]], str]
+    parts: list[Part] = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if literal:
+            parts.append(literal)
+        if field is None:
+            continue
+        root = field.split(".")[0].split("[")[0]
+        piece = "{" + field
+        piece += f"!{conversion}" if conversion else ""
+        piece += f":{spec}" if spec else ""
+        piece += "}"
+        if root in constants and root not in bound:
+            parts.append(piece.format_map(constants))
+        elif field == root and not conversion and "{" not in (spec or ""):
+
+            def render(
+                env: dict[str, Any], name: str = field, format_spec: str = spec or ""
+            ) -> str:
+                return format(env[name], format_spec)
+
+            parts.append(render)
+        else:
+            parts.append(piece.format_map)
+    merged: list[Part] = []
+    for part in parts:
+        if merged and isinstance(part, str) and isinstance(merged[-1], str):
+            merged[-1] += part
+        else:
+            merged.append(part)
+
+    dynamic = [part for part in merged if not isinstance(part, str)]
+    if not dynamic:
+        text = "".join(part for part in merged if isinstance(part, str))
+        return lambda env: text
+    if len(dynamic) == 1:
+        index = merged.index(dynamic[0])
+        prefix = "".join(part for part in merged[:index] if isinstance(part, str))
+        suffix = "".join(part for part in merged[index + 1 :] if isinstance(part, str))
+        field_part = dynamic[0]
+        return lambda env: prefix + field_part(env) + suffix
+    return lambda env: "".join(
+        part if isinstance(part, str) else part(env) for part in merged
+    )
+
+
+def compile_rule(
+    spec: Mapping[str, Any], params: Mapping[str, Any] | None = None
+) -> Policy:
+    """Compile one rule into a :class:`Policy` with a precompiled checker.
+
+    ``pass`` and ``fail`` are :meth:`str.format` templates for the decision
+    reason. They may reference ``policies`` parameters and values bound with
+    ``as``. A rule whose check is a single comparison also binds ``value``
+    (the field) and ``limit`` (the operand). Names bound in a short-circuited
+    branch render as ``n/a``. ``severity`` applies to failing decisions, and
+    ``metadata`` lists bound names to copy into every decision.
+
+    A comparison on a missing field fails unless it declares a ``default``.
+    Ordering comparisons (``lt``, ``le``, ``gt``, ``ge``) coerce the value to
+    ``float``.
+    """
+
+    params = dict(params or {})
+    name = spec.get("name")
+    if not name:
+        raise ValueError(f"Rule {dict(spec)!r} needs a 'name'")
+    if "check" not in spec:
+        raise ValueError(f"Rule {name!r} needs a 'check'")
+    passed_template = str(spec.get("pass", f"{name} passed"))
+    failed_template = str(spec.get("fail", f"{name} failed"))
+    severity = spec.get("severity", "info")
+    if severity not in _SEVERITIES:
+        raise ValueError(f"Rule {name!r} has unknown severity {severity!r}")
+    metadata_keys = tuple(spec.get("metadata", ()))
+
+    check_spec = spec["check"]
+    single = isinstance(check_spec, Mapping) and "field" in check_spec
+    wanted = (
+        _template_fields(passed_template)
+        | _template_fields(failed_template)
+        | set(metadata_keys)
+    )
+    compiler = _Compiler(params, wanted)
+    condition = compiler.condition(check_spec, alias="value" if single else None)
+    constants: dict[str, Any] = dict(params)
+    if single:
+        op = next(key for key in check_spec if key in _OPERATORS)
+        constants["limit"] = compiler.operand(check_spec[op])
+    unknown = wanted - compiler.aliases - set(constants)
+    if unknown:
+        raise ValueError(
+            f"Rule {name!r} references unknown names: {', '.join(sorted(unknown))}"
+        )
+    clashes = compiler.aliases & set(constants)
+    if clashes:
+        raise ValueError(
+            f"Rule {name!r} binds names that shadow parameters: "
+            + ", ".join(sorted(clashes))
+        )
+
+    passed_reason = _compile_template(passed_template, constants, compiler.aliases)
+    failed_reason = _compile_template(failed_template, constants, compiler.aliases)
+
+    bindings = type(
+        "_RuleBindings", (_Bindings,), {"__slots__": (), "constants": constants}
+    )
+    # Without templated names or metadata nothing is bound, so evaluation
+    # can share one read-only mapping.
+    shared = bindings()
+    failed_options = {} if severity == "info" else {"severity": severity}
+
+    if metadata_keys:
+
+        def checker(policy_input: PolicyInput) -> Decision:
+            env = bindings()
+            passed = condition(policy_input, env)
+            reason = passed_reason(env) if passed else failed_reason(env)
+            return Decision(
+                name=name,
+                passed=passed,
+                reason=reason,
+                metadata={key: env.get(key) for key in metadata_keys},
+                **({} if passed else failed_options),
+            )
+
+    else:
+
+        def checker(policy_input: PolicyInput) -> Decision:
+            env = bindings() if wanted else shared
+            if condition(policy_input, env):
+                return Decision(name=name, passed=True, reason=passed_reason(env))
+            return Decision(
+                name=name, passed=False, reason=failed_reason(env), **failed_options
+            )
+
+    return Policy(
+        str(name),
+        str(spec.get("description", "")),
+        checker,
+        cost=1e-6,
+        reads=tuple(sorted(compiler.reads)),
+    )
+
+
+def compile_policies(document: Mapping[str, Any]) -> list[Policy]:
+    """Compile every rule of a policy document, in document order."""
+
+    params = document.get("policies") or {}
+    rules = document.get("rules") or []
+    if not isinstance(params, Mapping):
+        raise ValueError("'policies' must map parameter names to values")
+    if not isinstance(rules, list):
+        raise ValueError("'rules' must be a list")
+    policies = [compile_rule(rule, params) for rule in rules]
+    names = [policy.name for policy in policies]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate rule names: {', '.join(duplicates)}")
+    return policies
+
+
+def load_policies(path: str | Path) -> list[Policy]:
+    """Load and compile the rules of a YAML policy document."""
+
+    source = Path(path)
+    try:
+        import yaml
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "Loading policy rules from YAML requires PyYAML. "
+            'Install it with `pip install "pyyaml>=6"`.'
+        ) from exc
+    document = yaml.safe_load(source.read_text(encoding="utf-8")) or {}
+    if not isinstance(document, Mapping):
+        raise ValueError(f"{source} must contain a mapping")
+    try:
+        return compile_policies(document)
+    except ValueError as exc:
+        raise ValueError(f"{source}: {exc}") from exc
+
+
+__all__ = ["compile_policies", "compile_rule", "load_policies"]
@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
-from collections.abc import (
-    Iterable,
-    Mapping,
-    MutableMapping,
-    MutableSequence,
-    Sequence,
-)
-from copy import deepcopy
-from typing import Any
+import asyncio
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from threading import Event, Lock
+import time
+from typing import Any, TYPE_CHECKING
 
 from naestro.core.bus import MessageBus
 
+from .cache import DecisionCache
+from .patching import apply_patches, PlanPatcher
+from .planning import EvaluationPlan
 from .policies import PolicyLike
 from .schemas import Decision, PolicyInput, PolicyPatch
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from types import ModuleType
+
+_batch: ModuleType | None
+try:  # pragma: no cover - depends on the optional numpy install
+    from . import batch as _batch
+except RuntimeError:  # pragma: no cover - numpy missing
+    _batch = None
+
 
 class _NullBus:
     """Fallback bus used when :mod:`jsonschema` is not available."""
@@ -26,21 +36,110 @@ class _NullBus:
     ) -> None:
         return None
 
+    def has_subscribers(self, event: str) -> bool:  # pragma: no cover - trivial
+        return False
+
+
+class _PolicyRun:
+    """One policy evaluation on the worker pool, timed from when it starts."""
+
+    __slots__ = ("policy", "future", "started", "_call", "_began")
+
+    def __init__(self, policy: PolicyLike, call: Callable[[], Decision]) -> None:
+        self.policy = policy
+        self.future: Future[Decision] | None = None
+        self.started = 0.0
+        self._call = call
+        self._began = Event()
+
+    def submit(self, executor: ThreadPoolExecutor) -> None:
+        self._began.clear()
+        self.future = executor.submit(self._run)
+        # Also wake waiters if the call is cancelled before it starts.
+        self.future.add_done_callback(lambda _: self._began.set())
+
+    def _run(self) -> Decision:
+        self.started = time.monotonic()
+        self._began.set()
+        return self._call()
+
+    def result(self, timeout: float | None) -> Decision:
+        """Wait for the decision, allowing ``timeout`` seconds once it starts.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the call overruns.
+        """
+
+        assert self.future is not None
+        if timeout is None:
+            return self.future.result()
+        self._began.wait()
+        remaining = self.started + timeout - time.monotonic()
+        return self.future.result(max(0.0, remaining))
+
 
 def _coerce_input(data: PolicyInput | Mapping[str, Any]) -> PolicyInput:
+    # A shallow copy suffices: policies only read the input, and patching
+    # replaces ``plan`` on the copy instead of mutating the caller's plan.
     if isinstance(data, PolicyInput):
-        return data.model_copy(deep=True)
+        return data.model_copy()
     return PolicyInput.model_validate(data)
 
 
 class Governor:
-    """Evaluates inputs against a set of registered policies."""
+    """Evaluates inputs against a set of registered policies.
+
+    Policies run one after another by default. With ``concurrent=True`` they
+    are evaluated on a thread pool of ``max_workers`` threads, and
+    :meth:`aevaluate`/:meth:`aenforce` run them as asyncio tasks, awaiting a
+    policy's ``aevaluate`` coroutine when it defines one. Decisions are always
+    returned in registration order. Concurrently evaluated policies share one
+    :class:`PolicyInput` and must not mutate it.
+
+    Policies must treat the :class:`PolicyInput` as read-only; it shares its
+    nested values with the caller's input.
+
+    ``timeout`` bounds each policy's evaluation in seconds; a policy may
+    override it, and ``fail_open``, with attributes of the same name. The
+    clock starts when the policy begins running, not while it waits for a
+    worker, and without ``concurrent`` timed policies still run one at a time.
+    A policy that overruns yields a passing ``warning`` decision when failing
+    open and a failing ``critical`` one otherwise. Synchronous policies cannot
+    be interrupted, so an overrunning call keeps its worker thread until it
+    returns; the governor moves later work to a fresh pool rather than queue
+    it behind that thread.
+
+    With an :class:`EvaluationPlan`, policies are evaluated cheapest first and
+    their measured latency is fed back into the plan. ``fail_fast`` stops at
+    the first ``critical`` failure: the remaining policies are skipped, left
+    out of the returned decisions and listed under ``skipped`` in the
+    ``governor.evaluated`` event. Patching policies keep registration order,
+    since each one sees the plan produced by its predecessors.
+
+    A :class:`DecisionCache` memoises the decisions of policies that declare
+    the input fields they read, so re-evaluating an unchanged input costs a
+    fingerprint and a lookup. Cache hits are not fed into the plan's latency
+    averages.
+
+    The ``governor.evaluated`` payload is only built when it will be
+    delivered. With ``publish_unobserved=False`` it is also skipped when the
+    bus has neither subscribers for the event nor middleware, which keeps the
+    bus journal free of unobserved evaluations.
+    """
 
     def __init__(
         self,
         policies: Sequence[PolicyLike] | None = None,
         *,
         bus: MessageBus | None = None,
+        concurrent: bool = False,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        fail_open: bool = False,
+        plan: EvaluationPlan | None = None,
+        fail_fast: bool = False,
+        publish_unobserved: bool = True,
+        cache: DecisionCache | None = None,
     ) -> None:
         self._policies: list[PolicyLike] = list(policies or [])
         if bus is not None:
@@ -50,6 +149,26 @@ class Governor:
                 self._bus = MessageBus()
             except RuntimeError:
                 self._bus = _NullBus()
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive")
+        self._concurrent = concurrent
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._fail_open = fail_open
+        self._plan = plan
+        self._fail_fast = fail_fast
+        self._publish_unobserved = publish_unobserved
+        self._cache = cache
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = Lock()
+
+    @property
+    def plan(self) -> EvaluationPlan | None:
+        return self._plan
+
+    @property
+    def cache(self) -> DecisionCache | None:
+        return self._cache
 
     def register(self, policy: PolicyLike) -> None:
         self._policies.append(policy)
@@ -57,11 +176,81 @@ class Governor:
     def clear(self) -> None:
         self._policies.clear()
 
-    def evaluate(
-        self, data: PolicyInput | Mapping[str, Any]
-    ) -> list[Decision]:
+    def close(self) -> None:
+        """Shut down the worker pool used for concurrent or timed evaluation."""
+
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def __enter__(self) -> Governor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def evaluate(self, data: PolicyInput | Mapping[str, Any]) -> list[Decision]:
         policy_input = _coerce_input(data)
-        return [policy.evaluate(policy_input) for policy in self._policies]
+        results, _ = self._evaluate_policies(self._policies, policy_input)
+        return results
+
+    async def aevaluate(self, data: PolicyInput | Mapping[str, Any]) -> list[Decision]:
+        """Evaluate every policy as a concurrent asyncio task."""
+
+        policy_input = _coerce_input(data)
+        results, _ = await self._aevaluate_policies(self._policies, policy_input)
+        return results
+
+    def evaluate_batch(
+        self, inputs: Iterable[PolicyInput | Mapping[str, Any]]
+    ) -> list[list[Decision]]:
+        """Evaluate many inputs at once and publish one aggregated event.
+
+        Policies with an ``evaluate_many`` method receive the whole batch as
+        :class:`~naestro.governance.batch.PolicyColumns` when numpy is
+        installed; the others are evaluated input by input, through the
+        decision cache when one is configured. Every policy runs for every
+        input: ``fail_fast``, timeouts and concurrency apply to the single-input
+        methods only. Inputs are read in place rather than copied.
+
+        Returns one list of decisions per input, in registration order, and
+        publishes ``governor.batch_evaluated`` with the per-input approvals and
+        failure counts per policy.
+        """
+
+        batch = [
+            data if isinstance(data, PolicyInput) else PolicyInput.model_validate(data)
+            for data in inputs
+        ]
+        results: list[list[Decision]] = [[] for _ in batch]
+        columns = _batch.PolicyColumns(batch) if _batch is not None else None
+        for policy in self._policies:
+            evaluate_many = getattr(policy, "evaluate_many", None)
+            if columns is not None and evaluate_many is not None:
+                decisions = evaluate_many(columns)
+                if len(decisions) != len(batch):
+                    raise ValueError(
+                        f"Policy {policy.name!r} returned {len(decisions)} "
+                        f"decisions for {len(batch)} inputs"
+                    )
+            else:
+                decisions = [self._evaluate_policy(policy, item) for item in batch]
+            for row, decision in zip(results, decisions):
+                row.append(decision)
+        if self._observed("governor.batch_evaluated"):
+            failures: dict[str, int] = {}
+            for row in results:
+                for decision in row:
+                    if not decision.passed:
+                        failures[decision.name] = failures.get(decision.name, 0) + 1
+            payload = {
+                "count": len(batch),
+                "approved": [all(d.passed for d in row) for row in results],
+                "failures": failures,
+            }
+            self._bus.publish("governor.batch_evaluated", payload)
+        return results
 
     def enforce(
         self,
@@ -69,120 +258,291 @@ class Governor:
         *,
         apply_policy_patches: bool = False,
         return_input: bool = False,
-    ) -> (
-        tuple[bool, list[Decision]]
-        | tuple[bool, list[Decision], PolicyInput]
-    ):
+    ) -> tuple[bool, list[Decision]] | tuple[bool, list[Decision], PolicyInput]:
         policy_input = _coerce_input(data)
-        plan = deepcopy(policy_input.plan)
-        results: list[Decision] = []
-        for policy in self._policies:
-            decision = policy.evaluate(policy_input)
+        if not apply_policy_patches:
+            results, skipped = self._evaluate_policies(self._policies, policy_input)
+            return self._publish(policy_input, results, skipped, return_input)
+        # Patching policies run serially: each one sees its predecessors' plan.
+        patcher = PlanPatcher(policy_input.plan)
+        results = []
+        for index, policy in enumerate(self._policies):
+            (decision,), _ = self._evaluate_policies([policy], policy_input)
+            results.append(decision)
+            if self._stops(decision):
+                skipped = self._skip(self._policies[index + 1 :])
+                return self._publish(policy_input, results, skipped, return_input)
+            if decision.patches:
+                policy_input.plan = patcher.apply(decision.patches)
+        return self._publish(policy_input, results, [], return_input)
+
+    async def aenforce(
+        self,
+        data: PolicyInput | Mapping[str, Any],
+        *,
+        apply_policy_patches: bool = False,
+        return_input: bool = False,
+    ) -> tuple[bool, list[Decision]] | tuple[bool, list[Decision], PolicyInput]:
+        """Asynchronous :meth:`enforce`; patching still runs serially."""
+
+        policy_input = _coerce_input(data)
+        if not apply_policy_patches:
+            results, skipped = await self._aevaluate_policies(
+                self._policies, policy_input
+            )
+            return self._publish(policy_input, results, skipped, return_input)
+        patcher = PlanPatcher(policy_input.plan)
+        results = []
+        for index, policy in enumerate(self._policies):
+            decision = await self._aevaluate_policy(policy, policy_input)
             results.append(decision)
-            if apply_policy_patches and decision.patches:
-                plan = apply_patches(plan, decision.patches)
-                policy_input.plan = plan
+            if self._stops(decision):
+                skipped = self._skip(self._policies[index + 1 :])
+                return self._publish(policy_input, results, skipped, return_input)
+            if decision.patches:
+                policy_input.plan = patcher.apply(decision.patches)
+        return self._publish(policy_input, results, [], return_input)
+
+    def _publish(
+        self,
+        policy_input: PolicyInput,
+        results: list[Decision],
+        skipped: list[str],
+        return_input: bool,
+    ) -> tuple[bool, list[Decision]] | tuple[bool, list[Decision], PolicyInput]:
         allowed = all(result.passed for result in results)
-        payload = {
-            "input": policy_input.model_dump(),
-            "results": [result.model_dump() for result in results],
-            "approved": allowed,
-        }
-        self._bus.publish("governor.evaluated", payload)
+        if self._observed("governor.evaluated"):
+            payload: dict[str, Any] = {
+                "input": policy_input.model_dump(),
+                "results": [result.model_dump() for result in results],
+                "approved": allowed,
+            }
+            if skipped:
+                payload["skipped"] = skipped
+            self._bus.publish("governor.evaluated", payload)
         if return_input:
             return allowed, results, policy_input
         return allowed, results
 
+    def _observed(self, event: str) -> bool:
+        has_subscribers = getattr(self._bus, "has_subscribers", None)
+        if has_subscribers is None:
+            return True
+        if isinstance(self._bus, _NullBus) or not self._publish_unobserved:
+            return bool(has_subscribers(event))
+        return True
+
+    def _order(self, policies: Sequence[PolicyLike]) -> list[int]:
+        if self._plan is None or len(policies) < 2:
+            return list(range(len(policies)))
+        return self._plan.order(policies)
+
+    def _stops(self, decision: Decision) -> bool:
+        return (
+            self._fail_fast and not decision.passed and decision.severity == "critical"
+        )
+
+    def _skip(
+        self,
+        policies: Sequence[PolicyLike],
+        cancelled: Sequence[PolicyLike] | None = None,
+    ) -> list[str]:
+        """Name the skipped ``policies``; only ``cancelled`` ones count as skipped.
+
+        ``cancelled`` defaults to all of ``policies``. Concurrent evaluation
+        passes the runs it actually stopped, so calls that had already
+        finished are not recorded against the plan.
+        """
+
+        cancelled = policies if cancelled is None else cancelled
+        if self._plan is not None and cancelled:
+            self._plan.record_skipped(cancelled)
+        return [policy.name for policy in policies]
+
+    def _collect(
+        self,
+        policies: Sequence[PolicyLike],
+        slots: list[Decision | None],
+        order: list[int],
+        cancelled: Sequence[PolicyLike] | None = None,
+    ) -> tuple[list[Decision], list[str]]:
+        missing = [policies[index] for index in order if slots[index] is None]
+        results = [decision for decision in slots if decision is not None]
+        return results, self._skip(missing, cancelled)
+
+    def _evaluate_policy(
+        self, policy: PolicyLike, policy_input: PolicyInput
+    ) -> Decision:
+        cache = self._cache
+        key = None
+        if cache is not None:
+            key = cache.key_for(policy, policy_input)
+            cached = None if key is None else cache.get(key, policy)
+            if cached is not None:
+                return cached
+        if self._plan is None:
+            decision = policy.evaluate(policy_input)
+        else:
+            started = time.perf_counter()
+            decision = policy.evaluate(policy_input)
+            self._plan.observe(policy, time.perf_counter() - started)
+        if cache is not None and key is not None:
+            cache.put(key, policy, decision)
+        return decision
+
+    def _timeout_for(self, policy: PolicyLike) -> float | None:
+        timeout = getattr(policy, "timeout", None)
+        return self._timeout if timeout is None else float(timeout)
+
+    def _timed_out(self, policy: PolicyLike, timeout: float) -> Decision:
+        fail_open = getattr(policy, "fail_open", None)
+        if fail_open is None:
+            fail_open = self._fail_open
+        outcome = "open" if fail_open else "closed"
+        return Decision(
+            name=policy.name,
+            passed=bool(fail_open),
+            reason=f"Evaluation timed out after {timeout:g}s; failing {outcome}",
+            severity="warning" if fail_open else "critical",
+            metadata={"timed_out": True, "timeout": timeout, "fail_open": fail_open},
+        )
+
+    def _evaluate_policies(
+        self, policies: Sequence[PolicyLike], policy_input: PolicyInput
+    ) -> tuple[list[Decision], list[str]]:
+        """Evaluate ``policies`` in plan order, honouring ``fail_fast``.
 
-def _ensure_container(
-    container: Any,
-    key: str | int,
-    *,
-    create: bool,
-) -> Any:
-    if isinstance(key, int):
-        if not isinstance(container, MutableSequence):
-            raise TypeError("Expected a sequence for integer path segments")
-        if key >= len(container):
-            if not create:
-                raise IndexError(f"Index {key} out of range for patch path")
-            while len(container) <= key:
-                container.append({})
-        return container[key]
-    if not isinstance(container, MutableMapping):
-        raise TypeError("Expected a mapping for string path segments")
-    if key not in container:
-        if not create:
-            raise KeyError(f"Missing key {key!r} in patch path")
-        container[key] = {}
-    return container[key]
-
-
-def _assign(container: Any, key: str | int, value: Any) -> None:
-    if isinstance(key, int):
-        if not isinstance(container, MutableSequence):
-            raise TypeError("Expected a sequence for integer assignment")
-        if key == len(container):
-            container.append(value)
-            return
-        if key >= len(container):
-            raise IndexError(f"Index {key} out of range for assignment")
-        container[key] = value
-        return
-    if not isinstance(container, MutableMapping):
-        raise TypeError("Expected a mapping for string assignment")
-    container[key] = value
-
-
-def _remove(container: Any, key: str | int) -> None:
-    if isinstance(key, int):
-        if not isinstance(container, MutableSequence):
-            raise TypeError("Expected a sequence for integer removal")
-        if not (-len(container) <= key < len(container)):
-            raise IndexError(f"Index {key} out of range for removal")
-        del container[key]
-        return
-    if not isinstance(container, MutableMapping):
-        raise TypeError("Expected a mapping for string removal")
-    container.pop(key, None)
-
-
-def apply_patches(
-    plan: Mapping[str, Any], patches: Iterable[PolicyPatch]
-) -> dict[str, Any]:
-    """Apply a collection of declarative patches to the supplied plan."""
-
-    result: Any = deepcopy(plan)
-    for patch in patches:
-        path = list(patch.get("path", ()))
-        if not path:
-            raise ValueError("Patch operations require a non-empty path")
-        op = patch.get("op", "set")
-        value = deepcopy(patch.get("value")) if "value" in patch else None
-        current = result
-        for segment in path[:-1]:
-            current = _ensure_container(
-                current, segment, create=op in {"set", "merge"}
+        Returns the decisions in registration order and the names of the
+        policies skipped after a critical failure.
+        """
+
+        order = self._order(policies)
+        slots: list[Decision | None] = [None] * len(policies)
+        timeouts = [self._timeout_for(policy) for policy in policies]
+        if not (self._concurrent and len(policies) > 1):
+            for index in order:
+                policy, timeout = policies[index], timeouts[index]
+                if timeout is None:
+                    decision = self._evaluate_policy(policy, policy_input)
+                else:
+                    run = self._policy_run(policy, policy_input)
+                    self._submit([run])
+                    decision = self._await(run, timeout, [])
+                slots[index] = decision
+                if self._stops(decision):
+                    break
+            return self._collect(policies, slots, order)
+        runs = [self._policy_run(policies[index], policy_input) for index in order]
+        self._submit(runs)
+        for position, index in enumerate(order):
+            decision = self._await(
+                runs[position], timeouts[index], runs[position + 1 :]
             )
-        final_segment = path[-1]
-        if op == "set":
-            _assign(current, final_segment, value)
-        elif op == "remove":
-            _remove(current, final_segment)
-        elif op == "merge":
-            target = _ensure_container(current, final_segment, create=True)
-            if not isinstance(target, MutableMapping):
-                raise TypeError("Merge operations require a mapping target")
-            if value is None:
-                continue
-            if not isinstance(value, Mapping):
-                raise TypeError("Merge values must be mappings")
-            target.update(value)
-        else:  # pragma: no cover - defensive programming
-            raise ValueError(f"Unsupported patch operation: {op!r}")
-    if isinstance(result, MutableMapping):
-        return dict(result)
-    return result
+            slots[index] = decision
+            if self._stops(decision):
+                cancelled = [
+                    pending.policy
+                    for pending in runs[position + 1 :]
+                    if pending.future is None or pending.future.cancel()
+                ]
+                return self._collect(policies, slots, order, cancelled)
+        return self._collect(policies, slots, order)
+
+    def _policy_run(self, policy: PolicyLike, policy_input: PolicyInput) -> _PolicyRun:
+        return _PolicyRun(policy, lambda: self._evaluate_policy(policy, policy_input))
+
+    def _submit(self, runs: Sequence[_PolicyRun]) -> None:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="governor"
+                )
+            for run in runs:
+                run.submit(self._executor)
+
+    def _await(
+        self, run: _PolicyRun, timeout: float | None, queued: Sequence[_PolicyRun]
+    ) -> Decision:
+        try:
+            return run.result(timeout)
+        except FutureTimeoutError:
+            assert run.future is not None and timeout is not None
+            if not run.future.cancel() and not run.future.done():
+                self._retire_executor(queued)
+            return self._timed_out(run.policy, timeout)
+
+    def _retire_executor(self, queued: Sequence[_PolicyRun]) -> None:
+        """Replace the pool held up by an overrunning call.
+
+        Runs in ``queued`` that have not started are moved to the new pool in
+        order; the old pool's threads exit once their calls return.
+        """
+
+        with self._executor_lock:
+            stale = self._executor
+            self._executor = None
+        moved = [run for run in queued if run.future is None or run.future.cancel()]
+        self._submit(moved)
+        if stale is not None:
+            stale.shutdown(wait=False)
+
+    async def _aevaluate_policies(
+        self, policies: Sequence[PolicyLike], policy_input: PolicyInput
+    ) -> tuple[list[Decision], list[str]]:
+        order = self._order(policies)
+        slots: list[Decision | None] = [None] * len(policies)
+        tasks = {
+            index: asyncio.ensure_future(
+                self._aevaluate_policy(policies[index], policy_input)
+            )
+            for index in order
+        }
+        cancelled: list[PolicyLike] = []
+        try:
+            for index in order:
+                decision = await tasks[index]
+                slots[index] = decision
+                if self._stops(decision):
+                    break
+        finally:
+            for index, task in tasks.items():
+                if not task.done():
+                    task.cancel()
+                    cancelled.append(policies[index])
+                elif not task.cancelled():
+                    task.exception()  # mark skipped failures as retrieved
+        return self._collect(policies, slots, order, cancelled)
+
+    async def _aevaluate_policy(
+        self, policy: PolicyLike, policy_input: PolicyInput
+    ) -> Decision:
+        cache = self._cache
+        key = None
+        if cache is not None:
+            key = cache.key_for(policy, policy_input)
+            cached = None if key is None else cache.get(key, policy)
+            if cached is not None:
+                return cached
+        evaluate_async = getattr(policy, "aevaluate", None)
+        if evaluate_async is not None:
+            call = evaluate_async(policy_input)
+        else:
+            call = asyncio.to_thread(policy.evaluate, policy_input)
+        timeout = self._timeout_for(policy)
+        started = time.perf_counter()
+        decision: Decision
+        if timeout is None:
+            decision = await call
+        else:
+            try:
+                decision = await asyncio.wait_for(call, timeout)
+            except asyncio.TimeoutError:
+                return self._timed_out(policy, timeout)
+        if self._plan is not None:
+            self._plan.observe(policy, time.perf_counter() - started)
+        if cache is not None and key is not None:
+            cache.put(key, policy, decision)
+        return decision
 
 
 __all__ = ["Decision", "Governor", "PolicyInput", "PolicyPatch", "apply_patches"]
@@ -0,0 +1,344 @@
+"""Declarative plan patches: application, structural sharing and conflicts."""
+
+from __future__ import annotations
+
+from collections.abc import (
+    Hashable,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Sequence,
+)
+from copy import copy, deepcopy
+from typing import Any
+
+from .schemas import PolicyPatch
+
+_OPERATIONS = frozenset({"set", "remove", "merge"})
+
+
+class PatchConflictError(ValueError):
+    """Raised when patches in one batch would depend on their order."""
+
+    def __init__(self, conflicts: Sequence[tuple[PolicyPatch, PolicyPatch]]) -> None:
+        first, second = conflicts[0]
+        super().__init__(
+            f"{len(conflicts)} conflicting patch pair(s), first between "
+            f"{first.get('op', 'set')} {list(first.get('path', ()))} and "
+            f"{second.get('op', 'set')} {list(second.get('path', ()))}"
+        )
+        self.conflicts = list(conflicts)
+
+
+def _ensure_container(
+    container: Any,
+    key: str | int,
+    *,
+    create: bool,
+) -> Any:
+    if isinstance(key, int):
+        if not isinstance(container, MutableSequence):
+            raise TypeError("Expected a sequence for integer path segments")
+        if key >= len(container):
+            if not create:
+                raise IndexError(f"Index {key} out of range for patch path")
+            while len(container) <= key:
+                container.append({})
+        return container[key]
+    if not isinstance(container, MutableMapping):
+        raise TypeError("Expected a mapping for string path segments")
+    if key not in container:
+        if not create:
+            raise KeyError(f"Missing key {key!r} in patch path")
+        container[key] = {}
+    return container[key]
+
+
+def _assign(container: Any, key: str | int, value: Any) -> None:
+    if isinstance(key, int):
+        if not isinstance(container, MutableSequence):
+            raise TypeError("Expected a sequence for integer assignment")
+        if key == len(container):
+            container.append(value)
+            return
+        if key >= len(container):
+            raise IndexError(f"Index {key} out of range for assignment")
+        container[key] = value
+        return
+    if not isinstance(container, MutableMapping):
+        raise TypeError("Expected a mapping for string assignment")
+    container[key] = value
+
+
+def _remove(container: Any, key: str | int) -> None:
+    if isinstance(key, int):
+        if not isinstance(container, MutableSequence):
+            raise TypeError("Expected a sequence for integer removal")
+        if not (-len(container) <= key < len(container)):
+            raise IndexError(f"Index {key} out of range for removal")
+        del container[key]
+        return
+    if not isinstance(container, MutableMapping):
+        raise TypeError("Expected a mapping for string removal")
+    container.pop(key, None)
+
+
+def apply_patches(
+    plan: Mapping[str, Any], patches: Iterable[PolicyPatch]
+) -> dict[str, Any]:
+    """Apply a collection of declarative patches to the supplied plan."""
+
+    return dict(_patch_in_place(deepcopy(plan), patches))
+
+
+def _patch_in_place(
+    result: Mapping[str, Any], patches: Iterable[PolicyPatch]
+) -> Mapping[str, Any]:
+    for patch in patches:
+        path = list(patch.get("path", ()))
+        if not path:
+            raise ValueError("Patch operations require a non-empty path")
+        op = patch.get("op", "set")
+        value = deepcopy(patch.get("value")) if "value" in patch else None
+        current = result
+        for segment in path[:-1]:
+            current = _ensure_container(current, segment, create=op in {"set", "merge"})
+        final_segment = path[-1]
+        if op == "set":
+            _assign(current, final_segment, value)
+        elif op == "remove":
+            _remove(current, final_segment)
+        elif op == "merge":
+            target = _ensure_container(current, final_segment, create=True)
+            if not isinstance(target, MutableMapping):
+                raise TypeError("Merge operations require a mapping target")
+            if value is None:
+                continue
+            if not isinstance(value, Mapping):
+                raise TypeError("Merge values must be mappings")
+            target.update(value)
+        else:  # pragma: no cover - defensive programming
+            raise ValueError(f"Unsupported patch operation: {op!r}")
+    return result
+
+
+class PlanPatcher:
+    """Apply patches to a plan, copying only the containers along their paths.
+
+    The caller's plan is never modified. The first patch that reaches a
+    mapping or sequence replaces it with a shallow copy owned by the patcher,
+    and later patches through the same container reuse that copy. Everything
+    else is shared with the original plan, so applying a few patches costs
+    time proportional to their path lengths rather than to the plan size.
+    Shared subtrees must be treated as read-only by whoever holds the result.
+    """
+
+    __slots__ = ("_plan", "_owned")
+
+    def __init__(self, plan: Mapping[str, Any]) -> None:
+        # Other mappings are copied up front so the root is always a dict.
+        self._plan: dict[str, Any] = plan if isinstance(plan, dict) else dict(plan)
+        # Holding the copies keeps their ids from being reused mid-patch.
+        self._owned: dict[int, Any] = {}
+
+    @property
+    def plan(self) -> dict[str, Any]:
+        """The plan with every patch applied so far."""
+
+        return self._plan
+
+    def apply(
+        self, patches: Iterable[PolicyPatch], *, check_conflicts: bool = False
+    ) -> dict[str, Any]:
+        """Apply ``patches`` in order and return the patched plan.
+
+        With ``check_conflicts`` the batch is first checked with
+        :func:`find_conflicts`, and :class:`PatchConflictError` is raised
+        before anything is applied if the outcome would depend on order.
+        """
+
+        batch = tuple(patches)
+        if check_conflicts:
+            conflicts = find_conflicts(batch)
+            if conflicts:
+                raise PatchConflictError(conflicts)
+        for patch in batch:
+            self._apply(patch)
+        return self._plan
+
+    def _own(self, value: Any) -> Any:
+        if id(value) in self._owned:
+            return value
+        kind = type(value)
+        if kind is dict or kind is list:
+            owned = value.copy()
+        elif isinstance(value, (MutableMapping, MutableSequence)):
+            owned = copy(value)
+        else:
+            return value
+        self._owned[id(owned)] = owned
+        return owned
+
+    def _child(self, container: Any, key: str | int, *, create: bool) -> Any:
+        child = _ensure_container(container, key, create=create)
+        owned = self._own(child)
+        if owned is not child:
+            container[key] = owned
+        return owned
+
+    def _apply(self, patch: PolicyPatch) -> None:
+        path = list(patch.get("path", ()))
+        if not path:
+            raise ValueError("Patch operations require a non-empty path")
+        op = patch.get("op", "set")
+        if op not in _OPERATIONS:
+            raise ValueError(f"Unsupported patch operation: {op!r}")
+        value = deepcopy(patch["value"]) if "value" in patch else None
+        current = self._plan = self._own(self._plan)
+        create = op != "remove"
+        for segment in path[:-1]:
+            current = self._child(current, segment, create=create)
+        final_segment = path[-1]
+        if op == "set":
+            _assign(current, final_segment, value)
+        elif op == "remove":
+            _remove(current, final_segment)
+        else:
+            target = self._child(current, final_segment, create=True)
+            if not isinstance(target, MutableMapping):
+                raise TypeError("Merge operations require a mapping target")
+            if value is None:
+                return
+            if not isinstance(value, Mapping):
+                raise TypeError("Merge values must be mappings")
+            target.update(value)
+
+
+def patch_plan(
+    plan: Mapping[str, Any],
+    patches: Iterable[PolicyPatch],
+    *,
+    check_conflicts: bool = True,
+) -> dict[str, Any]:
+    """Return ``plan`` with ``patches`` applied, sharing untouched subtrees.
+
+    The result equals :func:`apply_patches` for the same arguments, but only
+    the containers along patched paths are copied; see :class:`PlanPatcher`.
+    Conflicting patches raise :class:`PatchConflictError` unless
+    ``check_conflicts`` is false.
+    """
+
+    return PlanPatcher(plan).apply(patches, check_conflicts=check_conflicts)
+
+
+def _merge_overlaps(first: Any, second: Any) -> bool:
+    if not isinstance(first, Mapping) or not isinstance(second, Mapping):
+        return first is not None and second is not None
+    return any(first[key] != second[key] for key in first.keys() & second.keys())
+
+
+def _clashes(outer: PolicyPatch, inner: PolicyPatch, depth: int) -> bool:
+    """Whether ``outer``, whose path is ``inner``'s first ``depth`` segments,
+    and ``inner`` give different results when applied in either order."""
+
+    outer_op = outer.get("op", "set")
+    inner_op = inner.get("op", "set")
+    inner_path = inner["path"]
+    if depth == len(inner_path):
+        if outer_op == inner_op == "merge":
+            return _merge_overlaps(outer.get("value"), inner.get("value"))
+        if outer_op == inner_op == "remove":
+            # Removing the same index twice drops two different items.
+            return isinstance(inner_path[-1], int)
+        return outer_op != inner_op or outer.get("value") != inner.get("value")
+    if outer_op == "merge":
+        value = outer.get("value")
+        if value is None:
+            return False
+        return not isinstance(value, Mapping) or inner_path[depth] in value
+    return True
+
+
+def _shifts(removed: int, index: int) -> bool:
+    """Whether removing item ``removed`` moves the item at ``index``."""
+
+    return removed < 0 or index < 0 or index >= removed
+
+
+def find_conflicts(
+    patches: Iterable[PolicyPatch],
+) -> list[tuple[PolicyPatch, PolicyPatch]]:
+    """Return the pairs of ``patches`` whose combined effect depends on order.
+
+    Two patches conflict when one path is a prefix of the other, unless they
+    commute: identical patches, merges of different keys, and a merge beside
+    a patch below a key it does not set. A removal by index also conflicts
+    with patches through the same sequence at or after that index, because it
+    shifts those items, and a negative index conflicts with every other index
+    into the same sequence. Pairs are returned in batch order.
+    """
+
+    at: dict[tuple[Hashable, ...], list[PolicyPatch]] = {}
+    below: dict[tuple[Hashable, ...], list[PolicyPatch]] = {}
+    indexed: dict[tuple[Hashable, ...], list[PolicyPatch]] = {}
+    negative: dict[tuple[Hashable, ...], list[PolicyPatch]] = {}
+    shifting: dict[tuple[Hashable, ...], list[PolicyPatch]] = {}
+    found: dict[tuple[int, int], tuple[PolicyPatch, PolicyPatch]] = {}
+
+    def record(earlier: PolicyPatch, later: PolicyPatch) -> None:
+        found.setdefault((id(earlier), id(later)), (earlier, later))
+
+    for patch in patches:
+        path = tuple(patch.get("path", ()))
+        if not path:
+            continue
+        for depth in range(1, len(path)):
+            for earlier in at.get(path[:depth], ()):
+                if _clashes(earlier, patch, depth):
+                    record(earlier, patch)
+        for earlier in at.get(path, ()):
+            if _clashes(earlier, patch, len(path)):
+                record(earlier, patch)
+        for earlier in below.get(path, ()):
+            if _clashes(patch, earlier, len(path)):
+                record(earlier, patch)
+        for depth, segment in enumerate(path):
+            if not isinstance(segment, int):
+                continue
+            parent = path[:depth]
+            for earlier in shifting.get(parent, ()):
+                removed = earlier["path"][-1]
+                if isinstance(removed, int) and _shifts(removed, segment):
+                    record(earlier, patch)
+            # A negative index may name the same item as any other index.
+            aliases = indexed if segment < 0 else negative
+            for earlier in aliases.get(parent, ()):
+                if earlier["path"][depth] != segment:
+                    record(earlier, patch)
+        if patch.get("op", "set") == "remove" and isinstance(path[-1], int):
+            parent = path[:-1]
+            for earlier in indexed.get(parent, ()):
+                index = earlier["path"][len(parent)]
+                if isinstance(index, int) and _shifts(path[-1], index):
+                    record(earlier, patch)
+            shifting.setdefault(parent, []).append(patch)
+
+        at.setdefault(path, []).append(patch)
+        for depth, segment in enumerate(path):
+            if depth:
+                below.setdefault(path[:depth], []).append(patch)
+            if isinstance(segment, int):
+                indexed.setdefault(path[:depth], []).append(patch)
+                if segment < 0:
+                    negative.setdefault(path[:depth], []).append(patch)
+    return list(found.values())
+
+
+__all__ = [
+    "PatchConflictError",
+    "PlanPatcher",
+    "apply_patches",
+    "find_conflicts",
+    "patch_plan",
+]
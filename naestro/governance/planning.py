@@ -0,0 +1,76 @@
+"""Cost-based ordering of governance policies."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Mapping, Sequence
+import math
+from threading import Lock
+
+from .policies import PolicyLike
+
+
+class EvaluationPlan:
+    """Order policies cheapest first using declared and observed costs.
+
+    A policy declares its expected evaluation time in seconds through a
+    ``cost`` attribute. Once the :class:`Governor` has timed it, an
+    exponentially weighted moving average of the observed latency replaces
+    the declaration. Policies without either sort last, in registration
+    order, until their first observation. Costs are tracked by policy name.
+    """
+
+    def __init__(self, *, alpha: float = 0.2, default_cost: float = math.inf) -> None:
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.default_cost = default_cost
+        self._observed: dict[str, float] = {}
+        self._skipped: Counter[str] = Counter()
+        self._lock = Lock()
+
+    def cost(self, policy: PolicyLike) -> float:
+        """Return the estimated evaluation time of ``policy`` in seconds."""
+
+        observed = self._observed.get(policy.name)
+        if observed is not None:
+            return observed
+        declared = getattr(policy, "cost", None)
+        return self.default_cost if declared is None else float(declared)
+
+    def order(self, policies: Sequence[PolicyLike]) -> list[int]:
+        """Return indices into ``policies`` from cheapest to most expensive."""
+
+        costs = [self.cost(policy) for policy in policies]
+        return sorted(range(len(policies)), key=lambda index: (costs[index], index))
+
+    def observe(self, policy: PolicyLike, seconds: float) -> None:
+        """Fold one measured evaluation time into the policy's average."""
+
+        with self._lock:
+            previous = self._observed.get(policy.name)
+            if previous is None:
+                self._observed[policy.name] = seconds
+            else:
+                self._observed[policy.name] = previous + self.alpha * (
+                    seconds - previous
+                )
+
+    def record_skipped(self, policies: Sequence[PolicyLike]) -> None:
+        with self._lock:
+            self._skipped.update(policy.name for policy in policies)
+
+    @property
+    def observed(self) -> Mapping[str, float]:
+        """Average observed latency per policy name, in seconds."""
+
+        return dict(self._observed)
+
+    @property
+    def skipped(self) -> Mapping[str, int]:
+        """How often each policy was skipped by fail-fast evaluation."""
+
+        return dict(self._skipped)
+
+
+__all__ = ["EvaluationPlan"]
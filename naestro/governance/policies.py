@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Protocol
+from typing import Callable, ClassVar, Protocol, TYPE_CHECKING
 
 from .schemas import Decision, PolicyInput
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .batch import PolicyColumns
+
 PolicyResult = Decision
 """Alias maintained for backwards compatibility with earlier releases."""
 
@@ -29,11 +32,22 @@ class PolicyLike(Protocol):
 
 @dataclass(slots=True)
 class Policy:
-    """Wraps a simple callable into a policy instance."""
+    """Wraps a simple callable into a policy instance.
+
+    ``timeout`` and ``fail_open`` override the :class:`Governor` defaults for
+    this policy when set. ``cost`` declares the expected evaluation time in
+    seconds for an :class:`~naestro.governance.planning.EvaluationPlan`.
+    ``reads`` names the input fields ``checker`` depends on; setting it lets a
+    :class:`~naestro.governance.cache.DecisionCache` memoise its decisions.
+    """
 
     name: str
     description: str
     checker: PolicyChecker
+    timeout: float | None = None
+    fail_open: bool | None = None
+    cost: float | None = None
+    reads: tuple[str, ...] | None = None
 
     def evaluate(self, policy_input: PolicyInput) -> Decision:
         return self.checker(policy_input)
@@ -43,6 +57,8 @@ class Policy:
 class BudgetPolicy:
     """Ensure usage stays within a configured budget."""
 
+    cost: ClassVar[float] = 1e-5
+    reads: ClassVar[tuple[str, ...]] = ("budget",)
     name: str = "budget"
     description: str = (
         "Validate that expected spend does not exceed the available budget."
@@ -71,10 +87,43 @@ class BudgetPolicy:
                 reason="Budget data incomplete",
                 metadata=metadata,
             )
-        usage_value = float(usage)
-        limit_value = float(limit)
-        metadata |= {"usage": usage_value, "limit": limit_value}
-        if usage_value <= limit_value:
+        return self._decide(float(usage), float(limit), currency)
+
+    def evaluate_many(self, columns: PolicyColumns) -> list[Decision]:
+        """Evaluate a batch, comparing usage and limit columns in one pass."""
+
+        usage = columns.numeric("budget.usage")
+        limit = columns.numeric("budget.limit")
+        within = (usage <= limit).tolist()
+        incomplete = (
+            columns.missing("budget.usage") | columns.missing("budget.limit")
+        ).tolist()
+        usages = usage.tolist()
+        limits = limit.tolist()
+        currencies = columns.values("budget.currency")
+        decisions = []
+        for row, policy_input in enumerate(columns.inputs):
+            if incomplete[row]:
+                decisions.append(self.evaluate(policy_input))
+            else:
+                decisions.append(
+                    self._decide(
+                        usages[row], limits[row], currencies[row], within[row]
+                    )
+                )
+        return decisions
+
+    def _decide(
+        self,
+        usage_value: float,
+        limit_value: float,
+        currency: str,
+        within: bool | None = None,
+    ) -> Decision:
+        metadata = {"limit": limit_value, "usage": usage_value, "currency": currency}
+        if within is None:
+            within = usage_value <= limit_value
+        if within:
             reason = (
                 f"{usage_value:.2f} {currency} within "
                 f"{limit_value:.2f} {currency} budget"
@@ -104,6 +153,8 @@ class BudgetPolicy:
 class SafetyPolicy:
     """Check flagged categories against the configured block list."""
 
+    cost: ClassVar[float] = 1e-5
+    reads: ClassVar[tuple[str, ...]] = ("safety",)
     name: str = "safety"
     description: str = (
         "Ensure content moderation checks do not report blocked categories."
@@ -147,6 +198,8 @@ class SafetyPolicy:
 class RiskPolicy:
     """Validate that the risk score is below an acceptable threshold."""
 
+    cost: ClassVar[float] = 1e-5
+    reads: ClassVar[tuple[str, ...]] = ("risk",)
     name: str = "risk"
     description: str = (
         "Require the risk score to remain under the configured threshold."
@@ -192,6 +245,8 @@ class RiskPolicy:
 class LatencySLOPolicy:
     """Ensure latency measurements remain within an SLO."""
 
+    cost: ClassVar[float] = 1e-5
+    reads: ClassVar[tuple[str, ...]] = ("latency",)
     name: str = "latency_slo"
     description: str = (
         "Validate that observed latency does not exceed the SLO."
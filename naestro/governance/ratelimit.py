@@ -0,0 +1,276 @@
+"""Per-domain token-bucket rate limiting driven by ``policy/engine.yaml``."""
+
+from __future__ import annotations
+
+from array import array
+import asyncio
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+
+class DomainDeniedError(PermissionError):
+    """Raised when the rate policy does not allow requests to a domain."""
+
+    def __init__(self, domain: str, reason: str) -> None:
+        super().__init__(f"Domain {reason} by policy: {domain}")
+        self.domain = domain
+
+
+@dataclass(frozen=True, slots=True)
+class DomainLimit:
+    """Sustained requests per second and bucket size for one domain."""
+
+    qps: float
+    burst: float
+
+    def __post_init__(self) -> None:
+        if not self.qps > 0:
+            raise ValueError("qps must be positive")
+        if not self.burst >= 1:
+            raise ValueError("burst must be at least 1")
+
+
+@dataclass(frozen=True, slots=True)
+class RatePolicy:
+    """Allow and deny lists plus default and per-domain QPS limits.
+
+    An empty ``allow`` list permits every domain that is not denied. Domains
+    are matched exactly and case-insensitively.
+    """
+
+    allow: frozenset[str] = frozenset()
+    deny: frozenset[str] = frozenset()
+    default: DomainLimit = DomainLimit(qps=1.0, burst=2.0)
+    per_domain: Mapping[str, DomainLimit] = field(default_factory=dict)
+
+    @classmethod
+    def from_mapping(cls, document: Mapping[str, Any]) -> RatePolicy:
+        """Build a policy from the ``policy/engine.yaml`` document layout."""
+
+        def domains(key: str) -> frozenset[str]:
+            values = document.get(key) or ()
+            if isinstance(values, str) or not isinstance(values, Iterable):
+                raise ValueError(f"'{key}' must be a list of domains")
+            return frozenset(str(value).lower() for value in values)
+
+        default = DomainLimit(
+            qps=float(document.get("qpsDefault", 1.0)),
+            burst=float(document.get("burst", 2.0)),
+        )
+        per_domain = {}
+        for domain, limit in (document.get("perDomain") or {}).items():
+            if not isinstance(limit, Mapping):
+                raise ValueError(f"perDomain.{domain} must be a mapping")
+            per_domain[str(domain).lower()] = DomainLimit(
+                qps=float(limit.get("qps", default.qps)),
+                burst=float(limit.get("burst", default.burst)),
+            )
+        return cls(
+            allow=domains("allow"),
+            deny=domains("deny"),
+            default=default,
+            per_domain=per_domain,
+        )
+
+    def limit_for(self, domain: str) -> DomainLimit:
+        return self.per_domain.get(domain, self.default)
+
+    def denial(self, domain: str) -> str | None:
+        """Return why ``domain`` is refused, or ``None`` if it is permitted."""
+
+        if domain in self.deny:
+            return "denied"
+        if self.allow and domain not in self.allow:
+            return "not allowed"
+        return None
+
+
+def load_rate_policy(path: str | Path) -> RatePolicy:
+    """Load a :class:`RatePolicy` from a YAML file such as ``policy/engine.yaml``."""
+
+    source = Path(path)
+    try:
+        import yaml
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "Loading rate policies from YAML requires PyYAML. "
+            'Install it with `pip install "pyyaml>=6"`.'
+        ) from exc
+    document = yaml.safe_load(source.read_text(encoding="utf-8")) or {}
+    if not isinstance(document, Mapping):
+        raise ValueError(f"{source} must contain a mapping")
+    try:
+        return RatePolicy.from_mapping(document)
+    except ValueError as exc:
+        raise ValueError(f"{source}: {exc}") from exc
+
+
+def domain_of(target: str) -> str:
+    """Return the lower-cased host of a URL, or ``target`` itself if it is one."""
+
+    if "://" in target:
+        return (urlsplit(target).hostname or "").lower()
+    return target.lower()
+
+
+class RateLimiter:
+    """Token buckets per domain, refilled lazily on access.
+
+    Each domain gets a slot in a table of ``array('d')`` columns for
+    tokens, last refill time, rate and capacity. A bucket starts full at its
+    ``burst`` and is only topped up, by elapsed time multiplied by ``qps``,
+    when the domain is next checked. Every operation holds one lock for a few
+    arithmetic steps and never while waiting, so a limiter can be shared by
+    threads and by coroutines on any number of event loops.
+
+    Once the table reaches ``max_domains``, domains whose buckets have
+    refilled completely are dropped. Such a bucket is indistinguishable from
+    a new one, so this never changes a decision.
+    """
+
+    def __init__(
+        self,
+        policy: RatePolicy | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        max_domains: int = 4096,
+    ) -> None:
+        if max_domains <= 0:
+            raise ValueError("max_domains must be positive")
+        self.policy = policy or RatePolicy()
+        self.max_domains = max_domains
+        self._clock = clock
+        self._lock = Lock()
+        self._slots: dict[str, int] = {}
+        self._tokens = array("d")
+        self._updated = array("d")
+        self._qps = array("d")
+        self._burst = array("d")
+        self._compact_at = max_domains
+
+    @classmethod
+    def from_file(cls, path: str | Path, **options: Any) -> RateLimiter:
+        return cls(load_rate_policy(path), **options)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def try_acquire(self, target: str, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` from the bucket of ``target`` if they are available.
+
+        Returns ``False`` without waiting when the bucket is short or the
+        policy refuses the domain.
+        """
+
+        domain = domain_of(target)
+        if self.policy.denial(domain) is not None:
+            return False
+        with self._lock:
+            slot = self._refill(domain)
+            available = self._tokens[slot]
+            if available < tokens:
+                return False
+            self._tokens[slot] = available - tokens
+            return True
+
+    def reserve(self, target: str, tokens: float = 1.0) -> float:
+        """Claim ``tokens`` and return how many seconds to wait before using them.
+
+        The bucket may go negative, so concurrent callers queue up in the
+        order they reserved, as with the Firecrawl tool's per-domain queue.
+        Raises :class:`DomainDeniedError` if the policy refuses the domain.
+        """
+
+        domain = domain_of(target)
+        reason = self.policy.denial(domain)
+        if reason is not None:
+            raise DomainDeniedError(domain, reason)
+        with self._lock:
+            slot = self._refill(domain)
+            if tokens > self._burst[slot]:
+                raise ValueError(
+                    f"Cannot take {tokens} tokens from a bucket of "
+                    f"{self._burst[slot]:g}"
+                )
+            balance = self._tokens[slot] - tokens
+            self._tokens[slot] = balance
+            return 0.0 if balance >= 0 else -balance / self._qps[slot]
+
+    def acquire(self, target: str, tokens: float = 1.0) -> None:
+        """Block the calling thread until ``tokens`` are available."""
+
+        delay = self.reserve(target, tokens)
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self, target: str, tokens: float = 1.0) -> None:
+        """Asynchronous :meth:`acquire`; waits without blocking the loop."""
+
+        delay = self.reserve(target, tokens)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def available(self, target: str) -> float:
+        """Return the tokens currently in the bucket of ``target``."""
+
+        with self._lock:
+            return self._tokens[self._refill(domain_of(target))]
+
+    def _refill(self, domain: str) -> int:
+        now = self._clock()
+        slot = self._slots.get(domain)
+        if slot is None:
+            return self._add(domain, now)
+        tokens = self._tokens[slot]
+        burst = self._burst[slot]
+        if tokens < burst:
+            refilled = tokens + (now - self._updated[slot]) * self._qps[slot]
+            self._tokens[slot] = burst if refilled > burst else refilled
+        self._updated[slot] = now
+        return slot
+
+    def _add(self, domain: str, now: float) -> int:
+        if len(self._slots) >= self._compact_at:
+            self._compact(now)
+        limit = self.policy.limit_for(domain)
+        slot = len(self._slots)
+        self._slots[domain] = slot
+        self._tokens.append(limit.burst)
+        self._updated.append(now)
+        self._qps.append(limit.qps)
+        self._burst.append(limit.burst)
+        return slot
+
+    def _compact(self, now: float) -> None:
+        tokens, updated = self._tokens, self._updated
+        qps, burst = self._qps, self._burst
+        kept: dict[str, int] = {}
+        columns = (array("d"), array("d"), array("d"), array("d"))
+        for domain, slot in self._slots.items():
+            level = tokens[slot] + (now - updated[slot]) * qps[slot]
+            if level >= burst[slot]:
+                continue
+            kept[domain] = len(kept)
+            for column, value in zip(
+                columns, (tokens[slot], updated[slot], qps[slot], burst[slot])
+            ):
+                column.append(value)
+        self._slots = kept
+        self._tokens, self._updated, self._qps, self._burst = columns
+        # Keep compaction amortised when most buckets are still draining.
+        self._compact_at = max(self.max_domains, 2 * len(kept))
+
+
+__all__ = [
+    "DomainDeniedError",
+    "DomainLimit",
+    "RateLimiter",
+    "RatePolicy",
+    "domain_of",
+    "load_rate_policy",
+]
@@ -0,0 +1,346 @@
+"""Governance over continuous metric streams in constant memory."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Mapping
+from threading import Lock
+from typing import ClassVar, TYPE_CHECKING
+
+from .policies import BudgetPolicy
+from .schemas import Decision, PolicyInput
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from naestro.core.bus import MessageBus
+
+
+class _P2Quantile:
+    """Jain and Chlamtac's P² estimator: one quantile from five markers."""
+
+    __slots__ = ("fraction", "count", "_heights", "_positions", "_desired", "_steps")
+
+    def __init__(self, fraction: float) -> None:
+        self.fraction = fraction
+        self.count = 0
+        self._heights: list[float] = []
+        self._positions = [0.0, 1.0, 2.0, 3.0, 4.0]
+        self._desired = [0.0, 2 * fraction, 4 * fraction, 2 + 2 * fraction, 4.0]
+        self._steps = [0.0, fraction / 2, fraction, (1 + fraction) / 2, 1.0]
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+        positions = self._positions
+        desired = self._desired
+        steps = self._steps
+        for index in range(cell + 1, 5):
+            positions[index] += 1
+        for index in range(5):
+            desired[index] += steps[index]
+        for index in (1, 2, 3):
+            offset = desired[index] - positions[index]
+            if (offset >= 1 and positions[index + 1] - positions[index] > 1) or (
+                offset <= -1 and positions[index - 1] - positions[index] < -1
+            ):
+                self._adjust(index, 1 if offset > 0 else -1)
+
+    def _adjust(self, index: int, step: int) -> None:
+        heights = self._heights
+        positions = self._positions
+        below = positions[index] - positions[index - 1]
+        above = positions[index + 1] - positions[index]
+        # Piecewise-parabolic prediction, falling back to linear if it is
+        # not monotonic.
+        height = heights[index] + step / (below + above) * (
+            (below + step) * (heights[index + 1] - heights[index]) / above
+            + (above - step) * (heights[index] - heights[index - 1]) / below
+        )
+        if not heights[index - 1] < height < heights[index + 1]:
+            neighbour = index + step
+            height = heights[index] + step * (heights[neighbour] - heights[index]) / (
+                positions[neighbour] - positions[index]
+            )
+        heights[index] = height
+        positions[index] += step
+
+    @property
+    def value(self) -> float | None:
+        heights = self._heights
+        if self.count > 5:
+            return heights[2]
+        if not heights:
+            return None
+        return heights[min(len(heights) - 1, int(self.fraction * len(heights)))]
+
+
+class RollingQuantile:
+    """Estimate a quantile of the most recent samples in constant memory.
+
+    Two P² estimators run half a window apart, and each is restarted once it
+    has seen a full ``window``. The estimate comes from the older one, so it
+    always covers between half a window and a full window of the latest
+    samples. An odd ``window`` is rounded down to an even one so that the
+    halves line up. Updates and reads are O(1).
+    """
+
+    __slots__ = ("fraction", "window", "_sketches", "_seen")
+
+    def __init__(self, fraction: float = 0.95, *, window: int = 1024) -> None:
+        if not 0.0 < fraction < 1.0:
+            raise ValueError("fraction must be in (0, 1)")
+        if window < 10:
+            raise ValueError("window must be at least 10")
+        self.fraction = fraction
+        self.window = window - window % 2
+        self._sketches = [_P2Quantile(fraction), _P2Quantile(fraction)]
+        self._seen = 0
+
+    def add(self, value: float) -> None:
+        first, second = self._sketches
+        first.add(value)
+        second.add(value)
+        self._seen += 1
+        if self._seen % (self.window // 2):
+            return
+        if first.count == second.count:
+            # Stagger the estimators the first time half a window is reached.
+            self._sketches[1] = _P2Quantile(self.fraction)
+        elif first.count >= self.window:
+            self._sketches[0] = _P2Quantile(self.fraction)
+        else:
+            self._sketches[1] = _P2Quantile(self.fraction)
+
+    @property
+    def count(self) -> int:
+        """Number of samples the current estimate covers."""
+
+        return max(sketch.count for sketch in self._sketches)
+
+    @property
+    def value(self) -> float | None:
+        """The current estimate, or ``None`` before the first sample."""
+
+        first, second = self._sketches
+        return (first if first.count >= second.count else second).value
+
+    def reset(self) -> None:
+        self._sketches = [_P2Quantile(self.fraction), _P2Quantile(self.fraction)]
+        self._seen = 0
+
+
+class _ThresholdStream(ABC):
+    """Shared plumbing for policies fed one sample at a time.
+
+    Subclasses update their summary in ``_add``, report whether it is within
+    the threshold from ``_passes`` (``None`` while undecided) and describe
+    the current state in ``_decide``. A decision is emitted only when the
+    state changes; the stream starts out passing.
+    """
+
+    cost: ClassVar[float] = 1e-6
+    name: str
+    description: str
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._passed = True
+
+    def observe(self, value: float) -> Decision | None:
+        """Add one sample and return a decision if it crossed the threshold."""
+
+        with self._lock:
+            self._add(float(value))
+            passed = self._passes()
+            if passed is None or passed is self._passed:
+                return None
+            self._passed = passed
+            return self._decide()
+
+    def evaluate(self, policy_input: PolicyInput) -> Decision:
+        """Describe the current state of the stream; ``policy_input`` is unused.
+
+        This lets a :class:`Governor` include the stream alongside snapshot
+        policies. The decision changes without the input changing, so the
+        policy deliberately declares no ``reads`` and is never cached.
+        """
+
+        with self._lock:
+            return self._decide()
+
+    def subscribe(
+        self,
+        bus: MessageBus,
+        event: str,
+        *,
+        field: str,
+        on_decision: Callable[[Decision], None] | None = None,
+    ) -> None:
+        """Feed the ``field`` of every ``event`` payload published on ``bus``.
+
+        Payloads without the field are ignored. Decisions are passed to
+        ``on_decision`` when given.
+        """
+
+        def handle(payload: Mapping[str, object]) -> None:
+            value = payload.get(field)
+            if value is None:
+                return
+            decision = self.observe(value)  # type: ignore[arg-type]
+            if decision is not None and on_decision is not None:
+                on_decision(decision)
+
+        bus.subscribe(event, handle)
+
+    async def watch(self, samples: AsyncIterable[float]) -> AsyncIterator[Decision]:
+        """Consume ``samples`` and yield a decision at every threshold crossing."""
+
+        async for sample in samples:
+            decision = self.observe(sample)
+            if decision is not None:
+                yield decision
+
+    def reset(self) -> None:
+        with self._lock:
+            self._passed = True
+            self._clear()
+
+    @abstractmethod
+    def _add(self, value: float) -> None:
+        """Fold one sample into the summary."""
+
+    @abstractmethod
+    def _passes(self) -> bool | None:
+        """Whether the summary is within the threshold, or ``None`` if unknown."""
+
+    @abstractmethod
+    def _decide(self) -> Decision:
+        """Describe the current state as a decision."""
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Forget every sample."""
+
+
+class StreamingLatencySLOPolicy(_ThresholdStream):
+    """Hold a rolling latency quantile, p95 by default, to an SLO.
+
+    Samples are latencies in milliseconds. The quantile covers roughly the
+    last ``window`` samples (see :class:`RollingQuantile`), and no decision
+    is made before ``min_samples`` have arrived.
+    """
+
+    def __init__(
+        self,
+        slo_ms: float,
+        *,
+        quantile: float = 0.95,
+        window: int = 1024,
+        min_samples: int = 20,
+        name: str = "latency_slo_stream",
+        description: str = "Validate that rolling tail latency stays within the SLO.",
+    ) -> None:
+        super().__init__()
+        self.slo_ms = float(slo_ms)
+        self.min_samples = min_samples
+        self.name = name
+        self.description = description
+        self._quantile = RollingQuantile(quantile, window=window)
+        self._label = f"p{quantile * 100:g}"
+
+    @property
+    def observed_ms(self) -> float | None:
+        """The current quantile estimate, once ``min_samples`` have arrived."""
+
+        quantile = self._quantile
+        return quantile.value if quantile.count >= self.min_samples else None
+
+    def _add(self, value: float) -> None:
+        self._quantile.add(value)
+
+    def _passes(self) -> bool | None:
+        observed = self.observed_ms
+        return None if observed is None else observed <= self.slo_ms
+
+    def _clear(self) -> None:
+        self._quantile.reset()
+
+    def _decide(self) -> Decision:
+        observed = self.observed_ms
+        slo = self.slo_ms
+        metadata = {
+            "observed_ms": observed,
+            "slo_ms": slo,
+            "window": f"{self._label} of last {self._quantile.count}",
+        }
+        if observed is None:
+            return Decision(
+                name=self.name,
+                passed=True,
+                reason="Not enough latency samples",
+                metadata=metadata,
+            )
+        passed = observed <= slo
+        if passed:
+            reason = f"{self._label} latency {observed:.2f}ms within SLO {slo:.2f}ms"
+        else:
+            reason = f"{self._label} latency {observed:.2f}ms exceeds SLO {slo:.2f}ms"
+        return Decision(
+            name=self.name,
+            passed=passed,
+            reason=reason,
+            severity="info" if passed else "warning",
+            metadata=metadata,
+        )
+
+
+class StreamingBudgetPolicy(_ThresholdStream):
+    """Accumulate spend samples and flag the moment they exceed ``limit``.
+
+    Decisions match those of :class:`BudgetPolicy` for the cumulative spend.
+    Call :meth:`reset` to start a new budget period.
+    """
+
+    def __init__(
+        self,
+        limit: float,
+        *,
+        currency: str = "usd",
+        name: str = "budget_stream",
+        description: str = "Validate that cumulative spend stays within the budget.",
+    ) -> None:
+        super().__init__()
+        self.limit = float(limit)
+        self.currency = currency
+        self.name = name
+        self.description = description
+        self.spent = 0.0
+        self._budget = BudgetPolicy(name=name, description=description)
+
+    def _add(self, value: float) -> None:
+        self.spent += value
+
+    def _passes(self) -> bool | None:
+        return self.spent <= self.limit
+
+    def _clear(self) -> None:
+        self.spent = 0.0
+
+    def _decide(self) -> Decision:
+        return self._budget._decide(self.spent, self.limit, self.currency)
+
+
+__all__ = ["RollingQuantile", "StreamingBudgetPolicy", "StreamingLatencySLOPolicy"]
@@ -2,19 +2,49 @@
 
 from __future__ import annotations
 
+from .cache import CacheStats, DecisionCache
+from .feedback import EndpointHealth, FeedbackSnapshot, FeedbackTracker
+from .hedging import HedgedExecutor, HedgeResult, HedgingError, LatencyWindow
+from .loader import load_models, load_registry, RegistryWatcher
 from .model_registry import DEFAULT_WEIGHTS, ModelInfo, ModelRegistry, REGISTRY
 from .router import ModelRouter, RoutePolicy
+from .strategies import (
+    ConsistentHashStrategy,
+    GreedyStrategy,
+    InflightTracker,
+    PowerOfTwoChoices,
+    SelectionStrategy,
+    SoftmaxStrategy,
+)
 from .task_specs import BaseTaskSpec, ChatTaskSpec, TaskSpec, ToolTaskSpec
 
 __all__ = [
     "BaseTaskSpec",
+    "CacheStats",
     "ChatTaskSpec",
+    "ConsistentHashStrategy",
+    "DecisionCache",
     "DEFAULT_WEIGHTS",
+    "EndpointHealth",
+    "FeedbackSnapshot",
+    "FeedbackTracker",
+    "GreedyStrategy",
+    "HedgedExecutor",
+    "HedgeResult",
+    "HedgingError",
+    "InflightTracker",
+    "LatencyWindow",
     "ModelInfo",
     "ModelRegistry",
     "ModelRouter",
+    "PowerOfTwoChoices",
     "RoutePolicy",
     "REGISTRY",
+    "RegistryWatcher",
+    "SelectionStrategy",
+    "SoftmaxStrategy",
     "TaskSpec",
     "ToolTaskSpec",
+    "load_models",
+    "load_registry",
 ]
@@ -0,0 +1,114 @@
+"""Bounded memoisation of routing decisions."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Point-in-time counters describing a :class:`DecisionCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+    lookup_seconds: float
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def mean_lookup_seconds(self) -> float:
+        """Average wall-clock time spent per lookup."""
+
+        return self.lookup_seconds / self.lookups if self.lookups else 0.0
+
+
+class DecisionCache(Generic[T]):
+    """Thread-safe LRU cache with hit-rate and lookup latency counters."""
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, T] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lookup_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> tuple[bool, T | None]:
+        """Return ``(found, value)`` for ``key`` and update the counters."""
+
+        started = perf_counter()
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+                found = False
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                found = True
+            self._lookup_seconds += perf_counter() - started
+        if not found:
+            return False, None
+        return True, value  # type: ignore[return-value]
+
+    def store(self, key: Hashable, value: T) -> None:
+        """Insert ``value`` evicting the least recently used entry if full."""
+
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached entries while keeping the counters."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+            self._lookup_seconds = 0.0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                lookup_seconds=self._lookup_seconds,
+            )
+
+
+__all__ = ["CacheStats", "DecisionCache"]
@@ -0,0 +1,232 @@
+"""Column-oriented registry snapshots for vectorised routing."""
+
+from __future__ import annotations
+
+from typing import Collection, Iterable, Mapping
+
+try:  # pragma: no cover - exercised implicitly when numpy is installed
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - optional acceleration
+    raise RuntimeError(
+        "naestro.routing.columnar requires numpy>=1.26. "
+        'Install it with `pip install "numpy>=1.26"`.'
+    ) from exc
+
+from .model_registry import ModelInfo
+
+_WORD_BITS = 64
+
+
+class ColumnarView:
+    """Immutable structure-of-arrays snapshot of registered models.
+
+    Quality, latency and cost are stored as ``float64`` columns so that scores
+    match :meth:`ModelInfo.score` bit for bit. Capabilities are packed into a
+    ``(models, words)`` ``uint64`` bitmask matrix where each capability owns one
+    bit, which turns subset checks into a couple of vector ``&`` operations. The
+    matrix is stored column-major so a query only touches the words its
+    required capabilities live in.
+    """
+
+    __slots__ = (
+        "models",
+        "index",
+        "quality",
+        "latency",
+        "cost",
+        "context_window",
+        "token_rates",
+        "capabilities",
+        "_bits",
+    )
+
+    def __init__(self, models: Iterable[ModelInfo]) -> None:
+        self.models: tuple[ModelInfo, ...] = tuple(models)
+        self.index: dict[str, int] = {
+            model.name: row for row, model in enumerate(self.models)
+        }
+        self.quality = np.array([m.quality for m in self.models], dtype=np.float64)
+        self.latency = np.array([m.latency for m in self.models], dtype=np.float64)
+        self.cost = np.array([m.cost for m in self.models], dtype=np.float64)
+        self.context_window = np.array(
+            [
+                np.inf if m.context_window is None else m.context_window
+                for m in self.models
+            ],
+            dtype=np.float64,
+        )
+        rates = np.array(
+            [
+                (
+                    m.prefill_latency_per_token,
+                    m.decode_latency_per_token,
+                    m.prefill_cost_per_token,
+                    m.decode_cost_per_token,
+                )
+                for m in self.models
+            ],
+            dtype=np.float64,
+        ).reshape(len(self.models), 4)
+        # Columns: prefill latency, decode latency, prefill cost, decode cost.
+        self.token_rates: np.ndarray | None = rates if rates.any() else None
+
+        self._bits: dict[str, int] = {}
+        for model in self.models:
+            for capability in sorted(model.capabilities):
+                self._bits.setdefault(capability, len(self._bits))
+        words = max(1, -(-len(self._bits) // _WORD_BITS))
+        matrix = np.zeros((len(self.models), words), dtype=np.uint64)
+        for row, model in enumerate(self.models):
+            matrix[row] = self._pack(model.capabilities, words)
+        self.capabilities = np.asfortranarray(matrix)
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def adjusted(
+        self, overrides: Mapping[str, tuple[float | None, float | None]]
+    ) -> ColumnarView:
+        """Return a view whose latency/cost columns apply ``overrides``.
+
+        ``overrides`` maps model names to ``(latency, cost)`` pairs where
+        ``None`` keeps the registered value. Observed values are end-to-end,
+        so they also clear that row's per-token rates for the same dimension,
+        as :meth:`FeedbackSnapshot.adjust` does. Capability data is shared.
+        """
+
+        view = self._derive(self.latency.copy(), self.cost.copy())
+        rates = None if self.token_rates is None else self.token_rates.copy()
+        for name, (latency, cost) in overrides.items():
+            row = self.index.get(name)
+            if row is None:
+                continue
+            if latency is not None:
+                view.latency[row] = latency
+                if rates is not None:
+                    rates[row, :2] = 0.0
+            if cost is not None:
+                view.cost[row] = cost
+                if rates is not None:
+                    rates[row, 2:] = 0.0
+        view.token_rates = rates
+        return view
+
+    def for_request(self, prompt_tokens: int, response_tokens: int) -> ColumnarView:
+        """Return a view whose latency/cost columns are per-request estimates.
+
+        Vectorised equivalent of :meth:`ModelInfo.for_request`. The view is
+        returned unchanged when no model declares per-token rates.
+        """
+
+        rates = self.token_rates
+        if rates is None or not (prompt_tokens or response_tokens):
+            return self
+        latency = (
+            self.latency + rates[:, 0] * prompt_tokens + rates[:, 1] * response_tokens
+        )
+        cost = self.cost + rates[:, 2] * prompt_tokens + rates[:, 3] * response_tokens
+        return self._derive(latency, cost)
+
+    def _derive(self, latency: np.ndarray, cost: np.ndarray) -> ColumnarView:
+        view = object.__new__(ColumnarView)
+        view.models = self.models
+        view.index = self.index
+        view.quality = self.quality
+        view.context_window = self.context_window
+        view.token_rates = self.token_rates
+        view.capabilities = self.capabilities
+        view._bits = self._bits
+        view.latency = latency
+        view.cost = cost
+        return view
+
+    def _pack(self, capabilities: Iterable[str], words: int) -> np.ndarray:
+        packed = np.zeros(words, dtype=np.uint64)
+        for capability in capabilities:
+            bit = self._bits[capability]
+            packed[bit // _WORD_BITS] |= np.uint64(1) << np.uint64(bit % _WORD_BITS)
+        return packed
+
+    def scores(self, weights: Mapping[str, float]) -> np.ndarray:
+        """Vectorised equivalent of :meth:`ModelInfo.score` for every row."""
+
+        return (
+            self.quality * weights.get("quality", 0.0)
+            - self.latency * weights.get("latency", 0.0)
+            - self.cost * weights.get("cost", 0.0)
+        )
+
+    def mask(
+        self,
+        required: Collection[str],
+        *,
+        excluded: Collection[str] = (),
+        min_quality: float | None = None,
+        max_latency: float | None = None,
+        max_cost: float | None = None,
+        min_context: int | None = None,
+    ) -> np.ndarray:
+        """Return a boolean row mask of models satisfying the constraints."""
+
+        if any(capability not in self._bits for capability in required):
+            return np.zeros(len(self.models), dtype=bool)
+        keep = np.ones(len(self.models), dtype=bool)
+        if required:
+            wanted = self._pack(required, self.capabilities.shape[1])
+            for word in np.flatnonzero(wanted):
+                column = self.capabilities[:, word]
+                keep &= (column & wanted[word]) == wanted[word]
+        for name in excluded:
+            row = self.index.get(name)
+            if row is not None:
+                keep[row] = False
+        if min_quality is not None:
+            keep &= self.quality >= min_quality
+        if max_latency is not None:
+            keep &= self.latency <= max_latency
+        if max_cost is not None:
+            keep &= self.cost <= max_cost
+        if min_context:
+            keep &= self.context_window >= min_context
+        return keep
+
+    def select(self, scores: np.ndarray, keep: np.ndarray) -> ModelInfo | None:
+        """Return the best scoring model in ``keep`` using a single ``argmax``."""
+
+        if not keep.any():
+            return None
+        masked = np.where(keep, scores, -np.inf)
+        return self.models[int(np.argmax(masked))]
+
+    def rank(
+        self, scores: np.ndarray, keep: np.ndarray, limit: int | None = None
+    ) -> list[tuple[ModelInfo, float]]:
+        """Return ``(model, score)`` pairs in ``keep`` by descending score.
+
+        Ties keep registration order, matching a stable sort. When ``limit`` is
+        smaller than the candidate count only the top ``limit`` rows are
+        partitioned out with ``argpartition`` before sorting.
+        """
+
+        rows = np.flatnonzero(keep)
+        if limit is not None and limit < rows.size:
+            if limit <= 0:
+                return []
+            rows = _top_rows(rows, scores[rows], limit)
+        ordered = rows[np.lexsort((rows, -scores[rows]))]
+        return [
+            (self.models[row], score)
+            for row, score in zip(ordered.tolist(), scores[ordered].tolist())
+        ]
+
+
+def _top_rows(rows: np.ndarray, candidate_scores: np.ndarray, limit: int) -> np.ndarray:
+    partition = np.argpartition(-candidate_scores, limit - 1)[:limit]
+    threshold = candidate_scores[partition].min()
+    above = rows[candidate_scores > threshold]
+    # Resolve ties at the cut-off deterministically by registration order.
+    tied = rows[candidate_scores == threshold][: limit - above.size]
+    return np.concatenate((above, tied))
+
+
+__all__ = ["ColumnarView"]
@@ -0,0 +1,244 @@
+"""Live endpoint feedback used to adapt routing scores."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from itertools import count
+from threading import Lock
+from time import monotonic
+from typing import Callable, Mapping
+
+from .model_registry import ModelInfo
+
+_VERSIONS = count(1)
+
+
+@dataclass(slots=True)
+class EndpointHealth:
+    """Smoothed observations for a single model endpoint."""
+
+    latency: float | None = None
+    cost: float | None = None
+    error_rate: float = 0.0
+    samples: int = 0
+    consecutive_errors: int = 0
+    ejected_until: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class FeedbackSnapshot:
+    """Consistent view of the values routing decisions should use."""
+
+    version: int
+    overrides: Mapping[str, tuple[float | None, float | None]]
+    ejected: frozenset[str]
+
+    def adjust(self, model: ModelInfo) -> ModelInfo:
+        """Return ``model`` with observed latency and cost applied.
+
+        Observations are end-to-end figures that already include time and
+        spend per token, so an observed value also clears the model's
+        per-token rates for that dimension.
+        """
+
+        override = self.overrides.get(model.name)
+        if override is None:
+            return model
+        latency, cost = override
+        if latency is not None:
+            model = replace(
+                model,
+                latency=latency,
+                prefill_latency_per_token=0.0,
+                decode_latency_per_token=0.0,
+            )
+        if cost is not None:
+            model = replace(
+                model, cost=cost, prefill_cost_per_token=0.0, decode_cost_per_token=0.0
+            )
+        return model
+
+
+class FeedbackTracker:
+    """Track per-model EWMAs of latency, cost and errors with outlier ejection.
+
+    Callers report observations with :meth:`report`. Latency and cost must use
+    the same units as :class:`ModelInfo`. To keep routing caches effective the
+    tracker only *publishes* a new smoothed value, and bumps :attr:`version`,
+    when it drifts more than ``tolerance`` (relative) from the last published
+    one or when a model is ejected or readmitted.
+
+    A model is ejected for ``ejection_seconds`` after ``max_consecutive_errors``
+    failures in a row, or once its smoothed error rate reaches
+    ``error_rate_threshold`` with at least ``min_samples`` observations.
+    """
+
+    def __init__(
+        self,
+        *,
+        decay: float = 0.2,
+        tolerance: float = 0.05,
+        error_rate_threshold: float = 0.5,
+        max_consecutive_errors: int = 5,
+        min_samples: int = 10,
+        ejection_seconds: float = 30.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if not 0.0 < decay <= 1.0:
+            raise ValueError("decay must be in (0, 1]")
+        if tolerance < 0.0:
+            raise ValueError("tolerance must be non-negative")
+        if max_consecutive_errors <= 0:
+            raise ValueError("max_consecutive_errors must be positive")
+        self.decay = decay
+        self.tolerance = tolerance
+        self.error_rate_threshold = error_rate_threshold
+        self.max_consecutive_errors = max_consecutive_errors
+        self.min_samples = min_samples
+        self.ejection_seconds = ejection_seconds
+        self._clock = clock
+        self._lock = Lock()
+        self._health: dict[str, EndpointHealth] = {}
+        self._snapshot = FeedbackSnapshot(next(_VERSIONS), {}, frozenset())
+        self._next_expiry: float | None = None
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever published routing inputs change."""
+
+        return self.snapshot().version
+
+    def snapshot(self) -> FeedbackSnapshot:
+        """Return the published overrides, readmitting expired ejections."""
+
+        expiry = self._next_expiry
+        if expiry is not None and self._clock() >= expiry:
+            with self._lock:
+                self._expire(self._clock())
+        return self._snapshot
+
+    def report(
+        self,
+        name: str,
+        *,
+        latency: float | None = None,
+        cost: float | None = None,
+        error: bool = False,
+    ) -> None:
+        """Record an observed request outcome for model ``name``."""
+
+        with self._lock:
+            health = self._health.setdefault(name, EndpointHealth())
+            alpha = self.decay
+            health.samples += 1
+            health.error_rate += alpha * (float(error) - health.error_rate)
+            if error:
+                health.consecutive_errors += 1
+            else:
+                health.consecutive_errors = 0
+            if latency is not None:
+                health.latency = _ewma(health.latency, float(latency), alpha)
+            if cost is not None:
+                health.cost = _ewma(health.cost, float(cost), alpha)
+
+            now = self._clock()
+            eject = health.ejected_until is None and (
+                health.consecutive_errors >= self.max_consecutive_errors
+                or (
+                    health.samples >= self.min_samples
+                    and health.error_rate >= self.error_rate_threshold
+                )
+            )
+            if eject:
+                until = now + self.ejection_seconds
+                health.ejected_until = until
+                if self._next_expiry is None or until < self._next_expiry:
+                    self._next_expiry = until
+            self._publish(name, health, force=eject)
+
+    def health(self, name: str) -> EndpointHealth | None:
+        """Return a copy of the raw smoothed state for ``name``."""
+
+        with self._lock:
+            health = self._health.get(name)
+            return None if health is None else replace(health)
+
+    def is_ejected(self, name: str) -> bool:
+        return name in self.snapshot().ejected
+
+    def reset(self, name: str | None = None) -> None:
+        """Forget observations for ``name`` or for every model."""
+
+        with self._lock:
+            if name is None:
+                self._health.clear()
+                self._snapshot = FeedbackSnapshot(next(_VERSIONS), {}, frozenset())
+                self._next_expiry = None
+                return
+            self._health.pop(name, None)
+            overrides = dict(self._snapshot.overrides)
+            overrides.pop(name, None)
+            self._snapshot = FeedbackSnapshot(
+                next(_VERSIONS), overrides, self._snapshot.ejected - {name}
+            )
+
+    def _publish(self, name: str, health: EndpointHealth, *, force: bool) -> None:
+        current = self._snapshot
+        published = current.overrides.get(name, (None, None))
+        observed = (health.latency, health.cost)
+        drifted = any(
+            _drifted(old, new, self.tolerance) for old, new in zip(published, observed)
+        )
+        ejected = name in current.ejected
+        should_eject = health.ejected_until is not None
+        if not (force or drifted or ejected != should_eject):
+            return
+        overrides = dict(current.overrides)
+        overrides[name] = observed
+        if should_eject:
+            names = current.ejected | {name}
+        else:
+            names = current.ejected - {name}
+        self._snapshot = FeedbackSnapshot(next(_VERSIONS), overrides, names)
+
+    def _expire(self, now: float) -> None:
+        readmitted: list[str] = []
+        upcoming: float | None = None
+        for name, health in self._health.items():
+            until = health.ejected_until
+            if until is None:
+                continue
+            if until <= now:
+                health.ejected_until = None
+                health.consecutive_errors = 0
+                health.error_rate = 0.0
+                health.samples = 0
+                readmitted.append(name)
+            elif upcoming is None or until < upcoming:
+                upcoming = until
+        self._next_expiry = upcoming
+        if readmitted:
+            current = self._snapshot
+            self._snapshot = FeedbackSnapshot(
+                next(_VERSIONS),
+                current.overrides,
+                current.ejected - frozenset(readmitted),
+            )
+
+
+def _ewma(previous: float | None, value: float, alpha: float) -> float:
+    if previous is None:
+        return value
+    return previous + alpha * (value - previous)
+
+
+def _drifted(old: float | None, new: float | None, tolerance: float) -> bool:
+    if new is None:
+        return False
+    if old is None:
+        return True
+    scale = max(abs(old), 1e-12)
+    return abs(new - old) / scale > tolerance
+
+
+__all__ = ["EndpointHealth", "FeedbackSnapshot", "FeedbackTracker"]
@@ -0,0 +1,206 @@
+"""Hedged and fallback request execution over ranked routing candidates."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Generic, Mapping, TypeVar
+
+from .model_registry import ModelInfo
+from .router import RoutePolicy, TaskConfiguration
+
+T = TypeVar("T")
+
+ModelCall = Callable[[ModelInfo], Awaitable[T]]
+"""Coroutine function that sends the request to the given model."""
+
+
+class HedgingError(RuntimeError):
+    """Raised when every candidate attempted for a request failed."""
+
+    def __init__(self, message: str, errors: Mapping[str, BaseException]) -> None:
+        super().__init__(message)
+        self.errors = dict(errors)
+
+
+@dataclass(frozen=True, slots=True)
+class HedgeResult(Generic[T]):
+    """Outcome of :meth:`HedgedExecutor.execute`."""
+
+    value: T
+    model: ModelInfo
+    attempts: tuple[str, ...]
+    hedged: bool
+    latency: float
+
+
+class LatencyWindow:
+    """Sliding window of recent successful latencies per model."""
+
+    def __init__(self, size: int = 256) -> None:
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self.size = size
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = Lock()
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.size)
+            samples.append(seconds)
+
+    def count(self, name: str) -> int:
+        samples = self._samples.get(name)
+        return 0 if samples is None else len(samples)
+
+    def percentile(self, name: str, fraction: float) -> float | None:
+        """Return the ``fraction`` quantile for ``name`` or ``None`` if unseen."""
+
+        with self._lock:
+            samples = self._samples.get(name)
+            if not samples:
+                return None
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, int(fraction * len(ordered))))
+        return ordered[index]
+
+
+class HedgedExecutor:
+    """Execute requests against ranked candidates with hedging and fallback.
+
+    The top-ranked model is called first. If it has not answered once the
+    ``percentile`` of its recent latencies has elapsed, the runner-up is called
+    as well and whichever answers first wins; the slower call is cancelled.
+    Failures fall through to the next candidate immediately. Outcomes are
+    reported to the router's feedback tracker and calls are counted in its
+    in-flight tracker, so the ``p2c`` strategy sees hedged traffic too.
+
+    Until ``min_samples`` latencies have been observed for a model the hedge
+    delay is its registered ``latency``, read as seconds, multiplied by
+    ``fallback_multiplier``.
+    """
+
+    def __init__(
+        self,
+        policy: RoutePolicy,
+        *,
+        percentile: float = 0.95,
+        window: int = 256,
+        min_samples: int = 20,
+        fallback_multiplier: float = 2.0,
+        max_attempts: int | None = 3,
+        max_in_flight: int = 2,
+        report: bool = True,
+    ) -> None:
+        if not 0.0 < percentile <= 1.0:
+            raise ValueError("percentile must be in (0, 1]")
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+        self.policy = policy
+        self.percentile = percentile
+        self.latencies = LatencyWindow(window)
+        self.min_samples = min_samples
+        self.fallback_multiplier = fallback_multiplier
+        self.max_attempts = max_attempts
+        self.max_in_flight = max_in_flight
+        self.report = report
+
+    def hedge_delay(self, model: ModelInfo) -> float:
+        """Return how long to wait on ``model`` before hedging, in seconds."""
+
+        if self.latencies.count(model.name) >= self.min_samples:
+            observed = self.latencies.percentile(model.name, self.percentile)
+            if observed is not None:
+                return observed
+        return model.latency * self.fallback_multiplier
+
+    async def execute(
+        self, spec: TaskConfiguration, call: ModelCall[T]
+    ) -> HedgeResult[T]:
+        """Serve ``spec`` with ``call`` and return the first successful result.
+
+        Raises:
+            ValueError: If no model satisfies the spec.
+            HedgingError: If every attempted candidate failed.
+        """
+
+        candidates = self.policy.rank(spec, limit=self.max_attempts)
+        if not candidates:
+            task = dict(spec).get("task", "<unknown>")
+            raise ValueError(
+                f"No model satisfies requested capabilities for task '{task}'"
+            )
+
+        router = self.policy.router
+        queue = deque(candidates)
+        pending: dict[asyncio.Task[Any], tuple[ModelInfo, float]] = {}
+        attempts: list[str] = []
+        errors: dict[str, BaseException] = {}
+        hedged = False
+        deadline: float | None = None
+
+        async def attempt(model: ModelInfo) -> T:
+            with router.inflight.track(model.name):
+                return await call(model)
+
+        def launch() -> None:
+            nonlocal deadline
+            model = queue.popleft()
+            started = perf_counter()
+            pending[asyncio.ensure_future(attempt(model))] = (model, started)
+            attempts.append(model.name)
+            deadline = started + self.hedge_delay(model)
+
+        launch()
+        try:
+            while pending:
+                can_hedge = bool(queue) and len(pending) < self.max_in_flight
+                timeout = None
+                if can_hedge and deadline is not None:
+                    timeout = max(0.0, deadline - perf_counter())
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedged = True
+                    launch()
+                    continue
+                for task in done:
+                    model, started = pending.pop(task)
+                    elapsed = perf_counter() - started
+                    error = task.exception()
+                    if error is None:
+                        self.latencies.observe(model.name, elapsed)
+                        if self.report:
+                            router.report(model.name, latency=elapsed)
+                        return HedgeResult(
+                            task.result(), model, tuple(attempts), hedged, elapsed
+                        )
+                    errors[model.name] = error
+                    if self.report:
+                        router.report(model.name, error=True)
+                if queue and len(pending) < self.max_in_flight:
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        raise HedgingError(
+            f"All {len(attempts)} candidate(s) failed: {', '.join(attempts)}", errors
+        )
+
+
+__all__ = [
+    "HedgedExecutor",
+    "HedgeResult",
+    "HedgingError",
+    "LatencyWindow",
+    "ModelCall",
+]
@@ -0,0 +1,228 @@
+"""Build model registries from configuration files and hot-reload them."""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Iterable, List, Mapping, Sequence
+
+from .._yaml import load_yaml
+from .model_registry import ModelInfo, ModelRegistry
+from .router import ModelRouter, RoutePolicy
+
+logger = logging.getLogger(__name__)
+
+_FLOAT_FIELDS = (
+    "prefill_latency_per_token",
+    "decode_latency_per_token",
+    "prefill_cost_per_token",
+    "decode_cost_per_token",
+)
+
+
+def model_from_mapping(entry: Mapping[str, Any], source: str = "<config>") -> ModelInfo:
+    """Convert one ``models`` entry of a routing config into :class:`ModelInfo`."""
+
+    missing = [
+        key
+        for key in ("name", "provider", "quality", "latency", "cost")
+        if key not in entry
+    ]
+    if missing:
+        raise ValueError(
+            f"Model entry {entry.get('name', '<unnamed>')!r} in {source} is "
+            f"missing {', '.join(missing)}"
+        )
+    context_window = entry.get("context_window")
+    return ModelInfo(
+        name=str(entry["name"]),
+        provider=str(entry["provider"]),
+        capabilities=frozenset(str(item) for item in entry.get("capabilities", [])),
+        quality=float(entry["quality"]),
+        latency=float(entry["latency"]),
+        cost=float(entry["cost"]),
+        metadata=dict(entry.get("metadata") or {}),
+        context_window=None if context_window is None else int(context_window),
+        **{key: float(entry[key]) for key in _FLOAT_FIELDS if key in entry},
+    )
+
+
+def load_models(path: str | Path) -> List[ModelInfo]:
+    """Read the ``models`` list from a JSON or YAML routing config."""
+
+    source = Path(path)
+    text = source.read_text(encoding="utf-8")
+    if source.suffix in {".yaml", ".yml"}:
+        data = load_yaml(text, "routing configs")
+    else:
+        data = json.loads(text)
+    entries = data.get("models") if isinstance(data, Mapping) else None
+    if not isinstance(entries, list):
+        raise ValueError(f"{source} must define a 'models' list")
+    models: List[ModelInfo] = []
+    for entry in entries:
+        if not isinstance(entry, Mapping):
+            raise ValueError(f"Invalid model entry in {source}: {entry!r}")
+        models.append(model_from_mapping(entry, str(source)))
+    return models
+
+
+def load_registry(*paths: str | Path) -> ModelRegistry:
+    """Build a fully indexed registry from one or more routing configs.
+
+    Later files override earlier entries with the same model name. The
+    columnar view is built eagerly when numpy is available so that the first
+    routing decision after a swap does not pay for it.
+    """
+
+    registry = ModelRegistry()
+    for path in paths:
+        for model in load_models(path):
+            registry.register(model)
+    try:
+        registry.columns()
+    except RuntimeError:  # pragma: no cover - numpy missing
+        pass
+    return registry
+
+
+class RegistryWatcher:
+    """Poll routing configs and atomically swap rebuilt registries into routers.
+
+    :meth:`check` compares the files' modification times and sizes with the
+    last seen values. When they change, a new :class:`ModelRegistry` is built
+    off to the side and then assigned to each target's ``registry`` attribute
+    in a single reference swap. Routing calls already in flight keep using the
+    registry they started with; later calls see the new one, and caches keyed
+    on the registry version expire naturally. A config that fails to parse
+    leaves the current registry in place until the files change again.
+
+    Targets may also be :class:`ModelRegistry` instances, which are refilled
+    in place with :meth:`ModelRegistry.replace_all`. Pass the global
+    :data:`~naestro.routing.model_registry.REGISTRY` to make routers created
+    later with ``ModelRouter()`` start from the configured models.
+
+    :meth:`start` runs :meth:`check` on a daemon thread every ``interval``
+    seconds. Polling is used instead of inotify to stay portable and
+    dependency free. Errors raised while polling, including those from the
+    callbacks, are logged and passed to ``on_error``; the thread keeps going.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[str | Path],
+        targets: Iterable[ModelRouter | RoutePolicy | ModelRegistry],
+        *,
+        interval: float = 1.0,
+        on_reload: Callable[[ModelRegistry], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        if not paths:
+            raise ValueError("at least one config path is required")
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.paths = tuple(Path(path) for path in paths)
+        self.routers: List[ModelRouter] = []
+        self.registries: List[ModelRegistry] = []
+        for target in targets:
+            if isinstance(target, ModelRegistry):
+                self.registries.append(target)
+            elif isinstance(target, RoutePolicy):
+                self.routers.append(target.router)
+            else:
+                self.routers.append(target)
+        self.interval = interval
+        self.on_reload = on_reload
+        self.on_error = on_error
+        self.last_error: Exception | None = None
+        self._signature: tuple[tuple[int, int] | None, ...] | None = None
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Thread | None = None
+
+    def _stat(self) -> tuple[tuple[int, int] | None, ...]:
+        signature: list[tuple[int, int] | None] = []
+        for path in self.paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def check(self) -> bool:
+        """Reload the configs if they changed; return ``True`` after a swap."""
+
+        with self._lock:
+            signature = self._stat()
+            if signature == self._signature:
+                return False
+            self._signature = signature
+            try:
+                registry = load_registry(*self.paths)
+            except Exception as exc:
+                logger.warning("Keeping previous routing registry: %s", exc)
+                self._report(exc)
+                return False
+            self.last_error = None
+            for router in self.routers:
+                router.registry = registry
+            for target in self.registries:
+                target.replace_all(registry)
+        if self.on_reload is not None:
+            self.on_reload(registry)
+        return True
+
+    def start(self) -> RegistryWatcher:
+        """Load the configs now and keep polling them in the background."""
+
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self.check()
+        self._stop.clear()
+        self._thread = Thread(
+            target=self._run, name="naestro-registry-watcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as exc:
+                logger.exception("Routing registry watcher failed to poll")
+                self._report(exc)
+
+    def _report(self, exc: Exception) -> None:
+        self.last_error = exc
+        if self.on_error is None:
+            return
+        try:
+            self.on_error(exc)
+        except Exception:
+            logger.exception("Routing registry watcher on_error callback failed")
+
+    def __enter__(self) -> RegistryWatcher:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+__all__ = [
+    "RegistryWatcher",
+    "load_models",
+    "load_registry",
+    "model_from_mapping",
+]
@@ -2,8 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from itertools import count
+from threading import Lock
+from typing import (
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    TYPE_CHECKING,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .columnar import ColumnarView
 
 DEFAULT_WEIGHTS: Mapping[str, float] = {
     "quality": 0.6,
@@ -14,7 +27,13 @@ DEFAULT_WEIGHTS: Mapping[str, float] = {
 
 @dataclass(frozen=True, slots=True)
 class ModelInfo:
-    """Describes a deployable model endpoint for routing decisions."""
+    """Describes a deployable model endpoint for routing decisions.
+
+    ``latency`` and ``cost`` are the fixed per-request figures. Models may
+    additionally declare per-token prefill (prompt) and decode (response)
+    curves and a ``context_window`` so that the router can estimate the
+    end-to-end latency and cost of a specific request.
+    """
 
     name: str
     provider: str
@@ -23,6 +42,43 @@ class ModelInfo:
     latency: float
     cost: float
     metadata: Mapping[str, object] = field(default_factory=dict)
+    context_window: int | None = None
+    prefill_latency_per_token: float = 0.0
+    decode_latency_per_token: float = 0.0
+    prefill_cost_per_token: float = 0.0
+    decode_cost_per_token: float = 0.0
+
+    def fits(self, prompt_tokens: int, response_tokens: int) -> bool:
+        """Return whether the prompt plus response fit in the context window."""
+
+        if self.context_window is None:
+            return True
+        return prompt_tokens + response_tokens <= self.context_window
+
+    def estimate(self, prompt_tokens: int, response_tokens: int) -> tuple[float, float]:
+        """Return the expected ``(latency, cost)`` of a request of this size."""
+
+        latency = (
+            self.latency
+            + self.prefill_latency_per_token * prompt_tokens
+            + self.decode_latency_per_token * response_tokens
+        )
+        cost = (
+            self.cost
+            + self.prefill_cost_per_token * prompt_tokens
+            + self.decode_cost_per_token * response_tokens
+        )
+        return latency, cost
+
+    def for_request(self, prompt_tokens: int, response_tokens: int) -> ModelInfo:
+        """Return a copy whose ``latency``/``cost`` are the request estimates."""
+
+        if not (prompt_tokens or response_tokens):
+            return self
+        latency, cost = self.estimate(prompt_tokens, response_tokens)
+        if latency == self.latency and cost == self.cost:
+            return self
+        return replace(self, latency=latency, cost=cost)
 
     def score(self, weights: Mapping[str, float]) -> float:
         """Compute the weighted score for this model.
@@ -41,11 +97,28 @@ class ModelInfo:
         )
 
 
+# Versions are drawn from one process-wide counter so that two registries never
+# share a version number, which keeps version-keyed caches safe across swaps.
+_VERSIONS = count(1)
+
+
 class ModelRegistry:
-    """In-memory registry of :class:`ModelInfo` objects."""
+    """In-memory registry of :class:`ModelInfo` objects.
+
+    Besides the name lookup the registry maintains an inverted index from each
+    capability to the names of the models providing it, so capability queries
+    only touch the models in the rarest requested posting list. Updates and
+    index reads hold a lock, so a query never sees a half-applied change.
+    """
 
     def __init__(self, models: Iterable[ModelInfo] | None = None) -> None:
+        self._lock = Lock()
         self._models: Dict[str, ModelInfo] = {}
+        self._postings: Dict[str, set[str]] = {}
+        self._positions: Dict[str, int] = {}
+        self._next_position = 0
+        self._columns: ColumnarView | None = None
+        self._version = next(_VERSIONS)
         if models is not None:
             for model in models:
                 self.register(model)
@@ -53,12 +126,70 @@ class ModelRegistry:
     def register(self, model: ModelInfo) -> None:
         """Register or update a model entry."""
 
-        self._models[model.name] = model
+        with self._lock:
+            previous = self._models.get(model.name)
+            if previous is None:
+                self._positions[model.name] = self._next_position
+                self._next_position += 1
+            else:
+                self._unindex(previous)
+            self._models[model.name] = model
+            for capability in model.capabilities:
+                self._postings.setdefault(capability, set()).add(model.name)
+            self._columns = None
+            self._version = next(_VERSIONS)
 
     def unregister(self, name: str) -> None:
         """Remove a model from the registry if present."""
 
-        self._models.pop(name, None)
+        with self._lock:
+            model = self._models.pop(name, None)
+            if model is not None:
+                self._unindex(model)
+                del self._positions[name]
+                self._columns = None
+                self._version = next(_VERSIONS)
+
+    def _unindex(self, model: ModelInfo) -> None:
+        for capability in model.capabilities:
+            posting = self._postings.get(capability)
+            if posting is None:
+                continue
+            posting.discard(model.name)
+            if not posting:
+                del self._postings[capability]
+
+    def candidates(self, required: Collection[str]) -> list[ModelInfo]:
+        """Return models providing every capability in ``required``.
+
+        Posting lists are intersected starting from the rarest capability and
+        the result preserves registration order.
+        """
+
+        with self._lock:
+            if not required:
+                return list(self._models.values())
+            postings: list[set[str]] = []
+            for capability in required:
+                posting = self._postings.get(capability)
+                if not posting:
+                    return []
+                postings.append(posting)
+            postings.sort(key=len)
+            names = set(postings[0])
+            for posting in postings[1:]:
+                names.intersection_update(posting)
+                if not names:
+                    return []
+            ordered = sorted(names, key=self._positions.__getitem__)
+            return [self._models[name] for name in ordered]
+
+    def capability_counts(self) -> Mapping[str, int]:
+        """Return the number of registered models per capability."""
+
+        with self._lock:
+            postings = self._postings.items()
+            return {capability: len(names) for capability, names in postings}
 
     def get(self, name: str) -> ModelInfo:
         """Return the :class:`ModelInfo` with ``name``.
@@ -72,6 +203,12 @@ class ModelRegistry:
         except KeyError as exc:  # pragma: no cover - defensive
             raise KeyError(f"Unknown model '{name}'") from exc
 
+    @property
+    def version(self) -> int:
+        """Opaque counter that changes whenever the registry contents change."""
+
+        return self._version
+
     def __contains__(self, name: str) -> bool:
         return name in self._models
 
@@ -79,13 +216,61 @@ class ModelRegistry:
         return iter(self._models.values())
 
     def values(self) -> Sequence[ModelInfo]:
-        return list(self._models.values())
+        with self._lock:
+            return list(self._models.values())
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def columns(self) -> ColumnarView:
+        """Return a cached column-oriented snapshot of the registry.
+
+        The snapshot is rebuilt lazily after ``register``/``unregister``.
+
+        Raises:
+            RuntimeError: If numpy is not installed.
+        """
+
+        view = self._columns
+        if view is None:
+            from .columnar import ColumnarView
+
+            with self._lock:
+                view = self._columns
+                if view is None:
+                    view = ColumnarView(self._models.values())
+                    self._columns = view
+        return view
 
     def clear(self) -> None:
-        self._models.clear()
+        with self._lock:
+            self._models.clear()
+            self._postings.clear()
+            self._positions.clear()
+            self._columns = None
+            self._version = next(_VERSIONS)
 
     def copy(self) -> "ModelRegistry":
-        return ModelRegistry(self._models.values())
+        return ModelRegistry(self.values())
+
+    def replace_all(self, models: Iterable[ModelInfo]) -> None:
+        """Replace the contents with ``models`` in place.
+
+        The new models and indexes are built off to the side and published
+        together under the lock, so concurrent queries see either the previous
+        or the new contents, never a mix. This is how
+        :class:`~naestro.routing.loader.RegistryWatcher` keeps the global
+        :data:`REGISTRY` in sync with routing configs.
+        """
+
+        fresh = ModelRegistry(models)
+        with self._lock:
+            self._models = fresh._models
+            self._postings = fresh._postings
+            self._positions = fresh._positions
+            self._next_position = fresh._next_position
+            self._columns = fresh._columns
+            self._version = next(_VERSIONS)
 
 
 REGISTRY = ModelRegistry()
@@ -3,31 +3,114 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, cast, Iterable, Mapping, Sequence
+from typing import Any, cast, Iterable, Mapping, Sequence, TYPE_CHECKING
 
+from .cache import CacheStats, DecisionCache
+from .feedback import FeedbackSnapshot, FeedbackTracker
 from .model_registry import DEFAULT_WEIGHTS, ModelInfo, ModelRegistry, REGISTRY
+from .strategies import (
+    default_strategies,
+    GreedyStrategy,
+    InflightTracker,
+    SelectionStrategy,
+)
 from .task_specs import BaseTaskSpec, ChatTaskSpec, TaskSpec, ToolTaskSpec
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from types import ModuleType
+
+    import numpy as np
+
+    from .columnar import ColumnarView
+
+_columnar: ModuleType | None
+try:  # pragma: no cover - depends on the optional numpy install
+    from . import columnar as _columnar
+except RuntimeError:  # pragma: no cover - numpy missing
+    _columnar = None
+
 TaskConfiguration = BaseTaskSpec | TaskSpec | ChatTaskSpec | ToolTaskSpec
 
+VECTORIZE_MIN_MODELS = 32
+"""Registry size from which :class:`ModelRouter` switches to numpy scoring."""
+
+DEFAULT_CACHE_SIZE = 256
+"""Default number of routing decisions memoised per :class:`ModelRouter`."""
+
 
 def _as_mapping(spec: TaskConfiguration) -> Mapping[str, Any]:
     return cast(Mapping[str, Any], spec)
 
 
+@dataclass(frozen=True, slots=True)
+class _RoutingQuery:
+    """Normalised, hashable form of the routing-relevant task spec fields."""
+
+    required: frozenset[str]
+    weights: tuple[tuple[str, float], ...]
+    excluded: frozenset[str]
+    min_quality: float | None
+    max_latency: float | None
+    max_cost: float | None
+    prompt_tokens: int = 0
+    response_tokens: int = 0
+
+    @property
+    def weight_map(self) -> Mapping[str, float]:
+        return dict(self.weights)
+
+
 @dataclass
 class ModelRouter:
     """Select models from a :class:`ModelRegistry` given a task specification."""
 
     registry: ModelRegistry
     default_weights: Mapping[str, float]
+    vectorize: bool | None
+    cache: DecisionCache[Any]
+    feedback: FeedbackTracker
+    inflight: InflightTracker
+    strategies: dict[str, SelectionStrategy]
+    default_strategy: str
 
     def __init__(
         self,
         registry: ModelRegistry | Iterable[ModelInfo] | None = None,
         *,
         default_weights: Mapping[str, float] | None = None,
+        vectorize: bool | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        feedback: FeedbackTracker | None = None,
+        strategies: Mapping[str, SelectionStrategy] | None = None,
+        default_strategy: str = "greedy",
+        inflight: InflightTracker | None = None,
     ) -> None:
+        """Create a router.
+
+        Args:
+            registry: Registry or iterable of models to route over. Defaults to a
+                copy of the global :data:`REGISTRY`.
+            default_weights: Scoring weights used when a spec provides none.
+            vectorize: Force (``True``) or disable (``False``) numpy scoring over
+                the registry's columnar view. ``None`` enables it automatically
+                for registries with at least :data:`VECTORIZE_MIN_MODELS` entries
+                when numpy is installed.
+            cache_size: Maximum number of memoised decisions. Entries are keyed
+                on the normalised task spec plus the registry version, so they
+                expire automatically on ``register``/``unregister``. ``0``
+                disables caching.
+            feedback: Tracker of observed latency, cost and errors. Smoothed
+                observations replace the static ``ModelInfo`` figures when
+                scoring and ejected endpoints are skipped while any healthy
+                candidate remains.
+            strategies: Additional or replacement selection strategies keyed by
+                the name a task spec passes in its ``strategy`` field.
+            default_strategy: Strategy used when a spec does not name one.
+            inflight: Shared in-flight request counters consulted by the
+                ``p2c`` strategy. Callers should wrap requests in
+                :meth:`InflightTracker.track`.
+        """
+
         if registry is None:
             self.registry = REGISTRY.copy()
         elif isinstance(registry, ModelRegistry):
@@ -35,6 +118,18 @@ class ModelRouter:
         else:
             self.registry = ModelRegistry(registry)
         self.default_weights = dict(default_weights or DEFAULT_WEIGHTS)
+        if vectorize and _columnar is None:
+            raise RuntimeError("Vectorised routing requires numpy to be installed")
+        self.vectorize = vectorize
+        self.cache = DecisionCache(cache_size)
+        self.feedback = feedback or FeedbackTracker()
+        self._adjusted: tuple[int, int, ColumnarView] | None = None
+        self.inflight = inflight or InflightTracker()
+        self.strategies = default_strategies(self.inflight)
+        self.strategies.update(strategies or {})
+        if default_strategy not in self.strategies:
+            raise ValueError(f"Unknown selection strategy '{default_strategy}'")
+        self.default_strategy = default_strategy
 
     def available_models(self) -> Sequence[ModelInfo]:
         """Return all registered models."""
@@ -46,47 +141,218 @@ class ModelRouter:
 
         self.registry.register(model)
 
+    def report(
+        self,
+        name: str,
+        *,
+        latency: float | None = None,
+        cost: float | None = None,
+        error: bool = False,
+    ) -> None:
+        """Feed an observed request outcome for ``name`` back into routing."""
+
+        self.feedback.report(name, latency=latency, cost=cost, error=error)
+
     def select_model(self, spec: TaskConfiguration) -> ModelInfo:
-        """Select the highest scoring model for ``spec``.
+        """Select a model for ``spec`` using its selection strategy.
+
+        The default ``greedy`` strategy returns the highest scoring model. Specs
+        may name another strategy (``softmax``, ``p2c``, ``consistent_hash`` or
+        a custom one) in their ``strategy`` field to spread load across
+        near-equal candidates.
+
+        When the spec carries ``prompt_tokens`` and/or
+        ``expected_response_tokens``, models whose context window cannot hold
+        the request are skipped and latency/cost (including ``max_latency`` and
+        ``max_cost``) are evaluated on the per-request estimates from
+        :meth:`ModelInfo.estimate`.
 
         Raises:
-            ValueError: If no candidate satisfies the constraints.
+            ValueError: If no candidate satisfies the constraints or the
+                requested strategy is unknown.
         """
 
-        ranked = self.rank_models(spec)
-        if not ranked:
-            task = _as_mapping(spec).get("task", "<unknown>")
+        data = _as_mapping(spec)
+        name = data.get("strategy") or self.default_strategy
+        try:
+            strategy = self.strategies[name]
+        except KeyError as exc:
+            raise ValueError(f"Unknown selection strategy '{name}'") from exc
+        query = self._build_query(spec)
+        selected: ModelInfo | None
+        if isinstance(strategy, GreedyStrategy):
+            # The argmax path avoids ranking every candidate.
+            registry = self.registry
+            snapshot = self.feedback.snapshot()
+            key = ("select", query, registry.version, snapshot.version)
+            found, selected = self.cache.lookup(key)
+            if not found:
+                selected = self._select_uncached(registry, query, snapshot)
+                self.cache.store(key, selected)
+        else:
+            candidates = self._scored(query, None)
+            selected = strategy.choose(candidates, data) if candidates else None
+        if selected is None:
+            task = data.get("task", "<unknown>")
             raise ValueError(
                 f"No model satisfies requested capabilities for task '{task}'"
             )
-        return ranked[0]
+        return selected
+
+    def rank_models(
+        self, spec: TaskConfiguration, *, limit: int | None = None
+    ) -> list[ModelInfo]:
+        """Return matching models sorted from best to worst.
 
-    def rank_models(self, spec: TaskConfiguration) -> list[ModelInfo]:
-        """Return all matching models sorted from best to worst."""
+        Args:
+            spec: Task specification describing requirements and weights.
+            limit: Optionally return only the ``limit`` best candidates.
+        """
+
+        return [model for model, _ in self.score_models(spec, limit=limit)]
+
+    def score_models(
+        self, spec: TaskConfiguration, *, limit: int | None = None
+    ) -> list[tuple[ModelInfo, float]]:
+        """Return ``(model, score)`` pairs sorted from best to worst."""
+
+        return list(self._scored(self._build_query(spec), limit))
+
+    def _scored(
+        self, query: _RoutingQuery, limit: int | None
+    ) -> tuple[tuple[ModelInfo, float], ...]:
+        registry = self.registry
+        snapshot = self.feedback.snapshot()
+        key = ("rank", query, limit, registry.version, snapshot.version)
+        found, ranked = self.cache.lookup(key)
+        if not found:
+            ranked = tuple(self._rank_uncached(registry, query, snapshot, limit))
+            self.cache.store(key, ranked)
+        return cast(tuple[tuple[ModelInfo, float], ...], ranked)
+
+    def cache_stats(self) -> CacheStats:
+        """Return hit rate and lookup latency counters for the decision cache."""
 
+        return self.cache.stats()
+
+    def _select_uncached(
+        self,
+        registry: ModelRegistry,
+        query: _RoutingQuery,
+        snapshot: FeedbackSnapshot,
+    ) -> ModelInfo | None:
+        if self._use_columns(registry):
+            view = self._columns(registry, snapshot).for_request(
+                query.prompt_tokens, query.response_tokens
+            )
+            keep = self._column_mask(view, query, snapshot)
+            return view.select(view.scores(query.weight_map), keep)
+        ranked = self._rank_scalar(registry, query, snapshot)
+        return ranked[0][0] if ranked else None
+
+    def _rank_uncached(
+        self,
+        registry: ModelRegistry,
+        query: _RoutingQuery,
+        snapshot: FeedbackSnapshot,
+        limit: int | None,
+    ) -> list[tuple[ModelInfo, float]]:
+        if self._use_columns(registry):
+            view = self._columns(registry, snapshot).for_request(
+                query.prompt_tokens, query.response_tokens
+            )
+            keep = self._column_mask(view, query, snapshot)
+            return view.rank(view.scores(query.weight_map), keep, limit)
+        ranked = self._rank_scalar(registry, query, snapshot)
+        return ranked if limit is None else ranked[: max(limit, 0)]
+
+    def _use_columns(self, registry: ModelRegistry) -> bool:
+        if self.vectorize is None:
+            return _columnar is not None and len(registry) >= VECTORIZE_MIN_MODELS
+        return self.vectorize
+
+    def _columns(
+        self, registry: ModelRegistry, snapshot: FeedbackSnapshot
+    ) -> ColumnarView:
+        view = registry.columns()
+        if not snapshot.overrides:
+            return view
+        cached = self._adjusted
+        versions = (registry.version, snapshot.version)
+        if cached is not None and cached[:2] == versions:
+            return cached[2]
+        adjusted = view.adjusted(snapshot.overrides)
+        self._adjusted = (registry.version, snapshot.version, adjusted)
+        return adjusted
+
+    def _build_query(self, spec: TaskConfiguration) -> _RoutingQuery:
         data = _as_mapping(spec)
-        required = self._normalise_capabilities(data["required_capabilities"])
-        weights = self._resolve_weights(data)
-        excluded = {name for name in self._iterable_of_strings(data.get("exclude"))}
-        min_quality = self._optional_float(data.get("min_quality"))
-        max_latency = self._optional_float(data.get("max_latency"))
-        max_cost = self._optional_float(data.get("max_cost"))
+        return _RoutingQuery(
+            required=self._normalise_capabilities(data["required_capabilities"]),
+            weights=tuple(sorted(self._resolve_weights(data).items())),
+            excluded=frozenset(self._iterable_of_strings(data.get("exclude"))),
+            min_quality=self._optional_float(data.get("min_quality")),
+            max_latency=self._optional_float(data.get("max_latency")),
+            max_cost=self._optional_float(data.get("max_cost")),
+            prompt_tokens=self._token_count(data.get("prompt_tokens")),
+            response_tokens=self._token_count(data.get("expected_response_tokens")),
+        )
+
+    @staticmethod
+    def _column_mask(
+        view: ColumnarView, query: _RoutingQuery, snapshot: FeedbackSnapshot
+    ) -> np.ndarray:
+        def mask(excluded: frozenset[str]) -> np.ndarray:
+            return view.mask(
+                query.required,
+                excluded=excluded,
+                min_quality=query.min_quality,
+                max_latency=query.max_latency,
+                max_cost=query.max_cost,
+                min_context=query.prompt_tokens + query.response_tokens,
+            )
+
+        if not snapshot.ejected:
+            return mask(query.excluded)
+        keep = mask(query.excluded | snapshot.ejected)
+        # Panic mode: route to ejected endpoints rather than to nothing at all.
+        return keep if keep.any() else mask(query.excluded)
+
+    @staticmethod
+    def _rank_scalar(
+        registry: ModelRegistry, query: _RoutingQuery, snapshot: FeedbackSnapshot
+    ) -> list[tuple[ModelInfo, float]]:
+        excluded = query.excluded
+        weights = query.weight_map
+        min_quality = query.min_quality
+        max_latency = query.max_latency
+        max_cost = query.max_cost
+        prompt_tokens = query.prompt_tokens
+        response_tokens = query.response_tokens
 
         scored: list[tuple[float, ModelInfo]] = []
-        for model in self.registry:
+        ejected: list[tuple[float, ModelInfo]] = []
+        for model in registry.candidates(query.required):
             if excluded and model.name in excluded:
                 continue
-            if not required.issubset(model.capabilities):
+            if not model.fits(prompt_tokens, response_tokens):
                 continue
-            if min_quality is not None and model.quality < min_quality:
+            effective = snapshot.adjust(model).for_request(
+                prompt_tokens, response_tokens
+            )
+            if min_quality is not None and effective.quality < min_quality:
                 continue
-            if max_latency is not None and model.latency > max_latency:
+            if max_latency is not None and effective.latency > max_latency:
                 continue
-            if max_cost is not None and model.cost > max_cost:
+            if max_cost is not None and effective.cost > max_cost:
                 continue
-            scored.append((model.score(weights), model))
+            bucket = ejected if model.name in snapshot.ejected else scored
+            bucket.append((effective.score(weights), model))
+        # Panic mode: route to ejected endpoints rather than to nothing at all.
+        if not scored:
+            scored = ejected
         scored.sort(key=lambda item: item[0], reverse=True)
-        return [model for _, model in scored]
+        return [(model, score) for score, model in scored]
 
     @staticmethod
     def _normalise_capabilities(values: object) -> frozenset[str]:
@@ -124,6 +390,14 @@ class ModelRouter:
             return float(value)
         raise TypeError("constraint values must be numeric if provided")
 
+    @staticmethod
+    def _token_count(value: object) -> int:
+        if value is None:
+            return 0
+        if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+            return value
+        raise TypeError("token counts must be non-negative integers if provided")
+
 
 class RoutePolicy:
     """Callable wrapper around :class:`ModelRouter` for policy-based routing."""
@@ -133,18 +407,40 @@ class RoutePolicy:
         registry: ModelRegistry | Iterable[ModelInfo] | None = None,
         *,
         default_weights: Mapping[str, float] | None = None,
+        vectorize: bool | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        feedback: FeedbackTracker | None = None,
+        strategies: Mapping[str, SelectionStrategy] | None = None,
+        default_strategy: str = "greedy",
+        inflight: InflightTracker | None = None,
     ) -> None:
-        self.router = ModelRouter(registry, default_weights=default_weights)
+        self.router = ModelRouter(
+            registry,
+            default_weights=default_weights,
+            vectorize=vectorize,
+            cache_size=cache_size,
+            feedback=feedback,
+            strategies=strategies,
+            default_strategy=default_strategy,
+            inflight=inflight,
+        )
 
     def __call__(self, spec: TaskConfiguration) -> ModelInfo:
         """Select the best model for ``spec``."""
 
         return self.router.select_model(spec)
 
-    def rank(self, spec: TaskConfiguration) -> list[ModelInfo]:
+    def rank(
+        self, spec: TaskConfiguration, *, limit: int | None = None
+    ) -> list[ModelInfo]:
         """Return the ranked candidates for ``spec``."""
 
-        return self.router.rank_models(spec)
+        return self.router.rank_models(spec, limit=limit)
 
 
-__all__ = ["ModelRouter", "RoutePolicy"]
+__all__ = [
+    "DEFAULT_CACHE_SIZE",
+    "ModelRouter",
+    "RoutePolicy",
+    "VECTORIZE_MIN_MODELS",
+]
@@ -0,0 +1,300 @@
+"""Discrete-event simulation of routing policies against a modelled fleet."""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from dataclasses import dataclass, field
+import heapq
+import json
+from math import exp
+from pathlib import Path
+from random import Random
+from typing import Any, Callable, cast, Iterable, List, Mapping, Sequence
+
+from .model_registry import ModelInfo
+from .router import ModelRouter, RoutePolicy, TaskConfiguration
+
+ServiceTime = Callable[[Random, float], float]
+"""Sample a service time in seconds given the model's expected latency."""
+
+
+def exponential(rng: Random, mean: float) -> float:
+    """Exponentially distributed service time with the expected mean."""
+
+    return rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+
+
+def lognormal(sigma: float) -> ServiceTime:
+    """Return a long-tailed log-normal sampler whose mean is the expectation."""
+
+    def sample(rng: Random, mean: float) -> float:
+        if mean <= 0:
+            return 0.0
+        return rng.lognormvariate(0.0, sigma) * mean / exp(sigma * sigma / 2.0)
+
+    return sample
+
+
+@dataclass(frozen=True, slots=True)
+class Endpoint:
+    """Serving capacity of one model in the simulated fleet.
+
+    Requests occupy one of ``capacity`` concurrent slots for a service time
+    drawn from ``service_time``. Requests that find every slot busy wait in a
+    FIFO queue; once ``queue_limit`` requests are waiting, new arrivals are
+    rejected.
+    """
+
+    capacity: int = 1
+    queue_limit: int | None = None
+    service_time: ServiceTime = exponential
+
+
+@dataclass(frozen=True, slots=True)
+class Arrival:
+    """A task spec entering the system at ``time`` seconds."""
+
+    time: float
+    spec: Mapping[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationReport:
+    """Aggregate outcome of one :func:`simulate` run."""
+
+    requests: int
+    completed: int
+    rejected: int
+    p50: float
+    p95: float
+    p99: float
+    mean_latency: float
+    total_cost: float
+    assignments: Mapping[str, int] = field(default_factory=dict)
+
+    @property
+    def rejection_rate(self) -> float:
+        return self.rejected / self.requests if self.requests else 0.0
+
+    @property
+    def mean_cost(self) -> float:
+        return self.total_cost / self.completed if self.completed else 0.0
+
+    @property
+    def max_share(self) -> float:
+        """Fraction of routed requests sent to the busiest model."""
+
+        routed = sum(self.assignments.values())
+        return max(self.assignments.values()) / routed if routed else 0.0
+
+
+def synthetic_arrivals(
+    specs: Sequence[Mapping[str, Any]],
+    *,
+    rate: float,
+    count: int,
+    weights: Sequence[float] | None = None,
+    seed: int = 0,
+) -> List[Arrival]:
+    """Draw a Poisson arrival stream of ``count`` specs at ``rate`` per second."""
+
+    if rate <= 0:
+        raise ValueError("rate must be positive")
+    rng = Random(seed)
+    chosen = rng.choices(list(specs), weights=weights, k=count)
+    arrivals: List[Arrival] = []
+    now = 0.0
+    for spec in chosen:
+        now += rng.expovariate(rate)
+        arrivals.append(Arrival(now, spec))
+    return arrivals
+
+
+def load_trace(path: str | Path) -> List[Arrival]:
+    """Read a recorded JSON Lines trace of ``{"time": ..., "spec": {...}}``."""
+
+    arrivals: List[Arrival] = []
+    source = Path(path)
+    for number, line in enumerate(source.read_text(encoding="utf-8").splitlines()):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if "time" not in record or "spec" not in record:
+            raise ValueError(f"{source}:{number + 1} needs 'time' and 'spec' keys")
+        arrivals.append(Arrival(float(record["time"]), record["spec"]))
+    arrivals.sort(key=lambda arrival: arrival.time)
+    return arrivals
+
+
+def simulate(
+    router: ModelRouter | RoutePolicy,
+    arrivals: Iterable[Arrival],
+    *,
+    endpoints: Mapping[str, Endpoint] | None = None,
+    default_endpoint: Endpoint | None = None,
+    spec_overrides: Mapping[str, Any] | None = None,
+    report_feedback: bool = False,
+    seed: int = 0,
+) -> SimulationReport:
+    """Replay ``arrivals`` through ``router`` and a queueing model of the fleet.
+
+    Time is virtual: the run is deterministic for a given ``seed`` and takes
+    milliseconds regardless of the simulated duration. The expected service
+    time and cost of each request come from :meth:`ModelInfo.estimate`, so
+    token counts in the specs are honoured. ``spec_overrides`` are merged into
+    every spec, e.g. ``{"strategy": "p2c"}`` or ``{"weights": {...}}``.
+    In-flight counts are maintained on the router for load-aware strategies and
+    ``report_feedback`` feeds completed latencies back via
+    :meth:`ModelRouter.report`.
+
+    Models missing from ``endpoints`` use ``default_endpoint``, a plain
+    :class:`Endpoint` unless given. Rejections are arrivals that no model can
+    serve or that meet a full queue.
+    """
+
+    model_router = router.router if isinstance(router, RoutePolicy) else router
+    endpoints = endpoints or {}
+    fallback = Endpoint() if default_endpoint is None else default_endpoint
+    overrides = dict(spec_overrides or {})
+    rng = Random(seed)
+
+    busy: Counter[str] = Counter()
+    queues: dict[str, deque[tuple[float, ModelInfo, int, int]]] = {}
+    # Heap of (finish time, sequence, model name, arrival time).
+    events: list[tuple[float, int, str, float]] = []
+    latencies: list[float] = []
+    assignments: Counter[str] = Counter()
+    requests = rejected = 0
+    total_cost = 0.0
+    sequence = 0
+
+    def endpoint(name: str) -> Endpoint:
+        return endpoints.get(name, fallback)
+
+    def start(
+        model: ModelInfo, arrived: float, at: float, tokens: tuple[int, int]
+    ) -> None:
+        nonlocal sequence, total_cost
+        expected, cost = model.estimate(*tokens)
+        busy[model.name] += 1
+        total_cost += cost
+        sequence += 1
+        finish = at + endpoint(model.name).service_time(rng, expected)
+        heapq.heappush(events, (finish, sequence, model.name, arrived))
+
+    def complete(until: float) -> None:
+        while events and events[0][0] <= until:
+            finished, _, name, arrived = heapq.heappop(events)
+            latency = finished - arrived
+            latencies.append(latency)
+            busy[name] -= 1
+            model_router.inflight.release(name)
+            if report_feedback:
+                model_router.report(name, latency=latency)
+            waiting = queues.get(name)
+            if waiting:
+                queued_at, model, prompt, response = waiting.popleft()
+                start(model, queued_at, finished, (prompt, response))
+
+    for arrival in arrivals:
+        complete(arrival.time)
+        requests += 1
+        spec = {**arrival.spec, **overrides}
+        try:
+            model = model_router.select_model(cast(TaskConfiguration, spec))
+        except ValueError:
+            rejected += 1
+            continue
+        tokens = (
+            int(spec.get("prompt_tokens") or 0),
+            int(spec.get("expected_response_tokens") or 0),
+        )
+        serving = endpoint(model.name)
+        if busy[model.name] < serving.capacity:
+            start(model, arrival.time, arrival.time, tokens)
+        else:
+            waiting = queues.setdefault(model.name, deque())
+            limit = serving.queue_limit
+            if limit is not None and len(waiting) >= limit:
+                rejected += 1
+                continue
+            waiting.append((arrival.time, model, *tokens))
+        assignments[model.name] += 1
+        model_router.inflight.acquire(model.name)
+    complete(float("inf"))
+
+    return SimulationReport(
+        requests=requests,
+        completed=len(latencies),
+        rejected=rejected,
+        p50=percentile(latencies, 0.50),
+        p95=percentile(latencies, 0.95),
+        p99=percentile(latencies, 0.99),
+        mean_latency=sum(latencies) / len(latencies) if latencies else 0.0,
+        total_cost=total_cost,
+        assignments=dict(assignments),
+    )
+
+
+def compare(
+    variants: Mapping[str, Callable[[], ModelRouter | RoutePolicy]],
+    arrivals: Sequence[Arrival],
+    **options: Any,
+) -> dict[str, SimulationReport]:
+    """Run :func:`simulate` once per variant on the same arrivals and seed.
+
+    Each variant is a factory so that every run starts from a fresh router
+    with empty caches, feedback and in-flight counters.
+    """
+
+    return {
+        label: simulate(factory(), arrivals, **options)
+        for label, factory in variants.items()
+    }
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Percentile of ``values``; ``0.0`` when empty.
+
+    Returns the sample whose rank is closest to ``fraction * (len - 1)`` in
+    sorted order, the linear-interpolation position without interpolating.
+    """
+
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def format_reports(reports: Mapping[str, SimulationReport]) -> str:
+    """Render reports as a fixed-width table."""
+
+    header = (
+        f"{'variant':<20}{'p50':>9}{'p95':>9}{'p99':>9}"
+        f"{'mean cost':>11}{'rejected':>10}{'max share':>11}"
+    )
+    rows = [header]
+    for label, report in reports.items():
+        rows.append(
+            f"{label:<20}{report.p50:>9.3f}{report.p95:>9.3f}{report.p99:>9.3f}"
+            f"{report.mean_cost:>11.4f}{report.rejection_rate:>10.1%}"
+            f"{report.max_share:>11.1%}"
+        )
+    return "\n".join(rows)
+
+
+__all__ = [
+    "Arrival",
+    "Endpoint",
+    "ServiceTime",
+    "SimulationReport",
+    "compare",
+    "exponential",
+    "format_reports",
+    "load_trace",
+    "lognormal",
+    "percentile",
+    "simulate",
+    "synthetic_arrivals",
+]
@@ -0,0 +1,197 @@
+"""Load-balancing strategies applied on top of ranked routing candidates."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import defaultdict
+from contextlib import contextmanager
+from hashlib import blake2b
+from math import exp
+from random import Random
+from threading import Lock
+from typing import Any, Iterator, Mapping, Protocol, Sequence
+
+from .model_registry import ModelInfo
+
+Candidates = Sequence[tuple[ModelInfo, float]]
+"""Ranked ``(model, score)`` pairs, best first, as produced by the router."""
+
+
+class SelectionStrategy(Protocol):
+    """Pick one model out of the ranked candidates for a task spec."""
+
+    def choose(  # pragma: no cover - protocol method
+        self, candidates: Candidates, spec: Mapping[str, Any]
+    ) -> ModelInfo:
+        """Return the model that should serve ``spec``."""
+
+
+class InflightTracker:
+    """Thread-safe counters of requests currently executing per model."""
+
+    def __init__(self) -> None:
+        self._counts: dict[str, int] = defaultdict(int)
+        self._lock = Lock()
+
+    def acquire(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def release(self, name: str) -> None:
+        with self._lock:
+            remaining = self._counts[name] - 1
+            if remaining > 0:
+                self._counts[name] = remaining
+            else:
+                self._counts.pop(name, None)
+
+    def get(self, name: str) -> int:
+        return self._counts.get(name, 0)
+
+    @contextmanager
+    def track(self, name: str) -> Iterator[None]:
+        """Count a request against ``name`` for the duration of the block."""
+
+        self.acquire(name)
+        try:
+            yield
+        finally:
+            self.release(name)
+
+
+class GreedyStrategy:
+    """Always return the top-ranked model."""
+
+    def choose(self, candidates: Candidates, spec: Mapping[str, Any]) -> ModelInfo:
+        return candidates[0][0]
+
+
+class SoftmaxStrategy:
+    """Sample candidates with probability ``softmax(score / temperature)``.
+
+    Specs may override the temperature with a ``temperature`` field. Low
+    temperatures approach greedy selection; high ones approach uniform.
+    """
+
+    def __init__(
+        self,
+        temperature: float = 0.05,
+        *,
+        top_k: int | None = None,
+        rng: Random | None = None,
+    ) -> None:
+        if temperature <= 0:
+            raise ValueError("temperature must be positive")
+        self.temperature = temperature
+        self.top_k = top_k
+        self._rng = rng or Random()
+
+    def choose(self, candidates: Candidates, spec: Mapping[str, Any]) -> ModelInfo:
+        pool = candidates[: self.top_k] if self.top_k else candidates
+        override = spec.get("temperature")
+        temperature = self.temperature if override is None else float(override)
+        if temperature <= 0:
+            raise ValueError("temperature must be positive")
+        best = pool[0][1]
+        weights = [exp((score - best) / temperature) for _, score in pool]
+        return self._rng.choices(pool, weights=weights)[0][0]
+
+
+class PowerOfTwoChoices:
+    """Sample two candidates and keep the one with fewer in-flight requests.
+
+    Sampling is uniform over the ``top_k`` best candidates so that clearly
+    inferior models are never considered. Ties go to the higher score.
+    """
+
+    def __init__(
+        self,
+        inflight: InflightTracker,
+        *,
+        top_k: int | None = 4,
+        rng: Random | None = None,
+    ) -> None:
+        self.inflight = inflight
+        self.top_k = top_k
+        self._rng = rng or Random()
+
+    def choose(self, candidates: Candidates, spec: Mapping[str, Any]) -> ModelInfo:
+        pool = candidates[: self.top_k] if self.top_k else candidates
+        if len(pool) == 1:
+            return pool[0][0]
+        first, second = sorted(self._rng.sample(range(len(pool)), 2))
+        a, b = pool[first][0], pool[second][0]
+        return b if self.inflight.get(b.name) < self.inflight.get(a.name) else a
+
+
+class ConsistentHashStrategy:
+    """Map a spec's ``affinity_key`` onto a hash ring of the candidates.
+
+    Requests sharing an affinity key (a tenant, conversation or prompt prefix)
+    land on the same model while the candidate set is stable, which keeps
+    provider-side prompt caches warm. Adding or removing a model only remaps
+    the keys adjacent to its ring points. Specs without a key fall back to the
+    top-ranked model.
+    """
+
+    def __init__(self, *, replicas: int = 64, top_k: int | None = None) -> None:
+        if replicas <= 0:
+            raise ValueError("replicas must be positive")
+        self.replicas = replicas
+        self.top_k = top_k
+        self._rings: dict[tuple[str, ...], tuple[list[int], list[str]]] = {}
+        self._lock = Lock()
+
+    def choose(self, candidates: Candidates, spec: Mapping[str, Any]) -> ModelInfo:
+        pool = candidates[: self.top_k] if self.top_k else candidates
+        key = spec.get("affinity_key")
+        if key is None:
+            return pool[0][0]
+        models = {model.name: model for model, _ in pool}
+        points, owners = self._ring(tuple(sorted(models)))
+        index = bisect_right(points, _hash(str(key))) % len(points)
+        # The ring holds names, so updated models are never served stale.
+        return models[owners[index]]
+
+    def _ring(self, names: tuple[str, ...]) -> tuple[list[int], list[str]]:
+        ring = self._rings.get(names)
+        if ring is not None:
+            return ring
+        entries = sorted(
+            (_hash(f"{name}#{replica}"), name)
+            for name in names
+            for replica in range(self.replicas)
+        )
+        ring = ([point for point, _ in entries], [name for _, name in entries])
+        with self._lock:
+            if len(self._rings) >= 128:
+                self._rings.clear()
+            self._rings[names] = ring
+        return ring
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def default_strategies(inflight: InflightTracker) -> dict[str, SelectionStrategy]:
+    """Return the builtin strategies keyed by the names specs may request."""
+
+    return {
+        "greedy": GreedyStrategy(),
+        "softmax": SoftmaxStrategy(),
+        "p2c": PowerOfTwoChoices(inflight),
+        "consistent_hash": ConsistentHashStrategy(),
+    }
+
+
+__all__ = [
+    "Candidates",
+    "ConsistentHashStrategy",
+    "GreedyStrategy",
+    "InflightTracker",
+    "PowerOfTwoChoices",
+    "SelectionStrategy",
+    "SoftmaxStrategy",
+    "default_strategies",
+]
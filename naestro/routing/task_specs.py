@@ -25,13 +25,17 @@ class TaskSpec(BaseTaskSpec, total=False):
     max_latency: float
     max_cost: float
     metadata: Mapping[str, object]
+    strategy: str
+    temperature: float
+    affinity_key: str
+    prompt_tokens: int
+    expected_response_tokens: int
 
 
 class ChatTaskSpec(TaskSpec, total=False):
     """Specialisation for conversational tasks."""
 
     style: str
-    expected_response_tokens: int
 
 
 class ToolTaskSpec(TaskSpec, total=False):
@@ -3,4 +3,13 @@
 from .collab_policy import CollaborationMode, CollaborationPolicy
 from .router import Router
 
-__all__ = ["CollaborationMode", "CollaborationPolicy", "Router"]
+__all__ = ["CollaborationMode", "CollaborationPolicy", "LearnedModePolicy", "Router"]
+
+
+def __getattr__(name: str) -> object:
+    # Imported lazily so that the router package does not require numpy.
+    if name == "LearnedModePolicy":
+        from .learned_policy import LearnedModePolicy
+
+        return LearnedModePolicy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,162 @@
+"""Serve a trained PPO router policy on the request path."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from .collab_policy import CollaborationMode, CollaborationPolicy
+
+logger = logging.getLogger(__name__)
+
+OBSERVATION_FIELDS = ("traffic_load", "latency", "collaboration_pressure", "backlog")
+"""Order of the observation features the PPO router environment trains on."""
+
+
+class LearnedModePolicy:
+    """Greedy numpy forward pass over a trained ``SimpleCategoricalPolicy``.
+
+    Only the policy head is evaluated: ``argmax(obs @ policy_w + policy_b)``.
+    Modes whose :class:`CollaborationPolicy` rule cannot accommodate the number
+    of agents on a request are masked out before the ``argmax``. When no
+    weights are loaded every request gets ``fallback``.
+    """
+
+    def __init__(
+        self,
+        policy_w: np.ndarray | None = None,
+        policy_b: np.ndarray | None = None,
+        *,
+        modes: Sequence[CollaborationMode] | None = None,
+        fallback: CollaborationMode = CollaborationMode.SOLO,
+    ) -> None:
+        self.modes = tuple(modes or CollaborationMode)
+        self.fallback = fallback
+        self.policy_w: np.ndarray | None = None
+        self.policy_b: np.ndarray | None = None
+        if policy_w is not None:
+            weights = np.ascontiguousarray(policy_w, dtype=np.float64)
+            bias = np.zeros(weights.shape[-1]) if policy_b is None else policy_b
+            bias = np.ascontiguousarray(bias, dtype=np.float64)
+            if weights.ndim != 2 or weights.shape[1] != len(self.modes):
+                raise ValueError(
+                    f"policy_w must have shape (observation_dim, {len(self.modes)})"
+                )
+            if bias.shape != (len(self.modes),):
+                raise ValueError(f"policy_b must have shape ({len(self.modes)},)")
+            self.policy_w, self.policy_b = weights, bias
+        rules = [CollaborationPolicy.RULES[mode] for mode in self.modes]
+        self._min_agents = np.array([rule.min_agents for rule in rules])
+        self._max_agents = np.array(
+            [np.inf if rule.max_agents is None else rule.max_agents for rule in rules]
+        )
+        # Additive logit masks per agent count (None when no mode is feasible).
+        self._penalties: dict[int, np.ndarray | None] = {}
+
+    @classmethod
+    def from_state_dict(
+        cls,
+        state: Mapping[str, np.ndarray],
+        *,
+        modes: Sequence[CollaborationMode] | None = None,
+        fallback: CollaborationMode = CollaborationMode.SOLO,
+    ) -> LearnedModePolicy:
+        """Build from ``SimpleCategoricalPolicy.state_dict()`` output."""
+
+        return cls(
+            state["policy_w"], state.get("policy_b"), modes=modes, fallback=fallback
+        )
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path,
+        *,
+        missing_ok: bool = True,
+        modes: Sequence[CollaborationMode] | None = None,
+        fallback: CollaborationMode = CollaborationMode.SOLO,
+    ) -> LearnedModePolicy:
+        """Load the ``policy_state.npz`` artefact written by ``run_router_ppo``.
+
+        A missing file yields a policy that always returns ``fallback`` unless
+        ``missing_ok`` is ``False``.
+        """
+
+        source = Path(path)
+        if not source.exists():
+            if not missing_ok:
+                raise FileNotFoundError(f"Router policy not found: {source}")
+            logger.warning("Router policy %s missing; using fallback mode", source)
+            return cls(modes=modes, fallback=fallback)
+        with np.load(source) as archive:
+            state = {key: archive[key] for key in archive.files}
+        return cls.from_state_dict(state, modes=modes, fallback=fallback)
+
+    @property
+    def available(self) -> bool:
+        """Whether trained weights are loaded."""
+
+        return self.policy_w is not None
+
+    def feasible(self, num_agents: np.ndarray | int) -> np.ndarray:
+        """Boolean mask of modes allowed for ``num_agents`` (scalar or batch)."""
+
+        agents = np.asarray(num_agents)[..., np.newaxis]
+        return (agents >= self._min_agents) & (agents <= self._max_agents)
+
+    def choose(
+        self,
+        observation: Sequence[float] | np.ndarray,
+        *,
+        num_agents: int | None = None,
+    ) -> CollaborationMode:
+        """Return the collaboration mode for one observation vector."""
+
+        if self.policy_w is None:
+            return self.fallback
+        logits = np.asarray(observation, dtype=np.float64) @ self.policy_w
+        logits += self.policy_b
+        if num_agents is not None:
+            penalty = self._penalty(num_agents)
+            if penalty is None:
+                return self.fallback
+            logits += penalty
+        return self.modes[int(logits.argmax())]
+
+    def _penalty(self, num_agents: int) -> np.ndarray | None:
+        try:
+            return self._penalties[num_agents]
+        except KeyError:
+            allowed = self.feasible(num_agents)
+            penalty = np.where(allowed, 0.0, -np.inf) if allowed.any() else None
+            self._penalties[num_agents] = penalty
+            return penalty
+
+    def choose_batch(
+        self,
+        observations: np.ndarray,
+        *,
+        num_agents: np.ndarray | Sequence[int] | None = None,
+    ) -> list[CollaborationMode]:
+        """Vectorised :meth:`choose` over an ``(N, observation_dim)`` batch."""
+
+        batch = np.atleast_2d(np.asarray(observations, dtype=np.float64))
+        if self.policy_w is None:
+            return [self.fallback] * batch.shape[0]
+        logits = batch @ self.policy_w + self.policy_b
+        fallback = np.zeros(batch.shape[0], dtype=bool)
+        if num_agents is not None:
+            allowed = self.feasible(np.asarray(num_agents))
+            fallback = ~allowed.any(axis=1)
+            logits = np.where(allowed, logits, -np.inf)
+        choices = logits.argmax(axis=1)
+        return [
+            self.fallback if use_fallback else self.modes[index]
+            for index, use_fallback in zip(choices.tolist(), fallback.tolist())
+        ]
+
+
+__all__ = ["LearnedModePolicy", "OBSERVATION_FIELDS"]
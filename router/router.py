@@ -2,26 +2,68 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Sequence
+from typing import Iterable, Sequence, TYPE_CHECKING
 
 from .collab_policy import CollaborationMode, CollaborationPolicy
 from src.telemetry.metrics import collab_routes
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .learned_policy import LearnedModePolicy
+
 
 class Router:
-    """Route requests to agents while enforcing collaboration policy."""
+    """Route requests to agents while enforcing collaboration policy.
+
+    With a :class:`~router.learned_policy.LearnedModePolicy` the collaboration
+    mode is chosen per request from an observation vector; ``mode`` remains the
+    static mode used when no observation is supplied.
+    """
 
-    def __init__(self, mode: CollaborationMode = CollaborationMode.SOLO) -> None:
+    def __init__(
+        self,
+        mode: CollaborationMode = CollaborationMode.SOLO,
+        *,
+        policy: LearnedModePolicy | None = None,
+    ) -> None:
         self.mode = mode
+        self.policy = policy
+
+    def choose_mode(
+        self, observation: Sequence[float] | None = None, num_agents: int | None = None
+    ) -> CollaborationMode:
+        """Return the collaboration mode for a request.
+
+        Args:
+            observation: Router state in ``OBSERVATION_FIELDS`` order. Without an
+                observation or a learned policy the static ``mode`` is used.
+            num_agents: Number of agents on the request; modes whose policy
+                rule cannot accommodate it are never chosen by the policy.
+
+        The static ``mode`` is also used when the policy has no weights loaded
+        or when no mode can accommodate ``num_agents``, so the router never
+        enforces the policy's own ``fallback`` in place of its configuration.
+        """
+
+        policy = self.policy
+        if policy is None or observation is None or not policy.available:
+            return self.mode
+        if num_agents is not None and not policy.feasible(num_agents).any():
+            return self.mode
+        return policy.choose(observation, num_agents=num_agents)
 
-    def route(self, agents: Sequence[str] | Iterable[str]) -> Sequence[str]:
-        """Validate agents according to the configured mode.
+    def route(
+        self,
+        agents: Sequence[str] | Iterable[str],
+        observation: Sequence[float] | None = None,
+    ) -> Sequence[str]:
+        """Validate agents according to the selected collaboration mode.
 
         The router itself does not perform any IO.  It simply checks the number
         of agents against the collaboration policy and returns the sequence.
 
         Args:
             agents: Sequence of agent identifiers.
+            observation: Optional router state passed to the learned policy.
 
         Returns:
             The provided sequence of agents.
@@ -31,7 +73,8 @@ class Router:
         """
 
         agents = list(agents)
-        CollaborationPolicy.enforce(self.mode, len(agents))
+        mode = self.choose_mode(observation, len(agents))
+        CollaborationPolicy.enforce(mode, len(agents))
         # Record the routing event for telemetry purposes.
-        collab_routes.inc(self.mode.value)
+        collab_routes.inc(mode.value)
         return agents
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Time ``Governor.enforce`` on plans with hundreds of tasks.
+
+Three paths are measured for each plan size: plain enforcement published to a
+subscribed bus, the same with nobody subscribed to ``governor.evaluated`` and
+``publish_unobserved=False``, and enforcement with a handful of policies that
+patch the plan.
+
+Example::
+
+    python scripts/bench_governor.py --tasks 100 300 1000 --repeats 200
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import time
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from naestro.core.bus import MessageBus  # noqa: E402
+from naestro.governance import (  # noqa: E402
+    BudgetPolicy,
+    Decision,
+    Governor,
+    LatencySLOPolicy,
+    Policy,
+    PolicyInput,
+    RiskPolicy,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[100, 300, 1000])
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--patchers", type=int, default=4, help="Plan-patching policies")
+    return parser.parse_args()
+
+
+def _policy_input(num_tasks: int) -> PolicyInput:
+    tasks = [
+        {
+            "id": f"task-{index}",
+            "status": "pending",
+            "depends_on": [f"task-{index - 1}"] if index else [],
+            "params": {"model": "gpt-4o-mini", "max_tokens": 512, "tags": ["eval", "batch"]},
+        }
+        for index in range(num_tasks)
+    ]
+    return PolicyInput(
+        subject="pipeline",
+        plan={"status": "proposed", "tasks": tasks},
+        budget={"limit": 100.0, "usage": 42.0},
+        risk={"score": 0.2, "threshold": 0.5},
+        latency={"value_ms": 120.0, "slo_ms": 250.0},
+    )
+
+
+def _patcher(index: int) -> Policy:
+    def check(payload: PolicyInput) -> Decision:
+        patch = {"op": "set", "path": ("tasks", index, "status"), "value": "approved"}
+        return Decision(name=f"patcher-{index}", passed=True, reason="ok", patches=(patch,))
+
+    return Policy(f"patcher-{index}", "approves one task", check)
+
+
+def _time(call: Callable[[], Any], repeats: int) -> float:
+    call()
+    started = time.perf_counter()
+    for _ in range(repeats):
+        call()
+    return (time.perf_counter() - started) / repeats
+
+
+def main() -> None:
+    args = _parse_args()
+    checks = [BudgetPolicy(), RiskPolicy(), LatencySLOPolicy()]
+    patchers = [_patcher(index) for index in range(args.patchers)]
+    print(f"{'tasks':>7}{'subscribed ms':>15}{'unobserved ms':>15}{'patching ms':>13}")
+    for num_tasks in args.tasks:
+        policy_input = _policy_input(num_tasks)
+        subscribed = MessageBus()
+        subscribed.subscribe("governor.evaluated", lambda payload: None)
+        observed = Governor(checks, bus=subscribed)
+        unobserved = Governor(checks, bus=MessageBus(), publish_unobserved=False)
+        patching = Governor([*checks, *patchers], bus=subscribed)
+        timings = [
+            _time(lambda: observed.enforce(policy_input), args.repeats),
+            _time(lambda: unobserved.enforce(policy_input), args.repeats),
+            _time(
+                lambda: patching.enforce(policy_input, apply_policy_patches=True),
+                args.repeats,
+            ),
+        ]
+        subscribed.clear()
+        print(f"{num_tasks:>7}" + "".join(f"{value * 1e3:>15.3f}" for value in timings[:2]) + f"{timings[2] * 1e3:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Load-test ``RateLimiter`` decisions across many domains.
+
+Three loads are measured for each domain count: ``try_acquire`` from one
+thread, the same split across a thread pool, and ``aacquire`` from many
+coroutines on one event loop. Limits are generous so that the numbers show
+the cost of a decision rather than time spent waiting for tokens.
+
+Example::
+
+    python scripts/bench_ratelimit.py --domains 10 1000 100000 --ops 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from naestro.governance import DomainLimit, RateLimiter, RatePolicy  # noqa: E402
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--domains", type=int, nargs="+", default=[10, 1000, 100000])
+    parser.add_argument("--ops", type=int, default=200000, help="Decisions per load")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--tasks", type=int, default=1000, help="Concurrent coroutines")
+    return parser.parse_args()
+
+
+def _limiter(num_domains: int) -> RateLimiter:
+    policy = RatePolicy(default=DomainLimit(qps=1e9, burst=1e9))
+    return RateLimiter(policy, max_domains=num_domains)
+
+
+def _single(limiter: RateLimiter, targets: list[str]) -> float:
+    started = time.perf_counter()
+    for target in targets:
+        limiter.try_acquire(target)
+    return time.perf_counter() - started
+
+
+def _threaded(limiter: RateLimiter, targets: list[str], threads: int) -> float:
+    chunks = [targets[index::threads] for index in range(threads)]
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        started = time.perf_counter()
+        list(pool.map(lambda chunk: _single(limiter, chunk), chunks))
+        return time.perf_counter() - started
+
+
+def _async(limiter: RateLimiter, targets: list[str], tasks: int) -> float:
+    async def worker(chunk: list[str]) -> None:
+        for target in chunk:
+            await limiter.aacquire(target)
+
+    async def main() -> float:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(targets[index::tasks]) for index in range(tasks)))
+        return time.perf_counter() - started
+
+    return asyncio.run(main())
+
+
+def main() -> None:
+    args = _parse_args()
+    print(f"{'domains':>9}{'single us/op':>14}{'threads us/op':>15}{'async us/op':>13}")
+    for num_domains in args.domains:
+        targets = [f"host-{index % num_domains}.example" for index in range(args.ops)]
+        timings = []
+        for run in (
+            lambda limiter: _single(limiter, targets),
+            lambda limiter: _threaded(limiter, targets, args.threads),
+            lambda limiter: _async(limiter, targets, args.tasks),
+        ):
+            limiter = _limiter(num_domains)
+            run(limiter)  # warm the table so every load measures steady state
+            timings.append(run(limiter) / args.ops)
+        print(f"{num_domains:>9}{timings[0] * 1e6:>14.3f}{timings[1] * 1e6:>15.3f}{timings[2] * 1e6:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Time the hot paths of the router PPO adapter.
+
+Rollout collection is compared between the scalar :class:`RouterEnv` loop and
+:class:`VectorRouterEnv` at several environment counts, always gathering the
+same number of transitions. Minibatch updates are timed across batch sizes
+against the former per-sample entropy Jacobian loop, and GAE is timed on
+``(steps, num_envs)`` rollouts against the former per-step Python loop.
+
+Example::
+
+    python scripts/bench_router_ppo.py --steps 4096 --num-envs 1 16 64 256
+    python scripts/bench_router_ppo.py --batch-sizes 64 256 1024 4096
+    python scripts/bench_router_ppo.py --gae-shapes 2048x1 64x256 4096x64
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import time
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+
+from integrations.policy import rllm_ppo_adapter as ppo  # noqa: E402
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=4096, help="Transitions per rollout")
+    parser.add_argument("--num-envs", type=int, nargs="+", default=[1, 16, 64, 256])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[64, 256, 1024, 4096])
+    parser.add_argument(
+        "--gae-shapes",
+        nargs="+",
+        default=["2048x1", "64x256", "4096x64"],
+        help="Rollout shapes as STEPSxENVS",
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def _best_of(repeats: int, run: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_rollouts(args: argparse.Namespace) -> None:
+    print(f"{'num_envs':>9}{'rollout ms':>12}{'steps/s':>14}")
+    for num_envs in args.num_envs:
+        env = ppo.RouterEnv(seed=args.seed)
+        policy = ppo.SimpleCategoricalPolicy(
+            env.observation_dim, env.action_dim, rng=np.random.default_rng(args.seed)
+        )
+        if num_envs > 1:
+            vector = ppo.VectorRouterEnv(num_envs, seed=args.seed)
+            obs = vector.reset()
+
+            def run() -> object:
+                return ppo._collect_vector_rollout(vector, policy, obs, args.steps)
+
+        else:
+            obs = env.reset()
+
+            def run() -> object:
+                return ppo._collect_rollout(env, policy, obs, args.steps)
+
+        elapsed = _best_of(args.repeats, run)
+        print(f"{num_envs:>9}{elapsed * 1e3:>12.2f}{args.steps / elapsed:>14,.0f}")
+
+
+def _loop_entropy_grad(probs: np.ndarray, log_probs: np.ndarray) -> np.ndarray:
+    # Reference: the per-sample Jacobian loop the closed form replaced.
+    grad = np.zeros_like(probs)
+    for i in range(probs.shape[0]):
+        jacobian = np.diag(probs[i]) - np.outer(probs[i], probs[i])
+        grad[i] = -jacobian @ (log_probs[i] + 1.0)
+    return grad
+
+
+def bench_updates(args: argparse.Namespace) -> None:
+    rng = np.random.default_rng(args.seed)
+    params = ppo.PPOParams()
+    env = ppo.RouterEnv(seed=args.seed)
+    print(f"{'batch':>9}{'loss+grad ms':>14}{'entropy loop ms':>17}{'closed form ms':>16}")
+    for size in args.batch_sizes:
+        policy = ppo.SimpleCategoricalPolicy(
+            env.observation_dim, env.action_dim, rng=np.random.default_rng(args.seed)
+        )
+        obs = rng.uniform(size=(size, env.observation_dim)).astype(np.float32)
+        actions, log_probs, values = policy.act_batch(obs)
+        returns = values + rng.normal(size=size)
+        advantages = rng.normal(size=size)
+        probs = policy._softmax(policy.policy_logits(obs))
+        all_log_probs = np.log(probs)
+
+        update = _best_of(
+            args.repeats,
+            lambda: policy._loss_and_gradients(
+                obs, actions, log_probs, returns, advantages, params
+            ),
+        )
+        loop = _best_of(args.repeats, lambda: _loop_entropy_grad(probs, all_log_probs))
+        closed = _best_of(
+            args.repeats, lambda: policy._entropy_grad_logits(probs, all_log_probs)
+        )
+        print(f"{size:>9}{update * 1e3:>14.3f}{loop * 1e3:>17.3f}{closed * 1e3:>16.3f}")
+
+
+def _loop_gae(rewards, values, dones, last_value, gamma, gae_lambda):
+    # Reference: the per-step loop the log-step scan replaced; dones[t] ends
+    # the episode at transition t.
+    advantages = np.zeros_like(rewards)
+    lastgaelam = 0.0
+    for t in reversed(range(rewards.shape[0])):
+        next_values = last_value if t == rewards.shape[0] - 1 else values[t + 1]
+        next_non_terminal = 1.0 - dones[t]
+        delta = rewards[t] + gamma * next_values * next_non_terminal - values[t]
+        lastgaelam = delta + gamma * gae_lambda * next_non_terminal * lastgaelam
+        advantages[t] = lastgaelam
+    return advantages, advantages + values
+
+
+def bench_gae(args: argparse.Namespace) -> None:
+    rng = np.random.default_rng(args.seed)
+    print(f"{'shape':>12}{'loop ms':>10}{'scan ms':>10}{'max abs diff':>15}")
+    for spec in args.gae_shapes:
+        steps, num_envs = (int(part) for part in spec.split("x"))
+        shape = (steps, num_envs)
+        rewards = rng.normal(size=shape).astype(np.float32)
+        values = rng.normal(size=shape).astype(np.float32)
+        dones = (rng.random(shape) < 0.02).astype(np.float32)
+        last_value = np.zeros(num_envs, dtype=np.float32)
+        inputs = (rewards, values, dones, last_value, 0.99, 0.95)
+
+        loop = _best_of(args.repeats, lambda: _loop_gae(*inputs))
+        scan = _best_of(args.repeats, lambda: ppo._compute_gae(*inputs))
+        diff = np.abs(ppo._compute_gae(*inputs)[0] - _loop_gae(*inputs)[0]).max()
+        print(f"{spec:>12}{loop * 1e3:>10.3f}{scan * 1e3:>10.3f}{diff:>15.2e}")
+
+
+def main() -> None:
+    args = _parse_args()
+    bench_rollouts(args)
+    print()
+    bench_updates(args)
+    print()
+    bench_gae(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Simulate tail latency, cost and rejections of routing policies offline.
+
+Each model is modelled as a FIFO queue in front of a fixed number of
+concurrent slots (see :mod:`naestro.routing.simulation`). By default requests
+arrive as a Poisson process and carry affinity keys drawn from a Zipf
+distribution, so a handful of tenants dominate traffic, and every selection
+strategy is compared on the same stream. Pass ``--config`` to simulate a real
+routing config, ``--trace`` to replay recorded traffic and ``--weights`` to
+validate scoring weight changes against the current defaults.
+
+Example::
+
+    python scripts/bench_routing_strategies.py --requests 20000 --load 0.6
+    python scripts/bench_routing_strategies.py --config configs/routing.json \\
+        --weights '{"quality": 0.4, "latency": 0.4, "cost": 0.2}'
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from random import Random
+import sys
+from typing import Any, Callable, Mapping
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from naestro.routing import (  # noqa: E402
+    DEFAULT_WEIGHTS,
+    load_models,
+    ModelInfo,
+    ModelRouter,
+)
+from naestro.routing.simulation import (  # noqa: E402
+    Arrival,
+    Endpoint,
+    format_reports,
+    load_trace,
+    lognormal,
+    simulate,
+)
+
+STRATEGIES = ("greedy", "softmax", "p2c", "consistent_hash")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", type=Path, help="Routing config to simulate")
+    parser.add_argument("--trace", type=Path, help="JSON Lines trace to replay")
+    parser.add_argument(
+        "--weights",
+        type=json.loads,
+        action="append",
+        default=[],
+        help="Candidate scoring weights as JSON; may be repeated",
+    )
+    parser.add_argument("--models", type=int, default=6)
+    parser.add_argument("--slots", type=int, default=4, help="Concurrency per model")
+    parser.add_argument(
+        "--queue-limit", type=int, default=None, help="Reject beyond this backlog"
+    )
+    parser.add_argument(
+        "--service-time",
+        type=float,
+        default=0.5,
+        help="Mean seconds per request for synthetic models",
+    )
+    parser.add_argument("--sigma", type=float, default=0.5, help="Latency tail")
+    parser.add_argument(
+        "--load",
+        type=float,
+        default=0.6,
+        help="Offered load as a fraction of total fleet capacity",
+    )
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--tenants", type=int, default=200)
+    parser.add_argument("--zipf", type=float, default=1.1, help="Tenant skew")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--strategies", nargs="+", default=list(STRATEGIES), choices=STRATEGIES
+    )
+    return parser.parse_args()
+
+
+def _synthetic_models(count: int, service_time: float) -> list[ModelInfo]:
+    # Near-equal candidates: the best model wins every greedy decision.
+    return [
+        ModelInfo(
+            f"model-{index}",
+            "sim",
+            frozenset({"chat"}),
+            0.90 - 0.005 * index,
+            service_time,
+            0.1,
+        )
+        for index in range(count)
+    ]
+
+
+def _arrivals(args: argparse.Namespace, models: list[ModelInfo]) -> list[Arrival]:
+    if args.trace is not None:
+        return load_trace(args.trace)
+    rng = Random(args.seed)
+    mean_service = sum(model.latency for model in models) / len(models)
+    rate = args.load * len(models) * args.slots / mean_service
+    capabilities = sorted(set().union(*(model.capabilities for model in models)))
+    weights = [1.0 / (rank + 1) ** args.zipf for rank in range(args.tenants)]
+    tenants = rng.choices(range(args.tenants), weights=weights, k=args.requests)
+    arrivals: list[Arrival] = []
+    now = 0.0
+    for tenant in tenants:
+        now += rng.expovariate(rate)
+        spec: dict[str, Any] = {
+            "task": "sim",
+            "required_capabilities": [rng.choice(capabilities)],
+            "affinity_key": f"tenant-{tenant}",
+        }
+        arrivals.append(Arrival(now, spec))
+    return arrivals
+
+
+def _variants(
+    args: argparse.Namespace, models: list[ModelInfo]
+) -> dict[str, tuple[Callable[[], ModelRouter], Mapping[str, Any]]]:
+    variants: dict[str, tuple[Callable[[], ModelRouter], Mapping[str, Any]]] = {}
+    weight_sets = [dict(DEFAULT_WEIGHTS), *args.weights]
+    for index, weights in enumerate(weight_sets):
+        suffix = "" if index == 0 else f" w{index}"
+
+        def factory(weights: Mapping[str, float] = weights) -> ModelRouter:
+            return ModelRouter(models, default_weights=weights, vectorize=False)
+
+        for strategy in args.strategies:
+            variants[f"{strategy}{suffix}"] = (factory, {"strategy": strategy})
+    return variants
+
+
+def main() -> None:
+    args = _parse_args()
+    if args.config is not None:
+        models = load_models(args.config)
+    else:
+        models = _synthetic_models(args.models, args.service_time)
+    arrivals = _arrivals(args, models)
+    endpoint = Endpoint(
+        capacity=args.slots,
+        queue_limit=args.queue_limit,
+        service_time=lognormal(args.sigma),
+    )
+    reports = {
+        label: simulate(
+            factory(),
+            arrivals,
+            default_endpoint=endpoint,
+            spec_overrides=overrides,
+            seed=args.seed,
+        )
+        for label, (factory, overrides) in _variants(args, models).items()
+    }
+    print(format_reports(reports))
+    for index, weights in enumerate(args.weights, start=1):
+        print(f"w{index}: {json.dumps(weights)}")
+
+
+if __name__ == "__main__":
+    main()
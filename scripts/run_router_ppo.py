@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
-"""CLI for running lightweight PPO training on the router environment."""
+"""CLI for running lightweight PPO training on the router environment.
+
+Pass ``--sweep`` (or enable ``rllm.sweep``) to run a grid or random search over
+``ppo`` and ``reward_weights`` fields in a process pool instead of one run.
+"""
 
 from __future__ import annotations
 
@@ -18,6 +22,17 @@ from integrations.policy.rllm_ppo_adapter import (
     RewardWeights,
     RouterPPOAdapter,
 )
+from integrations.policy.rllm_checkpoint import (
+    latest_checkpoint,
+    load_checkpoint,
+    PeriodicCheckpointer,
+)
+from integrations.policy.rllm_sweep import (
+    format_results,
+    run_sweep,
+    SweepConfig,
+    write_results,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +40,7 @@ DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[1] / "configs" / "policy"
 
 
 def _parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description=__doc__)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
     parser.add_argument(
         "--config",
         type=Path,
@@ -51,6 +66,30 @@ def _parse_args() -> argparse.Namespace:
         default=64,
         help="Episode length for the synthetic router environment.",
     )
+    parser.add_argument(
+        "--num-envs",
+        dest="num_envs",
+        type=int,
+        default=None,
+        help="Environments stepped in parallel per rollout (defaults to trainer.num_envs).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume from the latest checkpoint (same as experiment.resume).",
+    )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Run the hyper-parameter sweep described by rllm.sweep.",
+    )
+    parser.add_argument(
+        "--max-workers",
+        dest="max_workers",
+        type=int,
+        default=None,
+        help="Worker processes for sweep trials (defaults to sweep.max_workers).",
+    )
     return parser.parse_args()
 
 
@@ -126,6 +165,7 @@ def _write_artifacts(
         "updates": int(args.updates),
         "seed": int(args.seed),
         "episode_length": int(args.episode_length),
+        "num_envs": int(args.num_envs),
         "ppo_params": asdict(params),
         "reward_weights": asdict(reward_weights),
         "config_path": str(Path(args.config).resolve()),
@@ -141,6 +181,76 @@ def _write_artifacts(
     logger.info("Artifacts written to %s", output_dir)
 
 
+def _setup_checkpointing(
+    args: argparse.Namespace,
+    experiment_cfg: Dict[str, Any],
+    adapter: RouterPPOAdapter,
+) -> tuple[PeriodicCheckpointer | None, list[Dict[str, Any]]]:
+    checkpoint_cfg = _ensure_dict(experiment_cfg.get("checkpointing"))
+    resume = args.resume or bool(experiment_cfg.get("resume", False))
+    if not experiment_cfg.get("enabled", False):
+        if resume or checkpoint_cfg.get("enabled", False):
+            logger.warning("Checkpointing and resume require experiment.enabled; ignoring.")
+        return None, []
+
+    checkpoint_dir = _resolve_output_dir(experiment_cfg.get("output_dir")) / "checkpoints"
+    previous: list[Dict[str, Any]] = []
+    if resume:
+        latest = latest_checkpoint(checkpoint_dir)
+        if latest is None:
+            logger.info("No checkpoint found in %s; starting from scratch.", checkpoint_dir)
+        else:
+            previous = adapter.restore(load_checkpoint(latest))
+            logger.info("Resumed from %s after %s updates", latest, adapter.updates_done)
+
+    if not checkpoint_cfg.get("enabled", False):
+        return None, previous
+    checkpointer = PeriodicCheckpointer.from_steps(
+        adapter,
+        checkpoint_dir,
+        frequency_steps=int(checkpoint_cfg.get("frequency_steps", 1000)),
+        keep_last_n=checkpoint_cfg.get("keep_last_n"),
+        history=previous,
+    )
+    return checkpointer, previous
+
+
+def _run_sweep(
+    args: argparse.Namespace,
+    rllm_cfg: Dict[str, Any],
+    sweep_cfg: Dict[str, Any],
+    raw_config: Dict[str, Any],
+) -> int:
+    if args.max_workers is not None:
+        sweep_cfg = {**sweep_cfg, "max_workers": args.max_workers}
+    sweep = SweepConfig.from_dict(sweep_cfg)
+
+    experiment_cfg = _ensure_dict(rllm_cfg.get("experiment"))
+    output_dir = None
+    if experiment_cfg.get("enabled", False):
+        output_dir = _resolve_output_dir(experiment_cfg.get("output_dir")) / "sweep"
+    else:
+        logger.info("Experiment output disabled; sweep artifacts will not be persisted.")
+
+    results = run_sweep(
+        sweep,
+        ppo=_ensure_dict(rllm_cfg.get("ppo")),
+        reward_weights=_ensure_dict(rllm_cfg.get("reward_weights")),
+        num_updates=args.updates,
+        episode_length=args.episode_length,
+        num_envs=args.num_envs,
+        output_dir=output_dir,
+    )
+    logger.info("Sweep results:\n%s", format_results(results))
+
+    if output_dir is not None:
+        results_path = write_results(results, output_dir)
+        with (output_dir / "config_snapshot.yaml").open("w", encoding="utf-8") as handle:
+            yaml.safe_dump(raw_config, handle, sort_keys=False)
+        logger.info("Sweep results written to %s", results_path)
+    return 0
+
+
 def main() -> int:
     args = _parse_args()
     config = _load_config(Path(args.config))
@@ -163,21 +273,35 @@ def main() -> int:
 
     params = PPOParams.from_dict(_ensure_dict(rllm_cfg.get("ppo")))
     reward_weights = RewardWeights.from_dict(rllm_cfg.get("reward_weights"))
+    if args.num_envs is None:
+        args.num_envs = int(trainer_cfg.get("num_envs", 1))
+
+    sweep_cfg = _ensure_dict(rllm_cfg.get("sweep"))
+    if args.sweep or sweep_cfg.get("enabled", False):
+        return _run_sweep(args, rllm_cfg, sweep_cfg, config)
 
     adapter = RouterPPOAdapter(
         params,
         reward_weights=reward_weights,
         seed=args.seed,
         episode_length=args.episode_length,
+        num_envs=args.num_envs,
     )
+    experiment_cfg = _ensure_dict(rllm_cfg.get("experiment"))
+    checkpointer, previous = _setup_checkpointing(args, experiment_cfg, adapter)
+    remaining = max(0, args.updates - adapter.updates_done)
     logger.info(
-        "Starting PPO training with rollout_length=%s, updates=%s", params.rollout_length, args.updates
+        "Starting PPO training with rollout_length=%s, num_envs=%s, updates=%s",
+        params.rollout_length,
+        args.num_envs,
+        remaining,
     )
-    results = adapter.train(num_updates=args.updates)
-    history = results.get("history", [])
+    results = adapter.train(num_updates=remaining, should_stop=checkpointer)
+    history = previous + results.get("history", [])
     policy_state = results.get("policy_state", {})
+    if checkpointer is not None:
+        checkpointer.save(history)
 
-    experiment_cfg = _ensure_dict(rllm_cfg.get("experiment"))
     if experiment_cfg.get("enabled", False):
         output_dir = _resolve_output_dir(experiment_cfg.get("output_dir"))
         _write_artifacts(output_dir, history, policy_state, params, reward_weights, args, config)
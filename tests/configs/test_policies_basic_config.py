@@ -12,7 +12,28 @@ EXPECTED_POLICIES = {
     "min_return": 0.5,
 }
 
+EXPECTED_RULES = [
+    {
+        "name": "max_drawdown",
+        "description": "Limit drawdowns",
+        "check": {
+            "field": "metadata.max_drawdown",
+            "le": "$max_drawdown",
+            "default": 0.0,
+        },
+        "pass": "Within drawdown limit",
+        "fail": "Drawdown {value:.2f} exceeds limit {limit:.2f}",
+    },
+    {
+        "name": "min_return",
+        "description": "Ensure positive returns",
+        "check": {"field": "score", "ge": "$min_return", "default": 0.0},
+        "pass": "Return target met",
+        "fail": "Return {value:.2f} below target {limit:.2f}",
+    },
+]
+
 
 def test_policies_basic_config_matches_prompt() -> None:
     data = yaml.safe_load(CONFIG_PATH.read_text())
-    assert data == {"policies": EXPECTED_POLICIES}
+    assert data == {"policies": EXPECTED_POLICIES, "rules": EXPECTED_RULES}
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from integrations.policy.rllm_ppo_adapter import _compute_gae
+
+
+def _reference_gae(rewards, values, dones, last_value, gamma, gae_lambda):
+    # The per-step loop, kept as the specification. dones[t] ends episode t.
+    advantages = np.zeros_like(rewards)
+    lastgaelam = 0.0
+    for t in reversed(range(rewards.shape[0])):
+        next_values = last_value if t == rewards.shape[0] - 1 else values[t + 1]
+        next_non_terminal = 1.0 - dones[t]
+        delta = rewards[t] + gamma * next_values * next_non_terminal - values[t]
+        lastgaelam = delta + gamma * gae_lambda * next_non_terminal * lastgaelam
+        advantages[t] = lastgaelam
+    return advantages, advantages + values
+
+
+@pytest.mark.parametrize(
+    ("shape", "gamma", "gae_lambda", "done_rate"),
+    [
+        ((1,), 0.99, 0.95, 0.0),
+        ((2,), 0.99, 0.95, 0.5),
+        ((257,), 0.99, 0.95, 0.05),
+        ((300, 7), 0.9, 0.0, 0.1),
+        ((1000, 16), 1.0, 1.0, 0.02),
+        ((130, 3), 0.0, 0.5, 0.1),
+        ((64, 256), 0.99, 0.95, 0.3),
+    ],
+)
+def test_scan_matches_reference_loop(shape, gamma, gae_lambda, done_rate) -> None:
+    rng = np.random.default_rng(sum(shape))
+    rewards = rng.normal(size=shape)
+    values = rng.normal(size=shape)
+    dones = (rng.random(shape) < done_rate).astype(np.float64)
+    last_value = rng.normal(size=shape[1:]) if len(shape) > 1 else rng.normal()
+
+    advantages, returns = _compute_gae(
+        rewards, values, dones, last_value, gamma, gae_lambda
+    )
+    expected_advantages, expected_returns = _reference_gae(
+        rewards, values, dones, last_value, gamma, gae_lambda
+    )
+
+    np.testing.assert_allclose(advantages, expected_advantages, rtol=1e-10, atol=1e-10)
+    np.testing.assert_allclose(returns, expected_returns, rtol=1e-10, atol=1e-10)
+
+
+def test_episode_boundaries_stop_bootstrapping() -> None:
+    rewards = np.ones((4, 2), dtype=np.float32)
+    values = np.zeros((4, 2), dtype=np.float32)
+    dones = np.array([[0, 0], [0, 1], [0, 0], [0, 0]], dtype=np.float32)
+
+    advantages, _ = _compute_gae(rewards, values, dones, np.zeros(2), 1.0, 1.0)
+
+    assert advantages.dtype == np.float32
+    np.testing.assert_allclose(advantages[:, 0], [4.0, 3.0, 2.0, 1.0])
+    # Column 1's episode ends at step 1, so step 1 does not bootstrap into
+    # step 2.
+    np.testing.assert_allclose(advantages[:, 1], [2.0, 1.0, 2.0, 1.0])
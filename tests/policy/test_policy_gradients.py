@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from integrations.policy.rllm_ppo_adapter import PPOParams, SimpleCategoricalPolicy
+
+
+def _batch(size: int, seed: int = 0) -> tuple[SimpleCategoricalPolicy, tuple]:
+    rng = np.random.default_rng(seed)
+    policy = SimpleCategoricalPolicy(4, 4, rng=rng)
+    # Float64 parameters keep the finite differences accurate.
+    policy.policy_w = policy.policy_w.astype(np.float64) * 3.0
+    policy.policy_b = rng.normal(0.0, 0.5, size=4)
+    policy.value_w = policy.value_w.astype(np.float64)
+    obs = rng.uniform(size=(size, 4))
+    actions = rng.integers(0, 4, size=size)
+    probs = policy._softmax(policy.policy_logits(obs))
+    # Perturbed behaviour log-probs so some ratios fall outside the clip range.
+    old_log_probs = np.log(probs[np.arange(size), actions]) + rng.normal(0.0, 0.3, size)
+    returns = rng.normal(size=size)
+    advantages = rng.normal(size=size)
+    return policy, (obs, actions, old_log_probs, returns, advantages)
+
+
+def _total_loss(
+    policy: SimpleCategoricalPolicy, batch: tuple, params: PPOParams
+) -> float:
+    metrics, _ = policy._loss_and_gradients(*batch, params)
+    return (
+        metrics["policy_loss"]
+        + params.value_loss_coef * metrics["value_loss"]
+        - params.entropy_coef * metrics["entropy"]
+    )
+
+
+def test_entropy_gradient_matches_softmax_jacobian() -> None:
+    rng = np.random.default_rng(1)
+    probs = SimpleCategoricalPolicy(4, 5)._softmax(rng.normal(size=(32, 5)))
+    log_probs = np.log(probs)
+
+    expected = np.stack(
+        [
+            -(np.diag(p) - np.outer(p, p)) @ (log_p + 1.0)
+            for p, log_p in zip(probs, log_probs)
+        ]
+    )
+    np.testing.assert_allclose(
+        SimpleCategoricalPolicy._entropy_grad_logits(probs, log_probs),
+        expected,
+        atol=1e-12,
+    )
+
+
+@pytest.mark.parametrize("entropy_coef", [0.01, 0.5])
+def test_gradients_match_finite_differences(entropy_coef: float) -> None:
+    params = PPOParams(entropy_coef=entropy_coef, value_loss_coef=0.5)
+    policy, batch = _batch(64)
+    _, gradients = policy._loss_and_gradients(*batch, params)
+    analytic = {
+        "policy_w": gradients[0],
+        "policy_b": gradients[1],
+        "value_w": gradients[2].ravel(),
+    }
+
+    step = 1e-6
+    for name, grad in analytic.items():
+        parameter = getattr(policy, name)
+        numeric = np.zeros_like(parameter)
+        for index in np.ndindex(parameter.shape):
+            original = parameter[index]
+            parameter[index] = original + step
+            upper = _total_loss(policy, batch, params)
+            parameter[index] = original - step
+            lower = _total_loss(policy, batch, params)
+            parameter[index] = original
+            numeric[index] = (upper - lower) / (2 * step)
+        np.testing.assert_allclose(grad, numeric, rtol=1e-4, atol=1e-7, err_msg=name)
+
+    policy.value_b += step
+    upper = _total_loss(policy, batch, params)
+    policy.value_b -= 2 * step
+    lower = _total_loss(policy, batch, params)
+    assert gradients[3] == pytest.approx((upper - lower) / (2 * step), rel=1e-4)
@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from integrations.policy import rllm_checkpoint
+from integrations.policy.rllm_checkpoint import (
+    latest_checkpoint,
+    list_checkpoints,
+    load_checkpoint,
+    PeriodicCheckpointer,
+    save_checkpoint,
+)
+from integrations.policy.rllm_ppo_adapter import PPOParams, RouterPPOAdapter
+from router import LearnedModePolicy
+
+PARAMS = PPOParams(rollout_length=64, mini_batch_size=32, update_epochs=2)
+
+
+def _adapter(num_envs: int = 1, seed: int = 0) -> RouterPPOAdapter:
+    return RouterPPOAdapter(PARAMS, seed=seed, episode_length=24, num_envs=num_envs)
+
+
+@pytest.mark.parametrize("num_envs", [1, 4])
+def test_resumed_run_matches_uninterrupted_run(tmp_path: Path, num_envs: int) -> None:
+    reference = _adapter(num_envs)
+    expected = reference.train(num_updates=5)
+
+    first = _adapter(num_envs)
+    checkpointer = PeriodicCheckpointer(first, tmp_path, every_updates=3)
+    first.train(num_updates=4, should_stop=checkpointer)
+    assert [path.name for path in list_checkpoints(tmp_path)] == ["checkpoint-000003.npz"]
+
+    # A fresh process with a different seed picks up from update 3.
+    resumed = _adapter(num_envs, seed=99)
+    history = resumed.restore(load_checkpoint(latest_checkpoint(tmp_path)))
+    assert resumed.updates_done == 3
+    results = resumed.train(num_updates=2)
+
+    assert history + results["history"] == expected["history"]
+    for key, value in expected["policy_state"].items():
+        np.testing.assert_array_equal(results["policy_state"][key], value)
+
+
+def test_checkpoints_are_pruned_and_servable(tmp_path: Path) -> None:
+    adapter = _adapter()
+    checkpointer = PeriodicCheckpointer(adapter, tmp_path, every_updates=1, keep_last_n=2)
+    adapter.train(num_updates=4, should_stop=checkpointer)
+
+    assert [path.name for path in list_checkpoints(tmp_path)] == [
+        "checkpoint-000003.npz",
+        "checkpoint-000004.npz",
+    ]
+    assert not list(tmp_path.glob(".checkpoint-*"))
+    policy = LearnedModePolicy.load(latest_checkpoint(tmp_path))
+    observation = np.array([0.5, 0.3, 0.4, 0.2], dtype=np.float32)
+    expected = adapter.policy.policy_logits(observation[None, :]).argmax()
+    assert policy.choose(observation) is policy.modes[int(expected)]
+
+
+def test_failed_write_keeps_previous_checkpoint(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    save_checkpoint(tmp_path, {"value": np.arange(3)}, update=1)
+
+    def explode(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(rllm_checkpoint.np, "savez", explode)
+    with pytest.raises(OSError, match="disk full"):
+        save_checkpoint(tmp_path, {"value": np.arange(5)}, update=2)
+
+    assert [path.name for path in tmp_path.iterdir()] == ["checkpoint-000001.npz"]
+    restored = load_checkpoint(tmp_path / "checkpoint-000001.npz")
+    np.testing.assert_array_equal(restored["value"], np.arange(3))
+
+
+@pytest.mark.skipif(not Path("/proc/self/fd").is_dir(), reason="needs /proc fd links")
+def test_rename_is_flushed_to_the_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    synced = []
+    real_fsync = rllm_checkpoint.os.fsync
+
+    def record(descriptor: int) -> None:
+        synced.append(Path(f"/proc/self/fd/{descriptor}").resolve())
+        real_fsync(descriptor)
+
+    monkeypatch.setattr(rllm_checkpoint.os, "fsync", record)
+    save_checkpoint(tmp_path, {"value": np.arange(3)}, update=1)
+    assert synced[-1] == tmp_path.resolve()
+
+
+def test_restore_rejects_mismatched_environment_count(tmp_path: Path) -> None:
+    adapter = _adapter(num_envs=4)
+    adapter.train(num_updates=1)
+    state = adapter.checkpoint_state([])
+    with pytest.raises(ValueError, match="num_envs=4"):
+        _adapter(num_envs=1).restore(state)
+
+
+def test_frequency_is_converted_from_environment_steps(tmp_path: Path) -> None:
+    adapter = _adapter(num_envs=3)  # 22 steps x 3 envs = 66 transitions per update
+    checkpointer = PeriodicCheckpointer.from_steps(adapter, tmp_path, frequency_steps=200)
+    assert checkpointer.every_updates == 4
+    assert latest_checkpoint(tmp_path / "missing") is None
@@ -0,0 +1,153 @@
+import csv
+import math
+from pathlib import Path
+
+import pytest
+
+from integrations.policy.rllm_ppo_adapter import PPOParams, RewardWeights
+from integrations.policy.rllm_sweep import (
+    MedianStoppingRule,
+    run_sweep,
+    sample_trials,
+    SweepConfig,
+    write_results,
+)
+
+PPO = {"rollout_length": 64, "mini_batch_size": 32, "update_epochs": 1}
+
+
+def test_partial_config_sections_fall_back_to_defaults() -> None:
+    assert PPOParams.from_dict({"gamma": 0.9}).rollout_length == 256
+    assert RewardWeights.from_dict(None) == RewardWeights()
+    assert SweepConfig.from_dict({}).strategy == "grid"
+
+
+def test_grid_expands_every_combination_with_distinct_seeds() -> None:
+    config = SweepConfig.from_dict(
+        {
+            "space": {
+                "ppo.learning_rate": [0.001, 0.01],
+                "reward_weights.latency": [0.5, 0.75, 1.0],
+            }
+        }
+    )
+    trials = sample_trials(config)
+
+    assert len(trials) == 6
+    assert trials[5].overrides == {"ppo.learning_rate": 0.01, "reward_weights.latency": 1.0}
+    assert trials[5].section("reward_weights") == {"latency": 1.0}
+    assert len({trial.seed for trial in trials}) == 6
+    assert [trial.seed for trial in sample_trials(config)] == [trial.seed for trial in trials]
+
+
+def test_random_search_samples_ranges() -> None:
+    config = SweepConfig.from_dict(
+        {
+            "strategy": "random",
+            "num_trials": 50,
+            "seed": 3,
+            "space": {
+                "ppo.learning_rate": {"low": 1e-5, "high": 1e-2, "log": True},
+                "ppo.update_epochs": {"low": 1, "high": 3},
+                "ppo.entropy_coef": [0.0, 0.01],
+            },
+        }
+    )
+    trials = sample_trials(config)
+
+    assert len(trials) == 50
+    assert all(1e-5 <= t.overrides["ppo.learning_rate"] <= 1e-2 for t in trials)
+    assert {t.overrides["ppo.update_epochs"] for t in trials} == {1, 2, 3}
+    assert {t.overrides["ppo.entropy_coef"] for t in trials} == {0.0, 0.01}
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        ({"space": {"ppo.unknown": [1]}}, "Unknown sweep parameter"),
+        ({"space": {"ppo.gamma": {"low": 0.9, "high": 1.0}}}, "Grid search"),
+        ({"strategy": "bayes"}, "strategy"),
+        ({"space": {"ppo.gamma": []}}, "non-empty"),
+    ],
+)
+def test_invalid_sweep_config_is_rejected(data, message) -> None:
+    with pytest.raises(ValueError, match=message):
+        SweepConfig.from_dict(data)
+
+
+def test_median_rule_stops_trials_behind_their_peers() -> None:
+    rule = MedianStoppingRule({}, grace_updates=2, min_trials=2)
+    for trial, score in enumerate([1.0, 2.0, 3.0]):
+        assert not rule.report(trial, 1, score)
+        rule.report(trial, 2, score)
+
+    assert not rule.report(3, 1, 0.0)  # still in its grace period
+    assert rule.report(3, 2, 1.5)
+    assert not rule.report(4, 2, 2.5)
+
+
+def test_sweep_stops_laggards_and_writes_one_table(tmp_path: Path) -> None:
+    config = SweepConfig.from_dict(
+        {
+            "space": {
+                "ppo.learning_rate": [0.0001, 0.1],
+                "ppo.entropy_coef": [0.0, 0.01],
+                "ppo.mini_batch_size": [32, 128],
+            },
+            "early_stopping": {"grace_updates": 1, "min_trials": 2},
+        }
+    )
+    results = run_sweep(
+        config, ppo=PPO, num_updates=4, episode_length=16, output_dir=tmp_path
+    )
+
+    statuses = {result.status for result in results}
+    assert statuses == {"completed", "stopped", "failed"}
+    failed = [result for result in results if result.status == "failed"]
+    assert all("mini_batch_size" in result.error for result in failed)
+    ranked = [result.objective for result in results if result.status != "failed"]
+    assert ranked == sorted(ranked, reverse=True)
+    assert results[-1].status == "failed"
+    stopped = next(result for result in results if result.status == "stopped")
+    assert stopped.updates < 4
+    assert (Path(stopped.artifacts) / "policy_state.npz").exists()
+
+    with write_results(results, tmp_path).open(encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert len(rows) == 8
+    assert {"ppo.learning_rate", "status", "objective", "artifacts"} <= set(rows[0])
+
+
+def test_sweep_runs_trials_in_worker_processes() -> None:
+    config = SweepConfig.from_dict(
+        {
+            "max_workers": 2,
+            "space": {"reward_weights.latency": [0.5, 1.0]},
+            "early_stopping": False,
+        }
+    )
+    results = run_sweep(config, ppo=PPO, num_updates=2, episode_length=16)
+
+    assert sorted(result.trial.index for result in results) == [0, 1]
+    assert all(result.status == "completed" and result.updates == 2 for result in results)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_trials_that_raise_are_recorded_as_failed(tmp_path: Path, max_workers: int) -> None:
+    config = SweepConfig.from_dict(
+        {
+            "max_workers": max_workers,
+            "space": {"reward_weights.latency": [0.5, 1.0]},
+            "early_stopping": False,
+        }
+    )
+    # Trial directories cannot be created under a regular file.
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+
+    results = run_sweep(config, ppo=PPO, num_updates=1, episode_length=16, output_dir=blocker)
+
+    assert sorted(result.trial.index for result in results) == [0, 1]
+    for result in results:
+        assert result.status == "failed" and math.isnan(result.objective)
+        assert result.error
@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+from integrations.policy.rllm_ppo_adapter import (
+    compute_reward,
+    compute_rewards,
+    PPOParams,
+    ppo_train,
+    RewardWeights,
+    RouterEnv,
+    RouterPPOAdapter,
+    SimpleCategoricalPolicy,
+    VectorRouterEnv,
+)
+
+
+class _NoiselessRng:
+    """Stand-in generator so scalar and vector dynamics can be compared."""
+
+    def normal(self, loc: float, scale: float, size: int | None = None) -> object:
+        return 0.0 if size is None else np.zeros(size)
+
+    def random(self, size: int | None = None) -> object:
+        return 0.5 if size is None else np.full(size, 0.5)
+
+
+def test_vector_env_matches_scalar_env_elementwise() -> None:
+    start = np.array(
+        [[0.4, 0.3, 0.2, 0.5], [0.8, 0.5, 0.7, 0.2], [0.6, 0.2, 0.4, 0.6]],
+        dtype=np.float32,
+    )
+    weights = RewardWeights(latency=0.7, violation=2.0)
+    vector = VectorRouterEnv(3, weights, episode_length=8)
+    vector.reset()
+    vector._state = start.copy()
+    vector._rng = _NoiselessRng()
+    scalars = []
+    for row in start:
+        env = RouterEnv(weights, episode_length=8)
+        env.reset()
+        env._state = row.copy()
+        env._rng = _NoiselessRng()
+        scalars.append(env)
+
+    for actions in ([0, 1, 2], [3, 2, 1], [1, 1, 0]):
+        obs, rewards, dones, info = vector.step(actions)
+        for index, env in enumerate(scalars):
+            expected_obs, expected_reward, done, _ = env.step(actions[index])
+            np.testing.assert_allclose(obs[index], expected_obs, rtol=1e-6)
+            assert rewards[index] == pytest.approx(expected_reward)
+            assert dones[index] == done
+        assert set(info["metrics"]) == {
+            "throughput",
+            "reliability",
+            "latency",
+            "collaboration_cost",
+            "violation_penalty",
+        }
+
+
+def test_vector_env_auto_resets_finished_episodes() -> None:
+    env = VectorRouterEnv(4, episode_length=2, seed=0)
+    obs = env.reset()
+    assert obs.shape == (4, env.observation_dim)
+    _, _, dones, info = env.step(np.zeros(4, dtype=int))
+    assert not dones.any() and "final_observation" not in info
+    obs, _, dones, info = env.step(np.zeros(4, dtype=int))
+    assert dones.all()
+    assert info["final_observation"].shape == obs.shape
+    assert (info["step"] == 2).all()
+    with pytest.raises(ValueError, match="actions"):
+        env.step([0, 1])
+    with pytest.raises(ValueError, match="actions"):
+        env.step([0, 0, 0, env.action_dim])
+
+
+def test_compute_rewards_matches_scalar_reward() -> None:
+    metrics = {
+        "throughput": np.array([0.5, 1.0]),
+        "reliability": np.array([0.9, 0.2]),
+        "latency": np.array([0.3, 0.6]),
+        "collaboration_cost": np.array([0.1, 0.0]),
+        "violation_penalty": np.array([0.0, 0.1]),
+    }
+    weights = RewardWeights()
+    rewards = compute_rewards(metrics, weights)
+    for index in range(2):
+        row = {key: float(value[index]) for key, value in metrics.items()}
+        assert rewards[index] == pytest.approx(compute_reward(row, weights))
+
+
+def test_act_batch_samples_from_policy_distribution() -> None:
+    policy = SimpleCategoricalPolicy(4, 4, rng=np.random.default_rng(0))
+    obs = np.tile(np.array([[0.5, 0.2, 0.8, 0.1]], dtype=np.float32), (20_000, 1))
+
+    actions, log_probs, values = policy.act_batch(obs)
+
+    probs = policy._softmax(policy.policy_logits(obs[:1]))[0]
+    frequencies = np.bincount(actions, minlength=4) / len(actions)
+    np.testing.assert_allclose(frequencies, probs, atol=0.02)
+    np.testing.assert_allclose(log_probs, np.log(probs[actions]), rtol=1e-5)
+    np.testing.assert_allclose(values, policy.value(obs[0]), rtol=1e-5)
+
+
+def test_ppo_train_runs_on_vector_env() -> None:
+    params = PPOParams(rollout_length=64, mini_batch_size=32, update_epochs=1)
+    adapter = RouterPPOAdapter(params, seed=0, episode_length=8, num_envs=16)
+    assert isinstance(adapter.env, VectorRouterEnv)
+
+    history = adapter.train(num_updates=2)["history"]
+
+    assert [entry["update"] for entry in history] == [1.0, 2.0]
+    assert history[0]["avg_episode_length"] == pytest.approx(4.0)
+    assert np.isfinite(history[-1]["policy_loss"])
+    assert "avg_throughput" in history[-1]
+
+
+def test_ppo_train_steps_ceil_of_rollout_per_env() -> None:
+    env = VectorRouterEnv(3, episode_length=100, seed=1)
+    policy = SimpleCategoricalPolicy(4, env.action_dim, rng=np.random.default_rng(1))
+    params = PPOParams(rollout_length=10, mini_batch_size=4, update_epochs=1)
+
+    history = ppo_train(env, policy, params, num_updates=1)
+
+    # ceil(10 / 3) = 4 steps per environment, none of which finish an episode.
+    assert history[0]["avg_episode_length"] == pytest.approx(4.0)
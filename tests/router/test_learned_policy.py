@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from integrations.policy.rllm_ppo_adapter import PPOParams, RouterPPOAdapter
+from router import LearnedModePolicy
+from router.collab_policy import CollaborationMode
+from router.router import Router
+from src.telemetry import metrics
+
+MODES = list(CollaborationMode)
+
+
+def _policy() -> LearnedModePolicy:
+    # Each observation feature favours a different mode; bias favours SWARM.
+    weights = np.zeros((4, len(MODES)), dtype=np.float32)
+    for feature in range(4):
+        weights[feature, feature] = 10.0
+    bias = np.zeros(len(MODES), dtype=np.float32)
+    bias[MODES.index(CollaborationMode.SWARM)] = 1.0
+    return LearnedModePolicy(weights, bias)
+
+
+def test_trained_artefact_round_trips_through_npz(tmp_path: Path) -> None:
+    adapter = RouterPPOAdapter(
+        PPOParams(rollout_length=32, mini_batch_size=16, update_epochs=1), seed=0
+    )
+    state = adapter.train(num_updates=1)["policy_state"]
+    path = tmp_path / "policy_state.npz"
+    np.savez(path, **state)
+
+    policy = LearnedModePolicy.load(path)
+    observations = np.random.default_rng(0).uniform(size=(64, 4)).astype(np.float32)
+
+    expected = adapter.policy.policy_logits(observations).argmax(axis=1)
+    assert policy.available
+    assert policy.choose_batch(observations) == [MODES[i] for i in expected]
+    assert policy.choose(observations[0]) == MODES[expected[0]]
+
+
+def test_infeasible_modes_are_masked() -> None:
+    policy = _policy()
+    busy = [0.0, 0.0, 0.0, 0.0]
+    assert policy.choose(busy) is CollaborationMode.SWARM
+    assert policy.choose(busy, num_agents=2) is not CollaborationMode.SWARM
+    assert policy.choose([1.0, 0.0, 0.0, 0.0], num_agents=1) is CollaborationMode.SOLO
+    assert policy.choose([1.0, 0.0, 0.0, 0.0], num_agents=3) in {
+        CollaborationMode.COLLABORATE,
+        CollaborationMode.CONSENSUS,
+        CollaborationMode.SWARM,
+    }
+    assert policy.choose(busy, num_agents=0) is CollaborationMode.SOLO
+
+    batch = np.array([busy, busy, [1.0, 0.0, 0.0, 0.0]])
+    assert policy.choose_batch(batch, num_agents=[3, 1, 0]) == [
+        CollaborationMode.SWARM,
+        CollaborationMode.SOLO,
+        CollaborationMode.SOLO,
+    ]
+
+
+def test_missing_policy_falls_back_to_static_mode(tmp_path: Path) -> None:
+    policy = LearnedModePolicy.load(
+        tmp_path / "absent.npz", fallback=CollaborationMode.CONSULT
+    )
+    assert not policy.available
+    assert policy.choose([0.5] * 4) is CollaborationMode.CONSULT
+    assert policy.choose_batch(np.zeros((2, 4))) == [CollaborationMode.CONSULT] * 2
+    with pytest.raises(FileNotFoundError):
+        LearnedModePolicy.load(tmp_path / "absent.npz", missing_ok=False)
+
+
+def test_shape_mismatch_is_rejected() -> None:
+    with pytest.raises(ValueError, match="policy_w"):
+        LearnedModePolicy(np.zeros((4, 3)))
+
+
+def test_router_picks_mode_per_request() -> None:
+    metrics.collab_routes.reset()
+    router = Router(CollaborationMode.CONSULT, policy=_policy())
+
+    assert router.route(["a", "b", "c"], observation=[0.0] * 4) == ["a", "b", "c"]
+    assert metrics.collab_routes.get("swarm") == 1
+    assert router.choose_mode([0.0, 1.0, 0.0, 0.0], num_agents=2) is (
+        CollaborationMode.CONSULT
+    )
+    # Without an observation the static mode still applies.
+    router.route(["a"])
+    assert metrics.collab_routes.get("consult") == 1
+
+
+def test_router_keeps_static_mode_when_policy_cannot_decide(tmp_path: Path) -> None:
+    untrained = LearnedModePolicy.load(tmp_path / "absent.npz")
+    router = Router(CollaborationMode.CONSENSUS, policy=untrained)
+
+    assert router.route(["a", "b", "c"], observation=[0.5] * 4) == ["a", "b", "c"]
+    assert router.choose_mode([0.5] * 4, num_agents=3) is CollaborationMode.CONSENSUS
+
+    router = Router(CollaborationMode.CONSULT, policy=_policy())
+    assert router.choose_mode([1.0, 0.0, 0.0, 0.0], num_agents=0) is (
+        CollaborationMode.CONSULT
+    )
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from itertools import product
+from pathlib import Path
+from sys import path as sys_path
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+pytest.importorskip("yaml")
+
+from naestro.governance import (
+    compile_policies,
+    Decision,
+    load_policies,
+    PolicyInput,
+    SafetyPolicy,
+)
+from naestro.governance.dsl import compile_rule
+
+CONFIG = Path(__file__).resolve().parents[1] / "configs" / "policies_basic.yaml"
+
+
+def _max_drawdown(payload: PolicyInput) -> Decision:
+    drawdown = float(payload.metadata.get("max_drawdown", 0.0))
+    passed = drawdown <= 2.0
+    reason = (
+        "Within drawdown limit"
+        if passed
+        else f"Drawdown {drawdown:.2f} exceeds limit {2.0:.2f}"
+    )
+    return Decision(name="max_drawdown", passed=passed, reason=reason)
+
+
+def _min_return(payload: PolicyInput) -> Decision:
+    score = payload.score or 0.0
+    passed = score >= 0.5
+    reason = (
+        "Return target met"
+        if passed
+        else f"Return {score:.2f} below target {0.5:.2f}"
+    )
+    return Decision(name="min_return", passed=passed, reason=reason)
+
+
+def test_basic_config_matches_hand_written_policies() -> None:
+    drawdown, minimum = load_policies(CONFIG)
+    assert (drawdown.name, minimum.name) == ("max_drawdown", "min_return")
+    assert drawdown.reads == ("metadata",) and minimum.reads == ("score",)
+
+    for score, metadata in product(
+        [None, 0.0, 0.49, 0.5, 3.25],
+        [{}, {"max_drawdown": 1.5}, {"max_drawdown": 2.0}, {"max_drawdown": "2.5"}],
+    ):
+        payload = PolicyInput(subject="trade", score=score, metadata=metadata)
+        assert drawdown.evaluate(payload) == _max_drawdown(payload)
+        assert minimum.evaluate(payload) == _min_return(payload)
+
+
+def test_membership_and_boolean_checks_reproduce_safety_policy() -> None:
+    (rule,) = compile_policies(
+        {
+            "rules": [
+                {
+                    "name": "safety",
+                    # A missing value fails its comparison, so ``not`` passes it.
+                    "check": {
+                        "not": {
+                            "field": "safety.flagged_categories",
+                            "intersects": ["violence", "self-harm"],
+                        }
+                    },
+                    "severity": "critical",
+                }
+            ]
+        }
+    )
+    builtin = SafetyPolicy()
+    for flagged in ([], ["spam"], ["violence"], ["spam", "self-harm"]):
+        payload = PolicyInput(
+            subject="post",
+            safety={
+                "blocked_categories": ["violence", "self-harm"],
+                "flagged_categories": flagged,
+            },
+        )
+        decision = rule.evaluate(payload)
+        assert decision.passed is builtin.evaluate(payload).passed
+        assert decision.severity == ("info" if decision.passed else "critical")
+    assert rule.evaluate(PolicyInput(subject="post")).passed
+
+
+def test_set_operators_handle_scalars_and_unhashable_values() -> None:
+    def rule(op: str) -> object:
+        return compile_rule(
+            {"name": op, "check": {"field": "metadata.tags", op: ["ab", "c"]}}
+        )
+
+    checks = {op: rule(op) for op in ("in", "not_in", "intersects", "disjoint")}
+
+    def outcomes(tags: object) -> dict[str, bool]:
+        payload = PolicyInput(subject="doc", metadata={"tags": tags})
+        return {op: check.evaluate(payload).passed for op, check in checks.items()}
+
+    # A string is one element, not a sequence of characters.
+    assert outcomes("ab") == {
+        "in": True,
+        "not_in": False,
+        "intersects": True,
+        "disjoint": False,
+    }
+    assert outcomes("a") == {
+        "in": False,
+        "not_in": True,
+        "intersects": False,
+        "disjoint": True,
+    }
+    assert outcomes(["c", "d"])["intersects"] and not outcomes(["d"])["intersects"]
+    # Lists cannot be set members; nested unhashable items cannot be tested.
+    assert outcomes(["ab"]) == {
+        "in": False,
+        "not_in": False,
+        "intersects": True,
+        "disjoint": False,
+    }
+    assert not any(outcomes([["ab"]]).values())
+
+
+def test_bound_values_feed_reasons_and_metadata() -> None:
+    rule = compile_rule(
+        {
+            "name": "spend",
+            "check": {
+                "all": [
+                    {"field": "budget.usage", "le": "$cap", "as": "usage"},
+                    {"field": "metadata.region", "in": ["eu", "us"], "as": "region"},
+                ]
+            },
+            "pass": "{usage:.1f} spent in {region}",
+            "fail": "{usage:.1f} of {cap} in {region}",
+            "metadata": ["usage", "region"],
+            "severity": "warning",
+        },
+        {"cap": 10},
+    )
+
+    ok = rule.evaluate(
+        PolicyInput(subject="a", budget={"usage": 4}, metadata={"region": "eu"})
+    )
+    over = rule.evaluate(
+        PolicyInput(subject="a", budget={"usage": 12}, metadata={"region": "eu"})
+    )
+
+    assert (ok.passed, ok.reason, ok.metadata) == (
+        True,
+        "4.0 spent in eu",
+        {"usage": 4.0, "region": "eu"},
+    )
+    # ``all`` short-circuits, so the region is never read for the failure.
+    assert (over.passed, over.reason, over.severity) == (
+        False,
+        "12.0 of 10 in n/a",
+        "warning",
+    )
+    assert over.metadata == {"usage": 12.0, "region": None}
+
+
+@pytest.mark.parametrize(
+    ("check", "options", "message"),
+    [
+        ({"field": "score", "ge": "$missing"}, {}, "Unknown policy"),
+        ({"field": "score"}, {}, "exactly one"),
+        ({"field": "score", "in": "abc"}, {}, "needs a list"),
+        ({"field": "score", "gt": 1}, {"fail": "{x}"}, "unknown names"),
+        ({"field": "score", "gt": 1}, {"severity": "fatal"}, "severity"),
+        ({"field": "score", "gt": 1}, {"name": None}, "needs a 'name'"),
+    ],
+)
+def test_invalid_rules_fail_at_compile_time(check, options, message) -> None:
+    with pytest.raises(ValueError, match=message):
+        compile_policies({"rules": [{"name": "r", "check": check, **options}]})
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from sys import path as sys_path
+import time
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from naestro.governance import (
+    DomainDeniedError,
+    DomainLimit,
+    load_rate_policy,
+    RateLimiter,
+    RatePolicy,
+)
+
+ENGINE = Path(__file__).resolve().parents[1] / "policy" / "engine.yaml"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_engine_yaml_is_loaded() -> None:
+    pytest.importorskip("yaml")
+
+    policy = load_rate_policy(ENGINE)
+
+    assert policy == RatePolicy(
+        allow=frozenset({"example.com"}),
+        deny=frozenset({"bad.com"}),
+        default=DomainLimit(qps=1.0, burst=2.0),
+        per_domain={"example.com": DomainLimit(qps=5.0, burst=10.0)},
+    )
+
+
+def test_buckets_refill_lazily_up_to_burst() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(
+        RatePolicy(per_domain={"example.com": DomainLimit(qps=5.0, burst=10.0)}),
+        clock=clock,
+    )
+
+    granted = [limiter.try_acquire("https://Example.com/page") for _ in range(11)]
+    assert granted == [True] * 10 + [False]
+    assert [limiter.try_acquire("other.org") for _ in range(3)] == [True, True, False]
+
+    clock.now += 0.5
+    assert limiter.available("example.com") == pytest.approx(2.5)
+    clock.now += 60.0
+    assert limiter.available("example.com") == 10.0
+    assert limiter.available("other.org") == 2.0
+
+
+def test_allow_and_deny_lists() -> None:
+    limiter = RateLimiter(
+        RatePolicy(allow=frozenset({"example.com"}), deny=frozenset({"bad.com"}))
+    )
+
+    assert limiter.try_acquire("example.com")
+    assert not limiter.try_acquire("bad.com")
+    assert not limiter.try_acquire("https://elsewhere.net/")
+    with pytest.raises(DomainDeniedError, match="Domain denied by policy: bad.com"):
+        limiter.reserve("bad.com")
+    with pytest.raises(DomainDeniedError, match="not allowed"):
+        limiter.reserve("elsewhere.net")
+    assert len(limiter) == 1
+
+
+def test_reservations_queue_behind_each_other() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(RatePolicy(default=DomainLimit(2.0, 1.0)), clock=clock)
+
+    delays = [limiter.reserve("api.test") for _ in range(4)]
+
+    assert delays == [0.0, 0.5, 1.0, 1.5]
+    assert not limiter.try_acquire("api.test")
+    with pytest.raises(ValueError, match="bucket of 1"):
+        limiter.reserve("api.test", tokens=2.0)
+
+
+def test_concurrent_threads_never_overdraw() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(RatePolicy(default=DomainLimit(1.0, 50.0)), clock=clock)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        granted = list(pool.map(lambda _: limiter.try_acquire("a.test"), range(400)))
+
+    assert sum(granted) == 50
+
+
+def test_async_callers_are_paced() -> None:
+    limiter = RateLimiter(RatePolicy(default=DomainLimit(qps=200.0, burst=1.0)))
+
+    async def main() -> float:
+        started = time.perf_counter()
+        await asyncio.gather(*(limiter.aacquire("a.test") for _ in range(9)))
+        return time.perf_counter() - started
+
+    assert asyncio.run(main()) >= 8 / 200.0
+
+
+def test_refilled_buckets_are_compacted_away() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, max_domains=4)
+    for index in range(4):
+        limiter.try_acquire(f"d{index}.test")
+    clock.now += 0.5
+    assert limiter.try_acquire("d0.test")
+
+    clock.now += 1.2
+    limiter.try_acquire("fresh.test")
+
+    # Only d0, drained again 1.2s ago, is still refilling; the rest are full.
+    assert len(limiter) == 2
+    assert limiter.available("d0.test") == pytest.approx(1.7)
+    assert limiter.available("d3.test") == 2.0
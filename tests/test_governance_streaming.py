@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import random
+from sys import path as sys_path
+from typing import AsyncIterator
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from naestro.governance import (
+    BudgetPolicy,
+    Decision,
+    PolicyInput,
+    RollingQuantile,
+    StreamingBudgetPolicy,
+    StreamingLatencySLOPolicy,
+)
+
+
+def _p95(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[int(0.95 * len(ordered))]
+
+
+def test_rolling_quantile_tracks_recent_samples() -> None:
+    rng = random.Random(3)
+    samples = [rng.lognormvariate(4.0, 0.4) for _ in range(6000)]
+    samples += [3 * rng.lognormvariate(4.0, 0.4) for _ in range(6000)]
+    sketch = RollingQuantile(0.95, window=1000)
+
+    for index, sample in enumerate(samples, 1):
+        sketch.add(sample)
+        if index in {6000, 12000}:
+            assert 500 <= sketch.count <= 1000
+            recent = _p95(samples[index - sketch.count : index])
+            assert sketch.value == pytest.approx(recent, rel=0.05)
+
+    assert sketch.value > 2 * _p95(samples[:6000])
+    assert RollingQuantile().value is None
+    with pytest.raises(ValueError):
+        RollingQuantile(1.0)
+
+
+@pytest.mark.parametrize("window", [11, 37, 1001])
+def test_rolling_quantile_never_covers_more_than_window(window: int) -> None:
+    sketch = RollingQuantile(0.5, window=window)
+    covered = []
+    for sample in range(5 * window):
+        sketch.add(float(sample))
+        covered.append(sketch.count)
+
+    assert sketch.window == window - 1
+    assert max(covered) <= window
+    assert min(covered[window:]) >= window // 2
+
+
+def test_latency_stream_emits_only_on_crossings() -> None:
+    rng = random.Random(5)
+    policy = StreamingLatencySLOPolicy(200.0, window=200)
+    phases = [(120.0, 600), (320.0, 600), (110.0, 600)]
+
+    decisions = []
+    for centre, count in phases:
+        for _ in range(count):
+            decision = policy.observe(rng.gauss(centre, 15.0))
+            if decision is not None:
+                decisions.append(decision)
+
+    assert [decision.passed for decision in decisions] == [False, True]
+    breach, recovery = decisions
+    assert breach.severity == "warning"
+    assert breach.metadata["observed_ms"] > 200.0
+    assert breach.reason.startswith("p95 latency")
+    assert recovery.metadata["observed_ms"] < 200.0
+    assert policy.evaluate(PolicyInput(subject="svc")).passed
+
+
+def test_latency_stream_waits_for_min_samples() -> None:
+    policy = StreamingLatencySLOPolicy(100.0, min_samples=20)
+
+    assert [policy.observe(500.0) for _ in range(19)] == [None] * 19
+    assert policy.evaluate(PolicyInput(subject="svc")).reason == (
+        "Not enough latency samples"
+    )
+    assert policy.observe(500.0) is not None
+
+
+def test_budget_stream_matches_snapshot_policy() -> None:
+    policy = StreamingBudgetPolicy(10.0)
+    emitted = [policy.observe(amount) for amount in (4.0, 5.0, 2.5, 1.0)]
+
+    assert emitted[:2] == [None, None] and emitted[3] is None
+    snapshot = BudgetPolicy(name="budget_stream").evaluate(
+        PolicyInput(subject="run", budget={"limit": 10.0, "usage": 11.5})
+    )
+    assert emitted[2] == snapshot
+    assert not policy.evaluate(PolicyInput(subject="run")).passed
+
+    policy.reset()
+    assert policy.spent == 0.0
+    assert policy.evaluate(PolicyInput(subject="run")).passed
+
+
+def test_budget_stream_consumes_bus_events() -> None:
+    pytest.importorskip("jsonschema")
+    from naestro.core.bus import MessageBus
+
+    bus = MessageBus()
+    bus.register_schema("billing.charged", {"type": "object"})
+    decisions: list[Decision] = []
+    StreamingBudgetPolicy(5.0, currency="eur").subscribe(
+        bus, "billing.charged", field="amount", on_decision=decisions.append
+    )
+
+    for amount in (2.0, 2.0, 2.0, 3.0):
+        bus.publish("billing.charged", {"amount": amount})
+    bus.publish("billing.charged", {"refund": 1.0})
+
+    (decision,) = decisions
+    assert decision.metadata == {
+        "limit": 5.0,
+        "usage": 6.0,
+        "currency": "eur",
+        "excess": 1.0,
+    }
+
+
+def test_streams_can_be_watched_asynchronously() -> None:
+    async def feed() -> AsyncIterator[float]:
+        for value in [50.0] * 30 + [900.0] * 30:
+            yield value
+
+    async def collect() -> list[Decision]:
+        policy = StreamingLatencySLOPolicy(100.0, window=40)
+        return [decision async for decision in policy.watch(feed())]
+
+    (decision,) = asyncio.run(collect())
+    assert not decision.passed and decision.metadata["slo_ms"] == 100.0
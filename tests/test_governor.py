@@ -97,3 +97,46 @@ def test_apply_patches_supports_merge_and_remove() -> None:
     assert len(updated["steps"]) == 1
     assert updated["metadata"]["owner"] == "alice"
     assert "metadata" not in plan
+
+
+def test_patching_copies_the_plan_once_and_leaves_the_caller_untouched() -> None:
+    def approve(index: int) -> Policy:
+        def check(payload: PolicyInput) -> Decision:
+            patch = {"op": "set", "path": ("tasks", index, "status"), "value": "ok"}
+            return Decision(
+                name=f"approve-{index}", passed=True, reason="ok", patches=(patch,)
+            )
+
+        return Policy(f"approve-{index}", "approves a task", check)
+
+    plan = {"tasks": [{"status": "pending"} for _ in range(3)]}
+    policy_input = PolicyInput(subject="test", plan=plan)
+    bus = MessageBus(schema=_governor_schema())
+    governor = Governor([approve(0), approve(2)], bus=bus)
+
+    _, _, updated = governor.enforce(
+        policy_input, apply_policy_patches=True, return_input=True
+    )
+
+    statuses = [task["status"] for task in updated.plan["tasks"]]
+    assert statuses == ["ok", "pending", "ok"]
+    assert policy_input.plan == {"tasks": [{"status": "pending"}] * 3}
+
+    unpatched = Governor([], bus=bus).enforce(
+        policy_input, apply_policy_patches=True, return_input=True
+    )[2]
+    assert unpatched.plan is policy_input.plan
+
+
+def test_unobserved_evaluations_can_skip_publishing() -> None:
+    bus = MessageBus(schema=_governor_schema())
+    governor = Governor([], bus=bus, publish_unobserved=False)
+
+    assert governor.enforce({"subject": "quiet"}) == (True, [])
+    assert not bus.has_subscribers("governor.evaluated")
+    assert bus.envelopes == ()
+
+    published: list[Mapping[str, object]] = []
+    bus.subscribe("governor.evaluated", published.append)
+    governor.enforce({"subject": "heard"})
+    assert [payload["input"]["subject"] for payload in published] == ["heard"]
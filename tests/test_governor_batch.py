@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from pathlib import Path
+from sys import path as sys_path
+from typing import Mapping
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+pytest.importorskip("jsonschema")
+pytest.importorskip("numpy")
+
+from naestro.core.bus import MessageBus
+from naestro.governance import (
+    BudgetPolicy,
+    Decision,
+    Governor,
+    PolicyInput,
+    RiskPolicy,
+)
+from naestro.governance.batch import PolicyColumns
+
+INPUTS = [
+    {"subject": "within", "budget": {"limit": 10.0, "usage": 4.0}},
+    {"subject": "over", "budget": {"limit": 10.0, "usage": 12.5, "currency": "EUR"}},
+    {"subject": "no-budget"},
+    {"subject": "incomplete", "budget": {"limit": 10.0}},
+    {
+        "subject": "risky",
+        "budget": {"limit": 5.0, "usage": 5.0},
+        "risk": {"score": 0.9},
+    },
+]
+
+
+def test_batch_decisions_match_single_evaluation() -> None:
+    policies = [BudgetPolicy(), RiskPolicy(max_score=0.5)]
+    governor = Governor(policies)
+
+    batch = governor.evaluate_batch(INPUTS)
+
+    assert batch == [governor.evaluate(data) for data in INPUTS]
+    assert [row[0].passed for row in batch] == [True, False, True, True, True]
+
+
+def test_vectorised_policies_receive_columns() -> None:
+    seen: list[PolicyColumns] = []
+
+    class Vectorised:
+        name = "vectorised"
+        description = "checks usage columns"
+
+        def evaluate(self, policy_input: PolicyInput) -> Decision:  # pragma: no cover
+            raise AssertionError("evaluate_many should be used")
+
+        def evaluate_many(self, columns: PolicyColumns) -> list[Decision]:
+            seen.append(columns)
+            return [
+                Decision(name=self.name, passed=usage == usage, reason="checked")
+                for usage in columns.numeric("budget.usage").tolist()
+            ]
+
+    governor = Governor([Vectorised()])
+    results = governor.evaluate_batch(INPUTS)
+
+    (columns,) = seen
+    assert len(columns) == 5
+    assert columns.values("budget.currency")[1:3] == ["EUR", None]
+    assert columns.missing("budget.usage").tolist() == [False, False, True, True, False]
+    assert [row[0].passed for row in results] == [True, True, False, False, True]
+
+
+def test_batch_publishes_one_aggregated_event() -> None:
+    bus = MessageBus()
+    published: list[Mapping[str, object]] = []
+    bus.subscribe("governor.batch_evaluated", published.append)
+    bus.subscribe("governor.evaluated", published.append)
+    governor = Governor([BudgetPolicy(), RiskPolicy(max_score=0.5)], bus=bus)
+
+    governor.evaluate_batch(INPUTS)
+
+    assert published == [
+        {
+            "count": 5,
+            "approved": [True, False, True, True, False],
+            "failures": {"budget": 1, "risk": 1},
+        }
+    ]
+
+
+def test_mismatched_batch_lengths_are_rejected() -> None:
+    class Short:
+        name = "short"
+        description = "returns too few decisions"
+
+        def evaluate(self, policy_input: PolicyInput) -> Decision:  # pragma: no cover
+            raise AssertionError
+
+        def evaluate_many(self, columns: PolicyColumns) -> list[Decision]:
+            return []
+
+    with pytest.raises(ValueError, match="returned 0 decisions for 5 inputs"):
+        Governor([Short()]).evaluate_batch(INPUTS)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from sys import path as sys_path
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+pytest.importorskip("jsonschema")
+
+from naestro.governance import (
+    BudgetPolicy,
+    DecisionCache,
+    Governor,
+    RiskPolicy,
+    SafetyPolicy,
+)
+from naestro.governance.cache import fingerprint
+from naestro.governance.policies import Policy
+from naestro.governance.schemas import Decision, PolicyInput
+
+
+def _counting(calls: list[str], **options: object) -> Policy:
+    def check(payload: PolicyInput) -> Decision:
+        calls.append(payload.subject)
+        return Decision(name="counting", passed=True, reason="ok")
+
+    return Policy("counting", "counts calls", check, **options)
+
+
+def test_repeat_evaluations_hit_the_cache() -> None:
+    calls: list[str] = []
+    cache = DecisionCache()
+    governor = Governor([_counting(calls, reads=("budget",))], cache=cache)
+    payload = {"subject": "trade", "budget": {"limit": 10.0, "usage": 4.0}}
+
+    first = governor.evaluate(payload)
+    again = governor.evaluate({**payload, "subject": "retry", "score": 0.3})
+    changed = governor.evaluate({**payload, "budget": {"limit": 10.0, "usage": 5.0}})
+
+    assert calls == ["trade", "trade"]
+    assert again[0] == first[0] and again[0] is not first[0]
+    assert changed[0] is not first[0]
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_cached_decisions_are_copied_per_caller() -> None:
+    governor = Governor([RiskPolicy(max_score=0.1)], cache=DecisionCache())
+    payload = {"subject": "trade", "risk": {"score": 0.5}}
+
+    first = governor.evaluate(payload)[0]
+    first.passed = True
+    first.metadata["tampered"] = True
+    again = governor.evaluate(payload)[0]
+
+    assert not again.passed
+    assert "tampered" not in again.metadata
+
+
+def test_policies_without_reads_are_never_cached() -> None:
+    calls: list[str] = []
+    cache = DecisionCache()
+    governor = Governor([_counting(calls)], cache=cache)
+
+    governor.evaluate({"subject": "trade"})
+    governor.evaluate({"subject": "trade"})
+
+    assert calls == ["trade", "trade"]
+    assert cache.stats.hits == cache.stats.misses == 0
+
+
+def test_cache_is_bounded_and_keyed_per_policy() -> None:
+    cache = DecisionCache(maxsize=2)
+    strict, lenient = RiskPolicy(max_score=0.1), RiskPolicy(max_score=0.9)
+    governor = Governor([strict, lenient], cache=cache)
+
+    decisions = governor.evaluate({"subject": "trade", "risk": {"score": 0.5}})
+    assert [decision.passed for decision in decisions] == [False, True]
+    governor.evaluate({"subject": "trade", "risk": {"score": 0.2}})
+
+    stats = cache.stats
+    assert (stats.size, stats.evictions, stats.hits) == (2, 2, 0)
+    with pytest.raises(ValueError):
+        DecisionCache(maxsize=0)
+
+
+def test_unhashable_inputs_are_evaluated_uncached() -> None:
+    cache = DecisionCache()
+    governor = Governor([SafetyPolicy()], cache=cache)
+    payload = {
+        "subject": "chat",
+        "safety": {"annotations": {"spans": bytearray(b"ab")}},
+    }
+
+    first = governor.evaluate(payload)
+    again = governor.evaluate(payload)
+
+    assert first[0].passed and again[0] == first[0]
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.size) == (0, 2, 0)
+
+
+def test_fingerprint_ignores_set_order_and_unread_fields() -> None:
+    first = PolicyInput(
+        subject="a", safety={"flagged_categories": ["x", "y", "z"]}, score=1.0
+    )
+    second = PolicyInput(
+        subject="b", safety={"flagged_categories": ["z", "x", "y"]}, score=2.0
+    )
+
+    assert fingerprint(first, SafetyPolicy.reads) == fingerprint(
+        second, SafetyPolicy.reads
+    )
+    assert fingerprint(first, ["score"]) != fingerprint(second, ["score"])
+
+
+def test_async_evaluation_shares_the_cache() -> None:
+    cache = DecisionCache()
+    governor = Governor([BudgetPolicy()], cache=cache)
+    payload = {"subject": "trade", "budget": {"limit": 1.0, "usage": 2.0}}
+
+    (cold,) = governor.evaluate(payload)
+    (warm,) = asyncio.run(governor.aevaluate(payload))
+
+    assert warm == cold and not warm.passed
+    assert cache.stats.hits == 1
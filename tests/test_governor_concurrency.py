@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from sys import path as sys_path
+import threading
+import time
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+pytest.importorskip("jsonschema")
+
+from naestro.governance.governor import Governor
+from naestro.governance.policies import BudgetPolicy, Policy
+from naestro.governance.schemas import Decision, PolicyInput
+
+INPUT = PolicyInput(
+    subject="trade",
+    plan={"status": "proposed"},
+    budget={"limit": 10.0, "usage": 4.0},
+)
+
+
+def _sleeper(name: str, delay: float, **options: object) -> Policy:
+    def check(payload: PolicyInput) -> Decision:
+        time.sleep(delay)
+        return Decision(name=name, passed=True, reason=f"slept {delay}")
+
+    return Policy(name, "sleeps", check, **options)
+
+
+def test_concurrent_evaluation_overlaps_slow_policies_in_order() -> None:
+    policies = [_sleeper(f"slow-{index}", 0.1) for index in range(4)]
+    governor = Governor([*policies, BudgetPolicy()], concurrent=True, max_workers=4)
+    with governor:
+        started = time.perf_counter()
+        allowed, results = governor.enforce(INPUT)
+        elapsed = time.perf_counter() - started
+
+    assert allowed
+    assert [result.name for result in results] == [
+        "slow-0",
+        "slow-1",
+        "slow-2",
+        "slow-3",
+        "budget",
+    ]
+    assert elapsed < 0.3
+
+
+@pytest.mark.parametrize(
+    ("fail_open", "passed", "severity"),
+    [(False, False, "critical"), (True, True, "warning")],
+)
+def test_timeouts_fail_open_or_closed(
+    fail_open: bool, passed: bool, severity: str
+) -> None:
+    governor = Governor(
+        [_sleeper("classifier", 0.5), BudgetPolicy()],
+        concurrent=True,
+        timeout=0.05,
+        fail_open=fail_open,
+    )
+    allowed, results = governor.enforce(INPUT)
+    governor.close()
+
+    assert allowed is passed
+    timed_out = results[0]
+    assert timed_out.name == "classifier"
+    assert timed_out.passed is passed
+    assert timed_out.severity == severity
+    assert timed_out.metadata["timed_out"] is True
+    assert results[1].name == "budget" and results[1].passed
+
+
+def test_policy_level_timeout_overrides_governor_default() -> None:
+    governor = Governor(
+        [
+            _sleeper("lenient", 0.3, timeout=0.05, fail_open=True),
+            _sleeper("strict", 0.01),
+        ],
+        timeout=1.0,
+    )
+    results = governor.evaluate(INPUT)
+    governor.close()
+
+    assert results[0].metadata == {
+        "timed_out": True,
+        "timeout": 0.05,
+        "fail_open": True,
+    }
+    assert results[1].reason == "slept 0.01"
+
+
+def test_timed_policies_run_one_at_a_time_without_concurrency() -> None:
+    lock = threading.Lock()
+    running = peak = 0
+
+    def check(payload: PolicyInput) -> Decision:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return Decision(name="counted", passed=True, reason="ok")
+
+    policies = [Policy(f"counted-{index}", "counts", check) for index in range(4)]
+    with Governor(policies, timeout=1.0, max_workers=4) as governor:
+        results = governor.evaluate(INPUT)
+
+    assert all(result.passed for result in results)
+    assert peak == 1
+
+
+def test_timeouts_start_when_a_queued_policy_starts() -> None:
+    policies = [_sleeper(f"queued-{index}", 0.1) for index in range(3)]
+    with Governor(policies, concurrent=True, max_workers=1, timeout=0.15) as governor:
+        results = governor.evaluate(INPUT)
+
+    assert [result.reason for result in results] == ["slept 0.1"] * 3
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_overrunning_policy_does_not_hold_up_the_rest(concurrent: bool) -> None:
+    policies = [_sleeper("stuck", 1.0), _sleeper("quick", 0.01)]
+    governor = Governor(policies, concurrent=concurrent, max_workers=1, timeout=0.1)
+
+    started = time.perf_counter()
+    results = governor.evaluate(INPUT)
+    elapsed = time.perf_counter() - started
+    governor.close()
+
+    assert results[0].metadata["timed_out"] is True
+    assert results[1].reason == "slept 0.01"
+    assert elapsed < 0.5
+
+
+def test_patching_policies_run_serially_and_see_earlier_patches() -> None:
+    running = threading.Semaphore(1)
+    seen: list[str] = []
+
+    def patcher(status: str) -> Policy:
+        def check(payload: PolicyInput) -> Decision:
+            assert running.acquire(blocking=False), "policies overlapped"
+            try:
+                time.sleep(0.02)
+                seen.append(payload.plan["status"])
+                patch = {"op": "set", "path": ("status",), "value": status}
+                return Decision(name=status, passed=True, reason="ok", patches=(patch,))
+            finally:
+                running.release()
+
+        return Policy(status, "patches status", check)
+
+    governor = Governor(
+        [patcher("reviewed"), patcher("approved")], concurrent=True, max_workers=4
+    )
+    allowed, _, updated = governor.enforce(
+        INPUT, apply_policy_patches=True, return_input=True
+    )
+    governor.close()
+
+    assert allowed
+    assert seen == ["proposed", "reviewed"]
+    assert updated.plan["status"] == "approved"
+    assert INPUT.plan["status"] == "proposed"
+
+
+class _AsyncClassifier:
+    name = "classifier"
+    description = "awaits a remote scoring service"
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    def evaluate(self, policy_input: PolicyInput) -> Decision:  # pragma: no cover
+        raise AssertionError("the async path should be used")
+
+    async def aevaluate(self, policy_input: PolicyInput) -> Decision:
+        await asyncio.sleep(self.delay)
+        return Decision(name=self.name, passed=True, reason="clean")
+
+
+def test_async_enforce_awaits_async_policies_concurrently() -> None:
+    governor = Governor(
+        [_AsyncClassifier(0.1), _AsyncClassifier(0.1), BudgetPolicy()]
+    )
+
+    started = time.perf_counter()
+    allowed, results = asyncio.run(governor.aenforce(INPUT))
+    elapsed = time.perf_counter() - started
+
+    assert allowed
+    assert [result.name for result in results] == ["classifier", "classifier", "budget"]
+    assert elapsed < 0.18
+
+    slow = Governor([_AsyncClassifier(1.0)], timeout=0.05)
+    (decision,) = asyncio.run(slow.aevaluate(INPUT))
+    assert not decision.passed and decision.severity == "critical"
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from pathlib import Path
+import random
+from sys import path as sys_path
+from typing import Any
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from naestro.governance import (
+    apply_patches,
+    find_conflicts,
+    patch_plan,
+    PatchConflictError,
+    PlanPatcher,
+    PolicyPatch,
+)
+
+KEYS = ("a", "b", "c", "status")
+
+
+def _random_value(rng: random.Random, depth: int = 0) -> Any:
+    roll = rng.random()
+    if depth < 3 and roll < 0.35:
+        return {key: _random_value(rng, depth + 1) for key in rng.sample(KEYS, 2)}
+    if depth < 3 and roll < 0.55:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randint(1, 3))]
+    return rng.choice([0, 1, "x", None, True])
+
+
+def _random_path(rng: random.Random, plan: Any) -> list[str | int]:
+    path: list[str | int] = []
+    node = plan
+    while True:
+        if isinstance(node, dict) and node and rng.random() < 0.7:
+            key = rng.choice([*node, rng.choice(KEYS)])
+        elif isinstance(node, list) and node and rng.random() < 0.7:
+            key = rng.randrange(-1, len(node) + 1)
+        else:
+            key = rng.choice([*KEYS, 0])
+        path.append(key)
+        if isinstance(node, dict):
+            node = node.get(key)
+        elif isinstance(node, list) and isinstance(key, int):
+            node = node[key] if -len(node) <= key < len(node) else None
+        else:
+            node = None
+        if not isinstance(node, (dict, list)) or rng.random() < 0.3:
+            return path
+
+
+def _random_patches(rng: random.Random, plan: Any, count: int) -> list[PolicyPatch]:
+    patches: list[PolicyPatch] = []
+    for _ in range(count):
+        op = rng.choice(["set", "set", "remove", "merge"])
+        patch: PolicyPatch = {"op": op, "path": tuple(_random_path(rng, plan))}
+        if op == "set":
+            patch["value"] = _random_value(rng)
+        elif op == "merge":
+            patch["value"] = {rng.choice(KEYS): _random_value(rng)}
+        patches.append(patch)
+    return patches
+
+
+def _outcome(apply: Any, plan: Any, patches: list[PolicyPatch]) -> Any:
+    try:
+        return apply(plan, patches)
+    except (IndexError, KeyError, TypeError, ValueError) as exc:
+        return type(exc)
+
+
+def test_structural_sharing_matches_apply_patches() -> None:
+    rng = random.Random(7)
+    for _ in range(500):
+        plan = {key: _random_value(rng) for key in KEYS}
+        snapshot = deepcopy(plan)
+        patches = _random_patches(rng, plan, rng.randint(1, 6))
+
+        expected = _outcome(apply_patches, plan, patches)
+        shared = _outcome(
+            lambda p, ops: patch_plan(p, ops, check_conflicts=False), plan, patches
+        )
+
+        assert shared == expected
+        assert plan == snapshot
+
+
+def test_conflict_free_batches_do_not_depend_on_order() -> None:
+    rng = random.Random(11)
+    checked = 0
+    for _ in range(1000):
+        plan = {key: _random_value(rng) for key in KEYS}
+        patches = _random_patches(rng, plan, rng.randint(2, 4))
+        if find_conflicts(patches):
+            continue
+        shuffled = rng.sample(patches, len(patches))
+        forward = _outcome(apply_patches, plan, patches)
+        backward = _outcome(apply_patches, plan, shuffled)
+        # Patches may rely on containers created by others; compare successes.
+        if isinstance(forward, type) or isinstance(backward, type):
+            continue
+        assert forward == backward
+        checked += 1
+    assert checked > 200
+
+
+def test_only_patched_paths_are_copied() -> None:
+    plan = {
+        "status": "pending",
+        "tasks": [{"id": index, "params": {"n": index}} for index in range(100)],
+        "owner": {"name": "alice"},
+    }
+
+    patcher = PlanPatcher(plan)
+    patcher.apply([{"op": "set", "path": ("tasks", 3, "status"), "value": "ok"}])
+    result = patcher.apply([{"op": "merge", "path": ("tasks", 3), "value": {"n": 1}}])
+
+    assert result["tasks"][3] == {"id": 3, "params": {"n": 3}, "status": "ok", "n": 1}
+    assert result["owner"] is plan["owner"]
+    assert result["tasks"][4] is plan["tasks"][4]
+    assert result["tasks"][3]["params"] is plan["tasks"][3]["params"]
+    assert result["tasks"] is not plan["tasks"]
+    assert "status" not in plan["tasks"][3]
+    assert PlanPatcher(plan).apply([]) is plan
+
+
+@pytest.mark.parametrize(
+    ("patches", "conflicting"),
+    [
+        (
+            [
+                {"op": "set", "path": ("a",), "value": 1},
+                {"op": "set", "path": ("a",), "value": 2},
+            ],
+            True,
+        ),
+        (
+            [
+                {"op": "set", "path": ("a",), "value": 1},
+                {"op": "set", "path": ("a",), "value": 1},
+            ],
+            False,
+        ),
+        (
+            [
+                {"op": "set", "path": ("a", "b"), "value": 1},
+                {"op": "remove", "path": ("a",)},
+            ],
+            True,
+        ),
+        (
+            [
+                {"op": "merge", "path": ("a",), "value": {"x": 1}},
+                {"op": "set", "path": ("a", "y"), "value": 2},
+                {"op": "merge", "path": ("a",), "value": {"z": 3, "x": 1}},
+            ],
+            False,
+        ),
+        (
+            [
+                {"op": "merge", "path": ("a",), "value": {"x": 1}},
+                {"op": "set", "path": ("a", "x", "deep"), "value": 2},
+            ],
+            True,
+        ),
+        (
+            [
+                {"op": "set", "path": ("steps", 0, "name"), "value": "a"},
+                {"op": "remove", "path": ("steps", 1)},
+            ],
+            False,
+        ),
+        (
+            [
+                {"op": "remove", "path": ("steps", 1)},
+                {"op": "set", "path": ("steps", 2, "name"), "value": "a"},
+            ],
+            True,
+        ),
+        (
+            [
+                {"op": "remove", "path": ("steps", 0)},
+                {"op": "remove", "path": ("steps", 0)},
+            ],
+            True,
+        ),
+    ],
+)
+def test_find_conflicts(patches: list[PolicyPatch], conflicting: bool) -> None:
+    assert bool(find_conflicts(patches)) is conflicting
+
+
+def test_conflicting_batches_are_rejected_before_applying() -> None:
+    plan = {"steps": [{"name": "a"}, {"name": "b"}, {"name": "c"}]}
+    patches: list[PolicyPatch] = [
+        {"op": "set", "path": ("status",), "value": "ok"},
+        {"op": "remove", "path": ("steps", 0)},
+        {"op": "set", "path": ("steps", 1, "name"), "value": "B"},
+    ]
+    patcher = PlanPatcher(plan)
+
+    with pytest.raises(PatchConflictError, match=r"remove \['steps', 0\]") as info:
+        patcher.apply(patches, check_conflicts=True)
+
+    assert info.value.conflicts == [(patches[1], patches[2])]
+    assert patcher.plan is plan
+    assert patch_plan(plan, patches[:2]) == {"status": "ok", "steps": plan["steps"][1:]}
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from sys import path as sys_path
+import time
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+pytest.importorskip("jsonschema")
+
+from naestro.core.bus import MessageBus
+from naestro.governance import EvaluationPlan, Governor
+from naestro.governance.policies import BudgetPolicy, Policy
+from naestro.governance.schemas import Decision, PolicyInput
+
+OVER_BUDGET = PolicyInput(subject="trade", budget={"limit": 10.0, "usage": 25.0})
+
+
+def _recorder(name: str, calls: list[str], **options: object) -> Policy:
+    def check(payload: PolicyInput) -> Decision:
+        calls.append(name)
+        return Decision(name=name, passed=True, reason="clean")
+
+    return Policy(name, "records calls", check, **options)
+
+
+def test_fail_fast_skips_expensive_policies_after_critical_failure() -> None:
+    calls: list[str] = []
+    bus = MessageBus()
+    published: list[dict] = []
+    bus.subscribe("governor.evaluated", published.append)
+    plan = EvaluationPlan()
+    governor = Governor(
+        [_recorder("classifier", calls, cost=0.5), BudgetPolicy()],
+        bus=bus,
+        plan=plan,
+        fail_fast=True,
+    )
+
+    allowed, results = governor.enforce(OVER_BUDGET)
+
+    assert not allowed
+    assert calls == []
+    assert [result.name for result in results] == ["budget"]
+    assert published[0]["skipped"] == ["classifier"]
+    assert plan.skipped == {"classifier": 1}
+
+
+def test_without_fail_fast_every_policy_runs_in_registration_order() -> None:
+    calls: list[str] = []
+    governor = Governor(
+        [_recorder("classifier", calls, cost=0.5), BudgetPolicy()],
+        plan=EvaluationPlan(),
+    )
+
+    results = governor.evaluate(OVER_BUDGET)
+
+    assert calls == ["classifier"]
+    assert [result.name for result in results] == ["classifier", "budget"]
+
+
+def test_observed_latency_overrides_declared_cost() -> None:
+    def slow(payload: PolicyInput) -> Decision:
+        time.sleep(0.02)
+        return Decision(name="slow", passed=True, reason="ok")
+
+    calls: list[str] = []
+    declared_slow = _recorder("declared-slow", calls, cost=1.0)
+    actually_slow = Policy("slow", "sleeps", slow, cost=0.0)
+    plan = EvaluationPlan(alpha=0.5)
+    governor = Governor([actually_slow, declared_slow], plan=plan)
+
+    assert plan.order(governor._policies) == [0, 1]
+    governor.evaluate(OVER_BUDGET)
+
+    assert plan.observed["slow"] >= 0.02
+    assert plan.order(governor._policies) == [1, 0]
+    previous = plan.observed["slow"]
+    plan.observe(actually_slow, 0.0)
+    assert plan.observed["slow"] == pytest.approx(previous / 2)
+
+
+def test_unknown_policies_are_evaluated_last() -> None:
+    class Unknown:
+        name = "unknown"
+        description = "declares no cost"
+
+        def evaluate(self, policy_input: PolicyInput) -> Decision:
+            return Decision(name=self.name, passed=True, reason="ok")
+
+    plan = EvaluationPlan()
+    assert plan.order([Unknown(), BudgetPolicy(), Unknown()]) == [1, 0, 2]
+    with pytest.raises(ValueError):
+        EvaluationPlan(alpha=0.0)
+
+
+def test_fail_fast_cancels_pending_concurrent_and_async_work() -> None:
+    def slow(payload: PolicyInput) -> Decision:
+        time.sleep(0.5)
+        return Decision(name="slow", passed=True, reason="ok")
+
+    policies = [Policy("slow", "sleeps", slow, cost=0.5), BudgetPolicy()]
+    with Governor(
+        policies, plan=EvaluationPlan(), fail_fast=True, concurrent=True
+    ) as governor:
+        started = time.perf_counter()
+        allowed, results = governor.enforce(OVER_BUDGET)
+    assert time.perf_counter() - started < 0.4
+    assert not allowed and [result.name for result in results] == ["budget"]
+
+    class Remote:
+        name = "remote"
+        description = "awaits a scoring service"
+        cost = 1.0
+        cancelled = False
+
+        def evaluate(self, policy_input: PolicyInput) -> Decision:  # pragma: no cover
+            raise AssertionError("the async path should be used")
+
+        async def aevaluate(self, policy_input: PolicyInput) -> Decision:
+            try:
+                await asyncio.sleep(1.0)
+            except asyncio.CancelledError:
+                Remote.cancelled = True
+                raise
+            return Decision(name=self.name, passed=True, reason="clean")
+
+    governor = Governor(
+        [Remote(), BudgetPolicy()], plan=EvaluationPlan(), fail_fast=True
+    )
+    started = time.perf_counter()
+    allowed, results = asyncio.run(governor.aenforce(OVER_BUDGET))
+
+    assert not allowed and [result.name for result in results] == ["budget"]
+    assert time.perf_counter() - started < 0.5
+    assert Remote.cancelled
+
+
+def test_patching_keeps_registration_order_and_stops_on_failure() -> None:
+    calls: list[str] = []
+    governor = Governor(
+        [BudgetPolicy(), _recorder("reviewer", calls, cost=0.0)],
+        plan=EvaluationPlan(),
+        fail_fast=True,
+    )
+
+    allowed, results = governor.enforce(OVER_BUDGET, apply_policy_patches=True)
+
+    assert not allowed
+    assert [result.name for result in results] == ["budget"]
+    assert calls == []
+
+
+def test_concurrent_fail_fast_only_counts_cancelled_policies_as_skipped() -> None:
+    def gate(payload: PolicyInput) -> Decision:
+        time.sleep(0.05)
+        return Decision(name="gate", passed=False, reason="no", severity="critical")
+
+    calls: list[str] = []
+    plan = EvaluationPlan()
+    governor = Governor(
+        [
+            Policy("gate", "fails late", gate, cost=0.0),
+            _recorder("quick", calls, cost=1.0),
+        ],
+        plan=plan,
+        fail_fast=True,
+        concurrent=True,
+        max_workers=2,
+    )
+    with governor:
+        allowed, _ = governor.enforce(OVER_BUDGET)
+
+    assert not allowed
+    assert calls == ["quick"]
+    assert plan.skipped == {}
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from pathlib import Path
+from sys import path as sys_path
+from typing import Collection
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+from naestro.routing.model_registry import ModelInfo, ModelRegistry
+
+
+def _model(name: str, *capabilities: str) -> ModelInfo:
+    return ModelInfo(name, "demo", frozenset(capabilities), 0.8, 0.2, 0.1)
+
+
+def test_candidates_intersect_postings_in_registration_order() -> None:
+    registry = ModelRegistry(
+        [
+            _model("eu-int8", "chat", "analysis", "eu"),
+            _model("us-fp16", "chat", "analysis", "us"),
+            _model("eu-fp16", "chat", "code", "eu"),
+            _model("eu-coder", "chat", "analysis", "code", "eu"),
+        ]
+    )
+
+    def names(required: Collection[str]) -> list[str]:
+        return [model.name for model in registry.candidates(required)]
+
+    assert names(["eu", "analysis"]) == ["eu-int8", "eu-coder"]
+    assert names({"code"}) == ["eu-fp16", "eu-coder"]
+    assert names(()) == ["eu-int8", "us-fp16", "eu-fp16", "eu-coder"]
+    assert names(["vision"]) == []
+    assert names(["us", "code"]) == []
+    assert registry.capability_counts()["eu"] == 3
+
+
+def test_index_tracks_updates_and_removals() -> None:
+    registry = ModelRegistry([_model("a", "chat"), _model("b", "chat", "code")])
+
+    registry.register(_model("a", "code"))
+    assert [model.name for model in registry.candidates(["chat"])] == ["b"]
+    assert [model.name for model in registry.candidates(["code"])] == ["a", "b"]
+
+    registry.unregister("b")
+    assert registry.candidates(["chat"]) == []
+    assert "chat" not in registry.capability_counts()
+
+    registry.register(_model("b", "code"))
+    assert [model.name for model in registry.candidates(["code"])] == ["a", "b"]
+
+    registry.clear()
+    assert registry.candidates(["code"]) == []
+    assert registry.copy().capability_counts() == {}
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+from sys import path as sys_path
+from types import SimpleNamespace
+
+import pytest
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+from naestro.agents import loader
+from naestro.agents.debate import DebateOrchestrator, DebateSettings
+from naestro.agents.loader import RoleSpec
+from naestro.agents.roles import Role, Roles
+
+PACK_SOURCE = '''
+from naestro.agents.roles import Role
+
+
+def _compliance(history):
+    return f"compliance-{len(history)}"
+
+
+COMPLIANCE = Role("compliance", "Checks compliance rules", _compliance)
+
+
+def build_auditor():
+    return Role("auditor-impl", "Audits trades", lambda history: "audited")
+'''
+
+
+@pytest.fixture()
+def role_pack(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    module_name = "naestro_test_role_pack"
+    (tmp_path / f"{module_name}.py").write_text(PACK_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+    return module_name
+
+
+def test_lazy_roles_are_imported_on_first_resolution(role_pack: str) -> None:
+    roles = Roles()
+    roles.register_lazy(
+        RoleSpec("compliance", f"{role_pack}:COMPLIANCE", "Checks compliance")
+    )
+    roles.register_lazy(RoleSpec("auditor", f"{role_pack}:build_auditor"))
+
+    assert "compliance" in roles
+    assert "auditor" in roles.names
+    assert roles.describe("compliance") == "Checks compliance"
+    assert role_pack not in sys.modules
+
+    orchestrator = DebateOrchestrator(roles)
+    assert role_pack not in sys.modules
+
+    outcome = orchestrator.run(
+        ["compliance", "auditor"], "Review", settings=DebateSettings(rounds=1)
+    )
+    assert role_pack in sys.modules
+    contents = [message.content for message in outcome.transcript.messages[1:]]
+    assert contents == ["compliance-1", "audited"]
+    assert not roles.is_loaded("compliance")
+    assert roles["auditor"].name == "auditor"
+    assert roles.is_loaded("auditor")
+
+
+def test_roles_discovered_from_entry_points_and_config(
+    role_pack: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    advertised = [SimpleNamespace(name="compliance", value=f"{role_pack}:COMPLIANCE")]
+    monkeypatch.setattr(
+        loader,
+        "entry_points",
+        lambda group: advertised if group == loader.ROLE_ENTRY_POINT_GROUP else [],
+    )
+    config = tmp_path / "roles.json"
+    config.write_text(
+        json.dumps(
+            {
+                "roles": [
+                    {
+                        "name": "auditor",
+                        "target": f"{role_pack}:build_auditor",
+                        "metadata": {"team": "ops"},
+                    }
+                ]
+            }
+        )
+    )
+
+    roles = Roles()
+    assert roles.load_entry_points() == ["compliance"]
+    assert roles.load_config(config) == ["auditor"]
+    assert role_pack not in sys.modules
+
+    assert roles.get("auditor").metadata == {"team": "ops"}
+    assert {"analyst", "compliance", "auditor"} <= {role.name for role in roles.list()}
+
+    roles.clear()
+    assert "compliance" not in roles
+
+
+def test_invalid_role_target_reports_helpful_error(role_pack: str) -> None:
+    roles = Roles()
+    roles.register_lazy(RoleSpec("broken", f"{role_pack}.COMPLIANCE"))
+    with pytest.raises(ValueError, match="module:attribute"):
+        roles["broken"]
+
+
+def test_resolving_a_lazy_role_keeps_registration_order(role_pack: str) -> None:
+    roles = Roles()
+    roles.register_lazy(RoleSpec("compliance", f"{role_pack}:COMPLIANCE"))
+    roles.register(Role("late", "Registered last", str))
+    before = list(roles.names)
+
+    roles["compliance"]
+
+    assert roles.is_loaded("compliance")
+    assert list(roles.names) == before
+    assert before[-2:] == ["compliance", "late"]
+    assert list(roles.copy()) == before
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from pathlib import Path
+from sys import path as sys_path
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+from naestro.routing.cache import DecisionCache
+from naestro.routing.model_registry import ModelInfo, ModelRegistry
+from naestro.routing.router import ModelRouter
+
+
+def _models() -> list[ModelInfo]:
+    return [
+        ModelInfo("small", "demo", frozenset({"chat"}), 0.7, 0.2, 0.1),
+        ModelInfo("coder", "demo", frozenset({"chat", "code"}), 0.85, 0.3, 0.25),
+    ]
+
+
+def test_equivalent_specs_share_a_cache_entry() -> None:
+    router = ModelRouter(_models())
+
+    first = router.select_model({"task": "chat", "required_capabilities": ["chat"]})
+    second = router.select_model(
+        {"task": "other", "required_capabilities": frozenset({"chat"})}
+    )
+    third = router.select_model(
+        {
+            "task": "chat",
+            "required_capabilities": {"chat"},
+            "weights": {"quality": 0.6},
+        }
+    )
+
+    assert first is second is third
+    stats = router.cache_stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+    assert stats.hit_rate == 2 / 3
+    assert stats.mean_lookup_seconds >= 0.0
+
+
+def test_registry_changes_invalidate_cached_decisions() -> None:
+    registry = ModelRegistry(_models())
+    router = ModelRouter(registry)
+    spec = {"task": "code", "required_capabilities": ["code"]}
+
+    assert [model.name for model in router.rank_models(spec)] == ["coder"]
+    version = registry.version
+
+    registry.register(
+        ModelInfo("coder-pro", "demo", frozenset({"code"}), 0.95, 0.3, 0.25)
+    )
+    assert registry.version != version
+    assert router.select_model(spec).name == "coder-pro"
+    assert [model.name for model in router.rank_models(spec)] == [
+        "coder-pro",
+        "coder",
+    ]
+
+    registry.unregister("coder-pro")
+    assert router.select_model(spec).name == "coder"
+    assert router.cache_stats().hits == 0
+
+
+def test_fresh_registries_never_reuse_versions() -> None:
+    assert ModelRegistry().version != ModelRegistry().version
+
+
+def test_decision_cache_evicts_least_recently_used() -> None:
+    cache: DecisionCache[int] = DecisionCache(maxsize=2)
+    cache.store("a", 1)
+    cache.store("b", 2)
+    assert cache.lookup("a") == (True, 1)
+    cache.store("c", 3)
+
+    assert cache.lookup("b") == (False, None)
+    assert cache.lookup("c") == (True, 3)
+    stats = cache.stats()
+    assert (stats.size, stats.evictions) == (2, 1)
+
+
+def test_cache_can_be_disabled() -> None:
+    router = ModelRouter(_models(), cache_size=0)
+    spec = {"task": "chat", "required_capabilities": ["chat"]}
+    router.select_model(spec)
+    router.select_model(spec)
+    assert router.cache_stats().hits == 0
+    assert len(router.cache) == 0
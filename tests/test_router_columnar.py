@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from pathlib import Path
+import random
+from sys import path as sys_path
+
+import pytest
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+from naestro.routing.model_registry import ModelInfo, ModelRegistry
+from naestro.routing.router import ModelRouter
+
+CAPABILITIES = [f"cap{index}" for index in range(70)]
+
+
+def _registry(seed: int, size: int = 300) -> ModelRegistry:
+    rng = random.Random(seed)
+    models = []
+    for index in range(size):
+        capabilities = frozenset(rng.sample(CAPABILITIES, rng.randint(1, 8)))
+        models.append(
+            ModelInfo(
+                name=f"model-{index}",
+                provider=rng.choice(["a", "b"]),
+                capabilities=capabilities | {"chat"},
+                quality=round(rng.uniform(0.5, 1.0), 2),
+                latency=round(rng.uniform(0.05, 0.6), 2),
+                cost=round(rng.uniform(0.05, 0.4), 2),
+            )
+        )
+    return ModelRegistry(models)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_vectorized_ranking_matches_scalar_path(seed: int) -> None:
+    registry = _registry(seed)
+    vectorized = ModelRouter(registry, vectorize=True)
+    scalar = ModelRouter(registry, vectorize=False)
+    rng = random.Random(seed + 100)
+
+    specs = [
+        {"task": "chat", "required_capabilities": ["chat"]},
+        {"task": "rare", "required_capabilities": {"cap65", "chat"}},
+        {
+            "task": "constrained",
+            "required_capabilities": frozenset({rng.choice(CAPABILITIES)}),
+            "weights": {"quality": 0.3, "latency": 0.5, "cost": 0.2},
+            "exclude": ["model-1", "model-2"],
+            "min_quality": 0.6,
+            "max_latency": 0.5,
+            "max_cost": 0.3,
+        },
+        {"task": "unknown", "required_capabilities": ["vision"]},
+    ]
+    for spec in specs:
+        expected = scalar.rank_models(spec)
+        assert vectorized.rank_models(spec) == expected
+        assert vectorized.rank_models(spec, limit=5) == expected[:5]
+        if expected:
+            assert vectorized.select_model(spec) == expected[0]
+        else:
+            with pytest.raises(ValueError):
+                vectorized.select_model(spec)
+
+
+def test_top_k_resolves_ties_by_registration_order() -> None:
+    models = [
+        ModelInfo(f"tie-{index}", "demo", frozenset({"chat"}), 0.8, 0.2, 0.1)
+        for index in range(10)
+    ]
+    router = ModelRouter(models, vectorize=True)
+    spec = {"task": "chat", "required_capabilities": ["chat"]}
+
+    assert [model.name for model in router.rank_models(spec, limit=3)] == [
+        "tie-0",
+        "tie-1",
+        "tie-2",
+    ]
+    assert router.select_model(spec).name == "tie-0"
+
+
+def test_columnar_view_refreshes_after_registry_changes() -> None:
+    registry = _registry(5, size=40)
+    router = ModelRouter(registry)
+    spec = {"task": "chat", "required_capabilities": ["chat"]}
+    best = router.select_model(spec)
+
+    registry.register(
+        ModelInfo("champion", "demo", frozenset({"chat"}), 5.0, 0.0, 0.0)
+    )
+    assert router.select_model(spec).name == "champion"
+
+    registry.unregister("champion")
+    assert router.select_model(spec) == best
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from pathlib import Path
+from sys import path as sys_path
+
+import pytest
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+from naestro.routing.feedback import FeedbackTracker
+from naestro.routing.model_registry import ModelInfo
+from naestro.routing.router import ModelRouter
+
+SPEC = {"task": "chat", "required_capabilities": ["chat"]}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _models() -> list[ModelInfo]:
+    return [
+        ModelInfo("primary", "demo", frozenset({"chat"}), 0.9, 0.2, 0.1),
+        ModelInfo("backup", "demo", frozenset({"chat"}), 0.85, 0.25, 0.1),
+    ]
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_traffic_drains_from_slow_endpoint(vectorize: bool) -> None:
+    if vectorize:
+        pytest.importorskip("numpy")
+    router = ModelRouter(
+        _models(), vectorize=vectorize, feedback=FeedbackTracker(decay=0.5)
+    )
+    assert router.select_model(SPEC).name == "primary"
+
+    for _ in range(4):
+        router.report("primary", latency=0.9)
+    assert router.select_model(SPEC).name == "backup"
+    assert [model.name for model in router.rank_models(SPEC)] == [
+        "backup",
+        "primary",
+    ]
+    assert router.rank_models({**SPEC, "max_latency": 0.5})[0].name == "backup"
+
+    for _ in range(8):
+        router.report("primary", latency=0.2)
+    assert router.select_model(SPEC).name == "primary"
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_failing_endpoint_is_ejected_then_readmitted(vectorize: bool) -> None:
+    if vectorize:
+        pytest.importorskip("numpy")
+    clock = FakeClock()
+    tracker = FeedbackTracker(
+        max_consecutive_errors=3, ejection_seconds=10.0, clock=clock
+    )
+    router = ModelRouter(_models(), vectorize=vectorize, feedback=tracker)
+
+    for _ in range(3):
+        router.report("primary", error=True)
+    assert tracker.is_ejected("primary")
+    assert router.select_model(SPEC).name == "backup"
+
+    # Panic mode: an ejected endpoint still serves when nothing else qualifies.
+    assert router.select_model({**SPEC, "exclude": ["backup"]}).name == "primary"
+
+    clock.now = 11.0
+    assert not tracker.is_ejected("primary")
+    assert router.select_model(SPEC).name == "primary"
+    health = tracker.health("primary")
+    assert health is not None and health.consecutive_errors == 0
+
+
+def test_small_drift_does_not_invalidate_cached_decisions() -> None:
+    tracker = FeedbackTracker(decay=0.1, tolerance=0.05)
+    router = ModelRouter(_models(), feedback=tracker)
+    router.report("primary", latency=0.2)
+    version = tracker.version
+    router.select_model(SPEC)
+
+    router.report("primary", latency=0.21)
+    assert tracker.version == version
+    router.select_model(SPEC)
+    assert router.cache_stats().hits == 1
+
+
+def test_error_rate_threshold_ejects_flaky_endpoint() -> None:
+    tracker = FeedbackTracker(
+        decay=0.5, error_rate_threshold=0.5, min_samples=4, max_consecutive_errors=99
+    )
+    for error in (True, False, True, True):
+        tracker.report("primary", error=error)
+    assert tracker.is_ejected("primary")
+
+    tracker.reset("primary")
+    assert not tracker.is_ejected("primary")
+    assert tracker.health("primary") is None
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from random import Random
+from sys import path as sys_path
+from typing import Callable
+
+import pytest
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+from naestro.routing.hedging import HedgedExecutor, HedgingError
+from naestro.routing.model_registry import ModelInfo
+from naestro.routing.router import RoutePolicy
+
+SPEC = {"task": "chat", "required_capabilities": ["chat"]}
+
+
+class FakeEndpoint:
+    """Model endpoint whose latency is drawn from a configurable distribution."""
+
+    def __init__(
+        self,
+        latency: Callable[[Random], float],
+        *,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rng = Random(seed)
+        self.calls = 0
+        self.completed = 0
+        self.cancelled = 0
+
+    async def __call__(self, model: ModelInfo) -> str:
+        self.calls += 1
+        delay = self.latency(self.rng)
+        failing = self.rng.random() < self.error_rate
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if failing:
+            raise ConnectionError(f"{model.name} unavailable")
+        self.completed += 1
+        return model.name
+
+
+def constant(seconds: float) -> Callable[[Random], float]:
+    return lambda rng: seconds
+
+
+def long_tail(
+    fast: float, slow: float, slow_fraction: float
+) -> Callable[[Random], float]:
+    return lambda rng: slow if rng.random() < slow_fraction else fast
+
+
+class Fleet:
+    def __init__(self, **endpoints: FakeEndpoint) -> None:
+        self.endpoints = endpoints
+
+    async def __call__(self, model: ModelInfo) -> str:
+        return await self.endpoints[model.name](model)
+
+
+def _policy() -> RoutePolicy:
+    chat = frozenset({"chat"})
+    return RoutePolicy(
+        [
+            ModelInfo("primary", "demo", chat, 0.9, 0.01, 0.1),
+            ModelInfo("secondary", "demo", chat, 0.85, 0.01, 0.1),
+            ModelInfo("tertiary", "demo", chat, 0.8, 0.01, 0.1),
+        ],
+        vectorize=False,
+    )
+
+
+def test_fast_primary_is_not_hedged() -> None:
+    fleet = Fleet(
+        primary=FakeEndpoint(constant(0.001)),
+        secondary=FakeEndpoint(constant(0.001)),
+    )
+    executor = HedgedExecutor(_policy())
+
+    result = asyncio.run(executor.execute(SPEC, fleet))
+
+    assert result.value == "primary"
+    assert result.attempts == ("primary",)
+    assert not result.hedged
+    assert fleet.endpoints["secondary"].calls == 0
+    assert executor.latencies.count("primary") == 1
+
+
+def test_slow_primary_is_hedged_and_cancelled() -> None:
+    fleet = Fleet(
+        primary=FakeEndpoint(constant(5.0)),
+        secondary=FakeEndpoint(constant(0.001)),
+    )
+    policy = _policy()
+    executor = HedgedExecutor(policy)
+
+    result = asyncio.run(executor.execute(SPEC, fleet))
+
+    assert result.value == "secondary"
+    assert result.attempts == ("primary", "secondary")
+    assert result.hedged
+    assert fleet.endpoints["primary"].cancelled == 1
+    assert policy.router.inflight.get("primary") == 0
+    health = policy.router.feedback.health("secondary")
+    assert health is not None and health.samples == 1
+
+
+def test_errors_fall_through_the_ranked_list() -> None:
+    fleet = Fleet(
+        primary=FakeEndpoint(constant(0.001), error_rate=1.0),
+        secondary=FakeEndpoint(constant(0.001), error_rate=1.0),
+        tertiary=FakeEndpoint(constant(0.001)),
+    )
+    executor = HedgedExecutor(_policy(), fallback_multiplier=1_000.0)
+
+    result = asyncio.run(executor.execute(SPEC, fleet))
+
+    assert result.value == "tertiary"
+    assert result.attempts == ("primary", "secondary", "tertiary")
+    assert not result.hedged
+
+
+def test_all_failures_raise_with_collected_errors() -> None:
+    failing = {
+        name: FakeEndpoint(constant(0.001), error_rate=1.0)
+        for name in ("primary", "secondary", "tertiary")
+    }
+    executor = HedgedExecutor(_policy(), max_attempts=2)
+
+    with pytest.raises(HedgingError) as excinfo:
+        asyncio.run(executor.execute(SPEC, Fleet(**failing)))
+
+    assert set(excinfo.value.errors) == {"primary", "secondary"}
+    assert failing["tertiary"].calls == 0
+
+
+def test_hedge_delay_tracks_observed_percentile() -> None:
+    fleet = Fleet(
+        primary=FakeEndpoint(long_tail(0.001, 0.5, 0.1), seed=3),
+        secondary=FakeEndpoint(constant(0.001)),
+    )
+    executor = HedgedExecutor(_policy(), percentile=0.5, min_samples=5)
+    model = _policy().router.rank_models(SPEC)[0]
+    assert executor.hedge_delay(model) == pytest.approx(0.02)
+
+    async def run() -> list[bool]:
+        return [(await executor.execute(SPEC, fleet)).hedged for _ in range(30)]
+
+    hedged = asyncio.run(run())
+    assert executor.hedge_delay(model) < 0.01
+    # Tail requests on the primary get rescued by the secondary.
+    assert any(hedged)
+    assert fleet.endpoints["primary"].completed >= 20
+
+
+def test_unsatisfiable_spec_raises_value_error() -> None:
+    executor = HedgedExecutor(_policy())
+    with pytest.raises(ValueError, match="No model satisfies"):
+        asyncio.run(
+            executor.execute(
+                {"task": "code", "required_capabilities": ["code"]},
+                Fleet(),
+            )
+        )
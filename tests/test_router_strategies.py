@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import replace
+from pathlib import Path
+from random import Random
+from sys import path as sys_path
+
+import pytest
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+from naestro.routing.model_registry import ModelInfo
+from naestro.routing.router import ModelRouter
+from naestro.routing.strategies import (
+    ConsistentHashStrategy,
+    InflightTracker,
+    PowerOfTwoChoices,
+    SoftmaxStrategy,
+)
+
+SPEC = {"task": "chat", "required_capabilities": ["chat"]}
+
+
+def _models(count: int = 4) -> list[ModelInfo]:
+    chat = frozenset({"chat"})
+    return [
+        ModelInfo(f"m{index}", "demo", chat, 0.9 - 0.01 * index, 0.1, 0.1)
+        for index in range(count)
+    ]
+
+
+def test_default_strategy_stays_greedy() -> None:
+    router = ModelRouter(_models(), vectorize=False)
+    assert {router.select_model(SPEC).name for _ in range(20)} == {"m0"}
+
+
+def test_softmax_spreads_load_across_near_equal_models() -> None:
+    router = ModelRouter(
+        _models(),
+        vectorize=False,
+        strategies={"softmax": SoftmaxStrategy(0.01, rng=Random(7))},
+    )
+    counts = Counter(
+        router.select_model({**SPEC, "strategy": "softmax"}).name for _ in range(2000)
+    )
+    assert set(counts) == {"m0", "m1", "m2", "m3"}
+    assert counts["m0"] > counts["m1"] > counts["m2"] > counts["m3"]
+
+    cold = Counter(
+        router.select_model({**SPEC, "strategy": "softmax", "temperature": 1e-4}).name
+        for _ in range(200)
+    )
+    assert cold == Counter({"m0": 200})
+
+
+@pytest.mark.parametrize("temperature", [0, -0.5])
+def test_softmax_rejects_non_positive_spec_temperature(temperature: float) -> None:
+    strategy = SoftmaxStrategy(0.01, rng=Random(0))
+    candidates = [(model, model.quality) for model in _models()]
+
+    with pytest.raises(ValueError, match="temperature must be positive"):
+        strategy.choose(candidates, {**SPEC, "temperature": temperature})
+
+
+def test_power_of_two_choices_prefers_less_loaded_model() -> None:
+    inflight = InflightTracker()
+    strategy = PowerOfTwoChoices(inflight, top_k=2, rng=Random(0))
+    router = ModelRouter(
+        _models(), vectorize=False, strategies={"p2c": strategy}, inflight=inflight
+    )
+    spec = {**SPEC, "strategy": "p2c"}
+
+    assert router.select_model(spec).name == "m0"
+    for _ in range(3):
+        router.inflight.acquire("m0")
+    assert router.select_model(spec).name == "m1"
+
+    with router.inflight.track("m1"):
+        assert router.inflight.get("m1") == 1
+    for _ in range(3):
+        router.inflight.release("m0")
+    assert router.inflight.get("m0") == 0
+    assert router.select_model(spec).name == "m0"
+
+
+def test_consistent_hash_keeps_affinity_and_remaps_minimally() -> None:
+    models = _models(5)
+    strategy = ConsistentHashStrategy()
+    full = [(model, model.quality) for model in models]
+    keys = [f"tenant-{index}" for index in range(500)]
+
+    before = {key: strategy.choose(full, {"affinity_key": key}).name for key in keys}
+    assert before == {
+        key: strategy.choose(full[::-1], {"affinity_key": key}).name for key in keys
+    }
+    assert len(set(before.values())) == 5
+
+    after = {
+        key: strategy.choose(full[:-1], {"affinity_key": key}).name for key in keys
+    }
+    moved = [key for key in keys if before[key] != after[key]]
+    assert all(before[key] == "m4" for key in moved)
+    assert strategy.choose(full, {}).name == "m0"
+
+
+def test_consistent_hash_serves_the_current_model_objects() -> None:
+    strategy = ConsistentHashStrategy()
+    models = _models(3)
+    spec = {"affinity_key": "tenant-7"}
+    chosen = strategy.choose([(model, 1.0) for model in models], spec)
+
+    updated = [replace(model, latency=9.0) for model in models]
+    again = strategy.choose([(model, 1.0) for model in updated], spec)
+
+    assert again.name == chosen.name
+    assert again.latency == 9.0
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_strategies_respect_constraints(vectorize: bool) -> None:
+    if vectorize:
+        pytest.importorskip("numpy")
+    router = ModelRouter(_models(), vectorize=vectorize)
+    spec = {**SPEC, "strategy": "consistent_hash", "exclude": ["m0", "m1", "m2"]}
+    for key in ("a", "b", "c"):
+        assert router.select_model({**spec, "affinity_key": key}).name == "m3"
+
+
+def test_unknown_strategy_is_rejected() -> None:
+    router = ModelRouter(_models(), vectorize=False)
+    with pytest.raises(ValueError, match="Unknown selection strategy"):
+        router.select_model({**SPEC, "strategy": "round-robin"})
+    with pytest.raises(ValueError, match="Unknown selection strategy"):
+        ModelRouter(_models(), default_strategy="round-robin")
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+from sys import path as sys_path
+
+import pytest
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+from naestro.routing.feedback import FeedbackTracker
+from naestro.routing.model_registry import ModelInfo
+from naestro.routing.router import ModelRouter
+
+CHAT = frozenset({"chat"})
+SPEC = {"task": "chat", "required_capabilities": ["chat"]}
+
+
+def _models() -> list[ModelInfo]:
+    return [
+        # Fast to first token but slow, pricey decoding.
+        ModelInfo(
+            "slow-decoder",
+            "demo",
+            CHAT,
+            0.9,
+            0.1,
+            0.1,
+            context_window=8_000,
+            prefill_latency_per_token=1e-5,
+            decode_latency_per_token=1e-3,
+            decode_cost_per_token=1e-4,
+        ),
+        ModelInfo(
+            "fast-decoder",
+            "demo",
+            CHAT,
+            0.85,
+            0.3,
+            0.1,
+            context_window=128_000,
+            prefill_latency_per_token=2e-5,
+            decode_latency_per_token=1e-4,
+            decode_cost_per_token=2e-5,
+        ),
+    ]
+
+
+def test_estimate_combines_fixed_and_per_token_terms() -> None:
+    model = _models()[0]
+    latency, cost = model.estimate(1_000, 500)
+    assert latency == pytest.approx(0.1 + 1e-5 * 1_000 + 1e-3 * 500)
+    assert cost == pytest.approx(0.1 + 1e-4 * 500)
+    assert model.for_request(0, 0) is model
+    assert model.fits(7_000, 1_000) and not model.fits(7_000, 1_001)
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_long_outputs_avoid_slow_decoders(vectorize: bool) -> None:
+    if vectorize:
+        pytest.importorskip("numpy")
+    router = ModelRouter(_models(), vectorize=vectorize)
+
+    assert router.select_model(SPEC).name == "slow-decoder"
+    short = {**SPEC, "prompt_tokens": 200, "expected_response_tokens": 20}
+    assert router.select_model(short).name == "slow-decoder"
+
+    long = {**SPEC, "prompt_tokens": 200, "expected_response_tokens": 2_000}
+    assert router.select_model(long).name == "fast-decoder"
+    ranked = router.score_models(long)
+    assert [model.name for model, _ in ranked] == ["fast-decoder", "slow-decoder"]
+    expected = _models()[1].for_request(200, 2_000).score(router.default_weights)
+    assert ranked[0][1] == pytest.approx(expected)
+
+    assert router.rank_models({**long, "max_latency": 1.0})[0].name == "fast-decoder"
+    assert [m.name for m in router.rank_models({**short, "max_latency": 0.2})] == [
+        "slow-decoder"
+    ]
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_context_window_filters_candidates(vectorize: bool) -> None:
+    if vectorize:
+        pytest.importorskip("numpy")
+    router = ModelRouter(_models(), vectorize=vectorize)
+
+    spec = {**SPEC, "prompt_tokens": 10_000, "expected_response_tokens": 10}
+    assert [model.name for model in router.rank_models(spec)] == ["fast-decoder"]
+
+    with pytest.raises(ValueError, match="No model satisfies"):
+        router.select_model({**spec, "prompt_tokens": 200_000})
+
+
+def test_token_counts_are_validated() -> None:
+    router = ModelRouter(_models(), vectorize=False)
+    with pytest.raises(TypeError, match="token counts"):
+        router.select_model({**SPEC, "expected_response_tokens": -1})
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_observed_latency_is_not_topped_up_with_token_time(vectorize: bool) -> None:
+    if vectorize:
+        pytest.importorskip("numpy")
+    router = ModelRouter(
+        _models(), vectorize=vectorize, feedback=FeedbackTracker(decay=1.0)
+    )
+    long = {**SPEC, "prompt_tokens": 200, "expected_response_tokens": 2_000}
+
+    # End-to-end observations already include decoding time.
+    router.report("slow-decoder", latency=0.5)
+    capped = router.rank_models({**long, "max_latency": 0.6})
+    assert "slow-decoder" in {model.name for model in capped}
+
+    ranked = {model.name: score for model, score in router.score_models(long)}
+    slow, fast = _models()
+    observed = replace(slow, latency=0.5, prefill_latency_per_token=0.0)
+    observed = replace(observed, decode_latency_per_token=0.0)
+    expected = observed.for_request(200, 2_000).score(router.default_weights)
+    assert ranked[slow.name] == pytest.approx(expected)
+    expected = fast.for_request(200, 2_000).score(router.default_weights)
+    assert ranked[fast.name] == pytest.approx(expected)
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import sys
+from sys import path as sys_path
+from threading import Event, Thread
+
+import pytest
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+from naestro.routing.loader import load_models, load_registry, RegistryWatcher
+from naestro.routing.model_registry import ModelInfo, ModelRegistry
+from naestro.routing.router import ModelRouter, RoutePolicy
+
+ROOT = Path(__file__).resolve().parents[1]
+SPEC = {"task": "chat", "required_capabilities": ["chat"]}
+
+
+def _write(path: Path, models: list[dict[str, object]], *, bump: int = 0) -> None:
+    path.write_text(json.dumps({"models": models}))
+    # Guarantee a new mtime even on coarse-grained filesystems.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump * 1_000_000_000))
+
+
+def _model(name: str, quality: float, **extra: object) -> dict[str, object]:
+    return {
+        "name": name,
+        "provider": "demo",
+        "capabilities": ["chat"],
+        "quality": quality,
+        "latency": 0.2,
+        "cost": 0.1,
+        **extra,
+    }
+
+
+def test_shipped_configs_load_into_matching_registries() -> None:
+    from_json = load_models(ROOT / "configs" / "routing.json")
+    from_yaml = load_models(ROOT / "configs" / "router_profiles.yaml")
+    assert from_json == from_yaml
+
+    registry = load_registry(ROOT / "configs" / "routing.json")
+    assert [model.name for model in registry.candidates({"analysis", "math"})] == [
+        "foundational-pro"
+    ]
+
+
+def test_load_registry_reads_token_fields_and_overrides(tmp_path: Path) -> None:
+    base = tmp_path / "base.json"
+    override = tmp_path / "override.json"
+    _write(base, [_model("a", 0.7), _model("b", 0.8)])
+    _write(
+        override,
+        [_model("a", 0.9, context_window=4096, decode_latency_per_token=0.001)],
+    )
+
+    registry = load_registry(base, override)
+
+    assert [model.name for model in registry] == ["a", "b"]
+    model = registry.get("a")
+    assert model.quality == 0.9
+    assert model.context_window == 4096
+    assert model.decode_latency_per_token == 0.001
+
+
+def test_invalid_entries_are_reported(tmp_path: Path) -> None:
+    config = tmp_path / "routing.json"
+    config.write_text(json.dumps({"models": [{"name": "a", "provider": "demo"}]}))
+    with pytest.raises(ValueError, match="missing quality, latency, cost"):
+        load_models(config)
+
+
+def test_watcher_swaps_registry_and_keeps_last_good(tmp_path: Path) -> None:
+    config = tmp_path / "routing.json"
+    _write(config, [_model("a", 0.9), _model("b", 0.8)])
+    router = ModelRouter([])
+    policy = RoutePolicy([])
+    reloads: list[int] = []
+    watcher = RegistryWatcher(
+        [config], [router, policy], on_reload=lambda reg: reloads.append(len(reg))
+    )
+
+    assert watcher.check()
+    assert router.registry is policy.router.registry
+    assert router.select_model(SPEC).name == "a"
+    assert not watcher.check()
+
+    _write(config, [_model("a", 0.7), _model("b", 0.8)], bump=1)
+    assert watcher.check()
+    assert router.select_model(SPEC).name == "b"
+
+    config.write_text("{not json")
+    assert not watcher.check()
+    assert watcher.last_error is not None
+    assert router.select_model(SPEC).name == "b"
+
+    _write(config, [_model("c", 0.95)], bump=2)
+    assert watcher.check()
+    assert watcher.last_error is None
+    assert policy(SPEC).name == "c"
+    assert reloads == [2, 2, 1]
+
+
+def test_background_reload_does_not_disturb_routing(tmp_path: Path) -> None:
+    config = tmp_path / "routing.json"
+    _write(config, [_model("a", 0.9), _model("b", 0.8)])
+    router = ModelRouter([])
+    reloaded = Event()
+    watcher = RegistryWatcher(
+        [config], [router], interval=0.01, on_reload=lambda _: reloaded.set()
+    )
+    failures: list[BaseException] = []
+    stop = Event()
+
+    def route() -> None:
+        while not stop.is_set():
+            try:
+                assert router.select_model(SPEC).name in {"a", "b"}
+            except BaseException as exc:  # pragma: no cover - reported below
+                failures.append(exc)
+                return
+
+    with watcher:
+        assert reloaded.wait(1.0)
+        reloaded.clear()
+        worker = Thread(target=route)
+        worker.start()
+        _write(config, [_model("a", 0.7), _model("b", 0.8)], bump=1)
+        assert reloaded.wait(2.0)
+        stop.set()
+        worker.join()
+
+    assert not failures
+    assert router.select_model(SPEC).name == "b"
+
+
+def test_watcher_refills_registries_in_place(tmp_path: Path) -> None:
+    config = tmp_path / "routing.json"
+    _write(config, [_model("a", 0.9)])
+    registry = ModelRegistry([ModelInfo("old", "demo", frozenset(), 0.5, 0.1, 0.1)])
+    version = registry.version
+
+    assert RegistryWatcher([config], [registry]).check()
+
+    assert [model.name for model in registry] == ["a"]
+    assert registry.version != version
+    assert ModelRouter(registry.copy()).select_model(SPEC).name == "a"
+
+
+def test_polling_survives_errors(tmp_path: Path) -> None:
+    config = tmp_path / "routing.json"
+    _write(config, [_model("a", 0.9)])
+    errors: list[Exception] = []
+    failed = Event()
+    reloaded = Event()
+    calls = 0
+
+    def on_reload(_: ModelRegistry) -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("listener failed")
+        if calls == 3:
+            reloaded.set()
+
+    def on_error(exc: Exception) -> None:
+        errors.append(exc)
+        failed.set()
+        raise RuntimeError("error listener failed")
+
+    router = ModelRouter([])
+    watcher = RegistryWatcher(
+        [config], [router], interval=0.01, on_reload=on_reload, on_error=on_error
+    )
+    with watcher:
+        _write(config, [_model("b", 0.9)], bump=1)
+        assert failed.wait(2.0)
+        _write(config, [_model("c", 0.9)], bump=2)
+        assert reloaded.wait(2.0)
+
+    assert [str(exc) for exc in errors] == ["listener failed"]
+    assert router.select_model(SPEC).name == "c"
+
+
+def test_queries_never_see_a_half_replaced_registry() -> None:
+    def generation(tag: str) -> list[ModelInfo]:
+        return [
+            ModelInfo(f"{tag}-{i}", "demo", frozenset({"chat", tag}), 0.5, 0.1, 0.1)
+            for i in range(20)
+        ]
+
+    generations = [generation("old"), generation("new")]
+    registry = ModelRegistry(generations[0])
+    failures: list[BaseException] = []
+    stop = Event()
+
+    def query() -> None:
+        while not stop.is_set():
+            try:
+                for required in ({"chat"}, {"chat", "old"}, {"chat", "new"}):
+                    found = registry.candidates(required)
+                    assert len({model.name.split("-")[0] for model in found}) <= 1
+            except BaseException as exc:  # pragma: no cover - reported below
+                failures.append(exc)
+                return
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    readers = [Thread(target=query) for _ in range(2)]
+    try:
+        for reader in readers:
+            reader.start()
+        for round_ in range(500):
+            registry.replace_all(generations[round_ % 2])
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+        sys.setswitchinterval(switch_interval)
+
+    assert not failures
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from sys import path as sys_path
+
+import pytest
+
+if __package__ in {None, ""}:
+    sys_path.append(str(Path(__file__).resolve().parents[1]))
+
+from naestro.routing.model_registry import ModelInfo
+from naestro.routing.router import ModelRouter, RoutePolicy
+from naestro.routing.simulation import (
+    Arrival,
+    compare,
+    Endpoint,
+    load_trace,
+    percentile,
+    simulate,
+    synthetic_arrivals,
+)
+
+SPEC = {"task": "chat", "required_capabilities": ["chat"]}
+
+
+def _constant(rng: object, mean: float) -> float:
+    return mean
+
+
+def _models() -> list[ModelInfo]:
+    chat = frozenset({"chat"})
+    return [
+        ModelInfo("a", "demo", chat, 0.9, 1.0, 0.15),
+        ModelInfo("b", "demo", chat, 0.88, 1.0, 0.1),
+    ]
+
+
+def test_queueing_latency_is_modelled() -> None:
+    arrivals = [Arrival(0.0, SPEC), Arrival(0.0, SPEC), Arrival(0.5, SPEC)]
+    report = simulate(
+        ModelRouter(_models(), vectorize=False),
+        arrivals,
+        default_endpoint=Endpoint(capacity=1, service_time=_constant),
+    )
+
+    # All three land on "a": waits of 0, 1 and 1.5 seconds plus 1s service.
+    assert report.completed == 3
+    assert report.p50 == pytest.approx(2.0)
+    assert report.p99 == pytest.approx(2.5)
+    assert report.mean_latency == pytest.approx(5.5 / 3)
+    assert report.total_cost == pytest.approx(0.45)
+    assert report.assignments == {"a": 3}
+
+
+def test_queue_limit_and_unroutable_specs_are_rejected() -> None:
+    arrivals = [
+        Arrival(0.0, SPEC),
+        Arrival(0.1, SPEC),
+        Arrival(0.2, SPEC),
+        Arrival(0.3, {"task": "code", "required_capabilities": ["code"]}),
+    ]
+    router = ModelRouter(_models(), vectorize=False)
+    report = simulate(
+        router,
+        arrivals,
+        endpoints={"a": Endpoint(capacity=1, queue_limit=1, service_time=_constant)},
+    )
+
+    assert report.requests == 4
+    assert report.rejected == 2
+    assert report.rejection_rate == pytest.approx(0.5)
+    assert report.completed == 2
+    assert router.inflight.get("a") == 0
+
+
+def test_strategies_are_compared_on_the_same_stream() -> None:
+    arrivals = synthetic_arrivals([SPEC], rate=1.6, count=400, seed=1)
+    endpoint = Endpoint(capacity=1)
+
+    reports = compare(
+        {
+            "greedy": lambda: RoutePolicy(_models(), vectorize=False),
+            "cheap": lambda: ModelRouter(
+                _models(),
+                default_weights={"quality": 0.5, "cost": 0.5},
+                vectorize=False,
+            ),
+        },
+        arrivals,
+        default_endpoint=endpoint,
+        seed=3,
+    )
+    p2c = simulate(
+        ModelRouter(_models(), vectorize=False),
+        arrivals,
+        default_endpoint=endpoint,
+        spec_overrides={"strategy": "p2c"},
+        seed=3,
+    )
+
+    assert reports["greedy"].assignments == {"a": 400}
+    assert reports["cheap"].assignments == {"b": 400}
+    assert reports["cheap"].mean_cost < reports["greedy"].mean_cost
+    assert p2c.max_share < 0.8
+    assert p2c.p99 < reports["greedy"].p99
+    again = simulate(
+        ModelRouter(_models(), vectorize=False),
+        arrivals,
+        default_endpoint=endpoint,
+        spec_overrides={"strategy": "p2c"},
+        seed=3,
+    )
+    assert again == p2c
+
+
+def test_token_counts_drive_service_time_and_cost() -> None:
+    model = ModelInfo(
+        "a", "demo", frozenset({"chat"}), 0.9, 0.1, 0.0, decode_cost_per_token=0.01
+    )
+    spec = {**SPEC, "expected_response_tokens": 100}
+    report = simulate(
+        ModelRouter([model], vectorize=False),
+        [Arrival(0.0, spec)],
+        default_endpoint=Endpoint(service_time=_constant),
+    )
+    assert report.total_cost == pytest.approx(1.0)
+
+
+def test_load_trace_sorts_records(tmp_path: Path) -> None:
+    trace = tmp_path / "trace.jsonl"
+    trace.write_text(
+        "\n".join(
+            json.dumps(record)
+            for record in ({"time": 2.0, "spec": SPEC}, {"time": 1.0, "spec": SPEC})
+        )
+    )
+    assert [arrival.time for arrival in load_trace(trace)] == [1.0, 2.0]
+    assert percentile([], 0.5) == 0.0